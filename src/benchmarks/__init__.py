@@ -0,0 +1,2 @@
+# src/benchmarks/__init__.py
+"""오프라인 성능 측정 도구 (합성 카탈로그, yamyam-ops 대역 서버)"""
@@ -0,0 +1,737 @@
+# src/benchmarks/fake_ops_server.py
+"""
+yamyam-ops API 로컬 대역 서버 (지연/오류 주입)
+
+YamYamOpsClient와 각 페이지가 사용하는 엔드포인트를 합성 카탈로그로 흉내 내어
+네트워크 없이 부하 테스트와 벤치마크를 반복 가능한 조건으로 실행합니다.
+표준 라이브러리 HTTP 서버만 사용하므로 추가 의존성이 없습니다.
+
+실행:
+    cd src && python -m benchmarks.fake_ops_server --diners 50000 --latency-ms 30
+"""
+
+import argparse
+import json
+import logging
+import random
+import re
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Optional
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic_catalog import build_synthetic_catalog, format_timestamp
+from utils.distance import haversine_np
+
+logger = logging.getLogger(__name__)
+
+# 유사 식당(redis) 응답의 식당 수
+SIMILAR_DINER_COUNT = 20
+# 개인화 추천(/rec/personal)에서 학습 데이터에 없는(cold-start) 것으로 취급할 비율
+COLD_START_RATE = 0.1
+
+# yamyam-ops 정렬 기준 → 정렬 컬럼 (내림차순)
+SORT_COLUMNS = {
+    "popularity": "bayesian_score",
+    "hidden_gem": "hidden_score",
+    "rating": "diner_review_avg",
+    "review_count": "diner_review_cnt",
+}
+
+# 상세 조회 응답에서 쉼표로 이어 붙인 문자열로 내려주는 리스트 필드
+# (SimilarRestaurantFinder._convert_api_response_to_dict가 split(",")으로 파싱)
+DETAIL_JOINED_FIELDS = ["diner_menu_name", "diner_tag"]
+
+
+class FaultProfile:
+    """
+    엔드포인트별 응답 지연과 오류 주입 설정
+
+    지연은 latency_ms에 0~jitter_ms 균등 난수를 더한 값이며,
+    error_rate 확률로 error_status 응답을, timeout_rate 확률로 timeout_ms 지연을 줍니다.
+    시드가 같으면 같은 순서의 요청에 같은 지연/오류가 주입됩니다.
+    """
+
+    def __init__(
+        self,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        timeout_rate: float = 0.0,
+        timeout_ms: float = 30000.0,
+        endpoint_latency_ms: Optional[dict[str, float]] = None,
+        seed: int = 0,
+    ):
+        """
+        Args:
+            latency_ms: 기본 응답 지연 (ms)
+            jitter_ms: 추가 지연 난수 범위 (ms)
+            error_rate: 오류 응답 비율 (0~1)
+            error_status: 주입할 오류 HTTP 상태 코드
+            timeout_rate: 응답을 timeout_ms만큼 지연시킬 비율 (0~1)
+            timeout_ms: 타임아웃 유도 지연 (ms)
+            endpoint_latency_ms: {엔드포인트 패턴: 기본 지연(ms)} (latency_ms 대신 사용)
+            seed: 난수 시드
+        """
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.timeout_rate = timeout_rate
+        self.timeout_ms = timeout_ms
+        self.endpoint_latency_ms = dict(endpoint_latency_ms or {})
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def sample(self, endpoint: str) -> tuple[float, Optional[int]]:
+        """
+        요청 하나에 주입할 (지연 초, 오류 상태 코드 또는 None)
+        """
+        with self._lock:
+            jitter = self._random.uniform(0, self.jitter_ms) if self.jitter_ms else 0.0
+            roll = self._random.random()
+        delay_ms = self.endpoint_latency_ms.get(endpoint, self.latency_ms) + jitter
+        if roll < self.error_rate:
+            return delay_ms / 1000, self.error_status
+        if roll < self.error_rate + self.timeout_rate:
+            return self.timeout_ms / 1000, None
+        return delay_ms / 1000, None
+
+
+class FakeOpsCatalog:
+    """합성 카탈로그 위에서 yamyam-ops 엔드포인트 응답을 계산"""
+
+    def __init__(self, df: pd.DataFrame, seed: int = 0):
+        """
+        Args:
+            df: build_synthetic_catalog가 만든 음식점 DataFrame
+            seed: 랜덤 식당 조회(?n=)용 난수 시드
+        """
+        self._lock = threading.Lock()
+        self._rng = np.random.default_rng(seed)
+        self._load(df)
+        self._similar_cache: dict[int, list[int]] = {}
+
+    def _load(self, df: pd.DataFrame):
+        """카탈로그 교체 (조회용 배열과 JSON 직렬화용 레코드 재계산)"""
+        df = df.reset_index(drop=True)
+        self.df = df
+        self.lats = df["diner_lat"].to_numpy(dtype=np.float64)
+        self.lons = df["diner_lon"].to_numpy(dtype=np.float64)
+        self.records = json.loads(df.to_json(orient="records", force_ascii=False))
+        self.position_by_idx = {int(idx): i for i, idx in enumerate(df["diner_idx"])}
+        self.position_by_id = {str(id_): i for i, id_ in enumerate(df["id"])}
+        self.names = df["diner_name"].str.lower().to_numpy(dtype=object)
+        self.deleted: dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    # ---- 공통 ----
+
+    def _detail(self, position: int, distance: Optional[float] = None) -> dict:
+        """상세 조회 응답 레코드 (리스트 필드는 쉼표 문자열)"""
+        record = dict(self.records[position])
+        for field in DETAIL_JOINED_FIELDS:
+            if isinstance(record.get(field), list):
+                record[field] = ", ".join(record[field])
+        if distance is not None:
+            record["distance"] = round(float(distance), 3)
+        return record
+
+    def _category_mask(self, params: dict[str, Any]) -> np.ndarray:
+        mask = np.ones(len(self.df), dtype=bool)
+        for param, column in (
+            ("diner_category_large", "diner_category_large"),
+            ("diner_category_middle", "diner_category_middle"),
+        ):
+            if params.get(param):
+                mask &= (self.df[column] == params[param]).to_numpy()
+        return mask
+
+    def _distances(self, params: dict[str, Any]) -> Optional[np.ndarray]:
+        if params.get("user_lat") is None or params.get("user_lon") is None:
+            return None
+        return haversine_np(
+            float(params["user_lat"]), float(params["user_lon"]), self.lats, self.lons
+        )
+
+    # ---- /kakao/diners ----
+
+    def list_diners(self, params: dict[str, Any]) -> list[dict]:
+        """
+        GET /kakao/diners/ (limit/offset 페이지, 카테고리/평점/updated_since 필터)
+
+        user_lat/user_lon이 있으면 radius_km 반경으로 거르고 distance를 붙이며,
+        sort_by가 있으면 해당 기준으로 정렬합니다 (검색 페이지의 개인화 경로).
+        """
+        mask = self._category_mask(params)
+        if params.get("min_rating") is not None:
+            mask &= self.df["diner_review_avg"].to_numpy() >= float(
+                params["min_rating"]
+            )
+        since = params.get("updated_since")
+        if since:
+            updated = pd.to_datetime(self.df["updated_at"], utc=True)
+            mask &= (updated > pd.Timestamp(since)).to_numpy()
+        distances = self._distances(params)
+        if distances is not None and params.get("radius_km") is not None:
+            mask &= distances <= float(params["radius_km"])
+
+        positions = np.flatnonzero(mask)
+        sort_by = params.get("sort_by")
+        if sort_by == "distance" and distances is not None:
+            positions = positions[np.argsort(distances[positions], kind="stable")]
+        elif sort_by in SORT_COLUMNS:
+            keys = -self.df[SORT_COLUMNS[sort_by]].to_numpy(dtype=np.float64)
+            positions = positions[np.argsort(keys[positions], kind="stable")]
+
+        offset = int(params.get("offset", 0))
+        limit = int(params.get("limit", len(positions)))
+        positions = positions[offset : offset + limit]
+        if distances is None:
+            result = [self.records[i] for i in positions]
+        else:
+            result = [
+                dict(self.records[i], distance=round(float(distances[i]), 3))
+                for i in positions
+            ]
+
+        if since and offset == 0:
+            # 삭제된 음식점은 tombstone 레코드로 첫 페이지에 포함
+            result += [
+                {"diner_idx": idx, "is_deleted": True, "deleted_at": deleted_at}
+                for idx, deleted_at in self.deleted.items()
+                if pd.Timestamp(deleted_at) > pd.Timestamp(since)
+            ]
+        return result
+
+    def filtered(self, params: dict[str, Any]) -> list[dict]:
+        """GET /kakao/diners/filtered (반경/카테고리 필터, 거리순 id/diner_idx/distance)"""
+        distances = self._distances(params)
+        if distances is None:
+            # 월드컵 페이지의 랜덤 식당 조회 (?n=)
+            n = min(int(params.get("n", 2)), len(self))
+            with self._lock:
+                positions = self._rng.choice(len(self), n, replace=False)
+            return [self._detail(i) for i in positions]
+
+        mask = self._category_mask(params)
+        mask &= distances <= float(params.get("radius_km", 5.0))
+        positions = np.flatnonzero(mask)
+        positions = positions[np.argsort(distances[positions], kind="stable")]
+        if params.get("limit") is not None:
+            positions = positions[: int(params["limit"])]
+        return [
+            {
+                "id": self.records[i]["id"],
+                "diner_idx": self.records[i]["diner_idx"],
+                "distance": round(float(distances[i]), 3),
+            }
+            for i in positions
+        ]
+
+    def sorted(self, body: dict[str, Any]) -> list[dict]:
+        """POST /kakao/diners/sorted (diner_ids 정렬/필터/페이지네이션)"""
+        positions = np.array(
+            [
+                self.position_by_id[str(id_)]
+                for id_ in body.get("diner_ids", [])
+                if str(id_) in self.position_by_id
+            ],
+            dtype=np.int64,
+        )
+        if body.get("min_rating") is not None and len(positions):
+            ratings = self.df["diner_review_avg"].to_numpy()[positions]
+            positions = positions[ratings >= float(body["min_rating"])]
+
+        distances = self._distances(body)
+        sort_by = body.get("sort_by", "popularity")
+        if sort_by == "distance" and distances is not None:
+            keys = distances[positions]
+        elif sort_by == "personalization":
+            user = str(body.get("user_id", ""))
+            keys = -np.array(
+                [_stable_score(user, self.records[i]["diner_idx"]) for i in positions]
+            )
+        else:
+            column = SORT_COLUMNS.get(sort_by, "bayesian_score")
+            keys = -self.df[column].to_numpy(dtype=np.float64)[positions]
+        positions = positions[np.argsort(keys, kind="stable")]
+
+        offset = int(body.get("offset") or 0)
+        if body.get("limit") is not None:
+            positions = positions[offset : offset + int(body["limit"])]
+        else:
+            positions = positions[offset:]
+        return [
+            self._detail(i, None if distances is None else distances[i])
+            for i in positions
+        ]
+
+    def search(self, params: dict[str, Any]) -> Optional[list[dict]]:
+        """GET /kakao/diners/search (이름 부분 일치, 검색어 2자 미만이면 None)"""
+        query = str(params.get("query", "")).strip().lower()
+        if len(query) < 2:
+            return None
+        positions = [i for i, name in enumerate(self.names) if query in name]
+        distances = self._distances(params)
+        if distances is not None and params.get("radius_km") is not None:
+            radius = float(params["radius_km"])
+            positions = [i for i in positions if distances[i] <= radius]
+        positions = positions[: int(params.get("limit", 10))]
+        return [
+            self._detail(i, None if distances is None else distances[i])
+            for i in positions
+        ]
+
+    def categories(self, params: dict[str, Any]) -> list[dict]:
+        """GET /kakao/diners/categories ([{"name", "count"}], 음식점 수 많은 순)"""
+        if params.get("category_type") == "middle":
+            subset = self.df[
+                self.df["diner_category_large"] == params.get("large_category")
+            ]
+            counts = subset["diner_category_middle"].value_counts()
+        else:
+            counts = self.df["diner_category_large"].value_counts()
+        return [{"name": name, "count": int(count)} for name, count in counts.items()]
+
+    def detail(self, diner_idx: str) -> Optional[dict]:
+        """GET /kakao/diners/{diner_idx}"""
+        position = self.position_by_idx.get(_to_int(diner_idx))
+        return None if position is None else self._detail(position)
+
+    def batch(self, body: dict[str, Any]) -> list[dict]:
+        """POST /kakao/diners/batch"""
+        positions = (
+            self.position_by_idx.get(_to_int(idx)) for idx in body.get("diner_idxs", [])
+        )
+        return [self._detail(i) for i in positions if i is not None]
+
+    # ---- /rec, /redis ----
+
+    def personal(self, body: dict[str, Any]) -> dict[str, list]:
+        """POST /rec/personal (개인화 점수순 diner_ids/scores, cold-start 음식점 제외)"""
+        user = str(body.get("firebase_uid", ""))
+        scored = [
+            (idx, _stable_score(user, idx))
+            for idx in body.get("diner_ids", [])
+            if _stable_score("cold-start", idx) >= COLD_START_RATE
+        ]
+        scored.sort(key=lambda item: item[1], reverse=True)
+        return {
+            "diner_ids": [idx for idx, _ in scored],
+            "scores": [round(score, 4) for _, score in scored],
+        }
+
+    def similar(self, diner_idx: int) -> list[int]:
+        """같은 대분류에서 가까운 음식점 diner_idx 목록 (redis similar_diner_ids 대역)"""
+        with self._lock:
+            cached = self._similar_cache.get(diner_idx)
+        if cached is not None:
+            return cached
+        position = self.position_by_idx.get(diner_idx)
+        if position is None:
+            return []
+        large = self.records[position]["diner_category_large"]
+        candidates = np.flatnonzero(
+            (self.df["diner_category_large"] == large).to_numpy()
+        )
+        candidates = candidates[candidates != position]
+        distances = haversine_np(
+            self.lats[position],
+            self.lons[position],
+            self.lats[candidates],
+            self.lons[candidates],
+        )
+        nearest = candidates[np.argsort(distances)[:SIMILAR_DINER_COUNT]]
+        result = [self.records[i]["diner_idx"] for i in nearest]
+        with self._lock:
+            self._similar_cache[diner_idx] = result
+        return result
+
+    def redis_read(self, body: dict[str, Any]) -> dict[str, Any]:
+        """POST /redis/read ({키: 값}, diner:{idx}:similar_diner_ids 키만 지원)"""
+        values = {}
+        for key in body.get("keys", []):
+            match = re.fullmatch(r"diner:(\d+):similar_diner_ids", str(key))
+            values[key] = self.similar(int(match.group(1))) if match else None
+        return values
+
+    # ---- 데이터 변경 (증분 동기화 테스트용) ----
+
+    def touch(self, count: int = 10, delete: int = 0, seed: int = 0) -> dict[str, int]:
+        """
+        임의 음식점 count개의 평점/리뷰 수와 updated_at을 갱신하고 delete개를 삭제
+
+        Returns:
+            {"updated": 갱신 수, "deleted": 삭제 수, "rows": 남은 음식점 수}
+        """
+        rng = np.random.default_rng(seed)
+        with self._lock:
+            df = self.df.copy()
+            now = format_timestamp()
+            picks = rng.choice(len(df), min(count + delete, len(df)), replace=False)
+            updated, removed = picks[:count], picks[count:]
+            df.loc[updated, "diner_review_cnt"] += 1
+            df.loc[updated, "diner_review_avg"] = np.round(
+                rng.uniform(1.0, 5.0, len(updated)), 2
+            )
+            df.loc[updated, "updated_at"] = now
+            deleted = dict(self.deleted)
+            deleted.update({int(idx): now for idx in df.loc[removed, "diner_idx"]})
+            df = df.drop(index=removed)
+            self._load(df)
+            self.deleted = deleted
+            self._similar_cache = {}
+        return {"updated": len(updated), "deleted": len(removed), "rows": len(self)}
+
+
+def _stable_score(salt: str, diner_idx: Any) -> float:
+    """(salt, diner_idx)로 결정되는 0~1 점수 (실행마다 같은 값)"""
+    return zlib.crc32(f"{salt}:{diner_idx}".encode()) / 0xFFFFFFFF
+
+
+def _to_int(value: Any) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class _RequestStats:
+    """엔드포인트별 요청 수/주입 오류 수/처리 시간 집계"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: dict[str, dict[str, float]] = {}
+
+    def record(self, endpoint: str, status: int, elapsed: float):
+        with self._lock:
+            entry = self._stats.setdefault(
+                endpoint, {"requests": 0, "errors": 0, "seconds": 0.0}
+            )
+            entry["requests"] += 1
+            entry["errors"] += status >= 400
+            entry["seconds"] += elapsed
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        with self._lock:
+            return {endpoint: dict(entry) for endpoint, entry in self._stats.items()}
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+
+class FakeOpsServer:
+    """
+    FakeOpsCatalog를 HTTP로 제공하는 대역 서버
+
+    벤치마크 코드에서는 컨텍스트 매니저로 백그라운드 스레드에 띄워 사용합니다.
+
+        with FakeOpsServer(build_synthetic_catalog(10000)) as server:
+            client = YamYamOpsClient(server.url, token="fake")
+    """
+
+    def __init__(
+        self,
+        catalog: Any,
+        faults: Optional[FaultProfile] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        batch_supported: bool = True,
+    ):
+        """
+        Args:
+            catalog: FakeOpsCatalog 또는 음식점 DataFrame
+            faults: 지연/오류 주입 설정 (None이면 주입 없음)
+            host: 바인딩 주소
+            port: 포트 (0이면 임의의 빈 포트)
+            batch_supported: False면 POST /kakao/diners/batch, /activity-logs/bulk에
+                404 응답 (단건 폴백 측정용)
+        """
+        if isinstance(catalog, pd.DataFrame):
+            catalog = FakeOpsCatalog(catalog)
+        self.catalog = catalog
+        self.faults = faults or FaultProfile()
+        self.batch_supported = batch_supported
+        self.stats = _RequestStats()
+        self._routes = self._build_routes()
+        self._httpd = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _build_routes(self) -> list[tuple[str, re.Pattern, str, Callable]]:
+        """
+        (메서드, 경로 정규식, 엔드포인트 이름, 처리 함수) 목록
+
+        엔드포인트 이름은 경로 템플릿(/kakao/diners/{diner_idx})이며 지연 설정과 통계의 키로
+        사용합니다. 구체적인 경로가 {diner_idx}보다 먼저 오도록 순서를 유지합니다.
+        """
+        catalog = self.catalog
+
+        def batch(body, params):
+            if not self.batch_supported:
+                return 404, {"detail": "Not Found"}
+            return 200, catalog.batch(body)
+
+        def detail(body, params, diner_idx):
+            record = catalog.detail(diner_idx)
+            if record is None:
+                return 404, {"detail": "Diner not found"}
+            return 200, record
+
+        def search(body, params):
+            result = catalog.search(params)
+            if result is None:
+                return 422, {"detail": "query must be at least 2 characters"}
+            return 200, result
+
+        def activity_logs_bulk(body, params):
+            if not self.batch_supported:
+                return 404, {"detail": "Not Found"}
+            return 201, {"created": len(body.get("logs") or [])}
+
+        def touch(body, params):
+            return 200, catalog.touch(
+                int(body.get("count", 10)),
+                int(body.get("delete", 0)),
+                int(body.get("seed", 0)),
+            )
+
+        routes = [
+            ("GET", "/kakao/diners", lambda b, p: (200, catalog.list_diners(p))),
+            ("GET", "/kakao/diners/filtered", lambda b, p: (200, catalog.filtered(p))),
+            ("POST", "/kakao/diners/sorted", lambda b, p: (200, catalog.sorted(b))),
+            ("GET", "/kakao/diners/search", search),
+            (
+                "GET",
+                "/kakao/diners/categories",
+                lambda b, p: (200, catalog.categories(p)),
+            ),
+            ("POST", "/kakao/diners/batch", batch),
+            ("GET", "/kakao/diners/{diner_idx}", detail),
+            ("POST", "/rec/personal", lambda b, p: (200, catalog.personal(b))),
+            (
+                "POST",
+                "/redis/read",
+                lambda b, p: (200, {"data": catalog.redis_read(b)}),
+            ),
+            # 월드컵 페이지는 /api/v1 경로에서 최상위 {키: 값} 형식을 사용
+            ("POST", "/api/v1/redis/read", lambda b, p: (200, catalog.redis_read(b))),
+            ("POST", "/activity-logs", lambda b, p: (201, {"created": 1})),
+            ("POST", "/activity-logs/bulk", activity_logs_bulk),
+            ("GET", "/_fake/stats", lambda b, p: (200, self.stats.snapshot())),
+            ("POST", "/_fake/touch", touch),
+        ]
+        return [
+            (
+                method,
+                re.compile(re.sub(r"\{(\w+)\}", r"(?P<\1>[^/]+)", template)),
+                template,
+                handler,
+            )
+            for method, template, handler in routes
+        ]
+
+    def dispatch(
+        self, method: str, path: str, params: dict[str, Any], body: dict[str, Any]
+    ) -> tuple[str, int, Any]:
+        """
+        요청 처리 (지연/오류 주입 포함)
+
+        Returns:
+            (엔드포인트 이름, 상태 코드, 응답 JSON 객체)
+        """
+        path = path.rstrip("/") or "/"
+        for route_method, pattern, endpoint, handler in self._routes:
+            match = pattern.fullmatch(path)
+            if route_method != method or match is None:
+                continue
+            if endpoint.startswith("/_fake"):
+                return endpoint, *handler(body, params)
+
+            delay, error_status = self.faults.sample(endpoint)
+            if delay > 0:
+                time.sleep(delay)
+            if error_status is not None:
+                return endpoint, error_status, {"detail": "injected error"}
+            status, payload = handler(body, params, **match.groupdict())
+            return endpoint, status, payload
+        return path, 404, {"detail": "Not Found"}
+
+    def start(self) -> "FakeOpsServer":
+        """백그라운드 스레드에서 서버 시작"""
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="fake-ops-server", daemon=True
+        )
+        self._thread.start()
+        logger.info(
+            f"yamyam-ops 대역 서버 시작: {self.url} ({len(self.catalog)}개 음식점)"
+        )
+        return self
+
+    def serve_forever(self):
+        """현재 스레드에서 서버 실행 (Ctrl+C로 종료)"""
+        logger.info(
+            f"yamyam-ops 대역 서버 시작: {self.url} ({len(self.catalog)}개 음식점)"
+        )
+        try:
+            self._httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._httpd.server_close()
+
+    def stop(self):
+        """서버 종료"""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def __enter__(self) -> "FakeOpsServer":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def _make_handler(server: FakeOpsServer) -> type:
+    """FakeOpsServer에 요청을 넘기는 HTTP 핸들러 클래스 생성"""
+
+    class Handler(BaseHTTPRequestHandler):
+        # keep-alive 연결을 유지해야 http_pool의 연결 재사용이 측정에 반영됨
+        protocol_version = "HTTP/1.1"
+        # 헤더와 본문을 따로 쓰므로 Nagle + delayed ACK로 응답마다 ~40ms 지연되지 않도록 함
+        disable_nagle_algorithm = True
+
+        def _handle(self, method: str):
+            started = time.perf_counter()
+            parts = urlsplit(self.path)
+            params = {
+                key: values[-1]
+                for key, values in parse_qs(parts.query, keep_blank_values=True).items()
+            }
+            body: dict[str, Any] = {}
+            length = int(self.headers.get("Content-Length") or 0)
+            if length:
+                try:
+                    body = json.loads(self.rfile.read(length))
+                except json.JSONDecodeError:
+                    self._send(400, {"detail": "invalid JSON body"})
+                    return
+
+            try:
+                endpoint, status, payload = server.dispatch(
+                    method, parts.path, params, body
+                )
+            except Exception as e:
+                logger.exception(f"대역 서버 처리 오류: {method} {self.path}")
+                endpoint, status, payload = parts.path, 500, {"detail": str(e)}
+            self._send(status, payload)
+            server.stats.record(endpoint, status, time.perf_counter() - started)
+
+        def _send(self, status: int, payload: Any):
+            data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            try:
+                self.wfile.write(data)
+            except (BrokenPipeError, ConnectionResetError):
+                # 클라이언트가 취소한 요청 (예: 마지막 페이지 이후 미리 보낸 페이지 요청)
+                self.close_connection = True
+
+        def do_GET(self):
+            self._handle("GET")
+
+        def do_POST(self):
+            self._handle("POST")
+
+        def do_PATCH(self):
+            self._handle("PATCH")
+
+        def log_message(self, format: str, *args):
+            logger.debug(format % args)
+
+    return Handler
+
+
+def _parse_endpoint_latency(values: list[str]) -> dict[str, float]:
+    """["/kakao/diners/sorted=80", ...] → {"/kakao/diners/sorted": 80.0}"""
+    result = {}
+    for value in values:
+        endpoint, _, latency = value.partition("=")
+        result[endpoint.rstrip("/") or "/"] = float(latency)
+    return result
+
+
+def main(argv: Optional[list[str]] = None):
+    """대역 서버 CLI"""
+    parser = argparse.ArgumentParser(description="yamyam-ops API 로컬 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--diners", type=int, default=10000, help="합성 음식점 수")
+    parser.add_argument("--seed", type=int, default=0, help="카탈로그/주입 난수 시드")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--timeout-rate", type=float, default=0.0)
+    parser.add_argument("--timeout-ms", type=float, default=30000.0)
+    parser.add_argument(
+        "--endpoint-latency",
+        action="append",
+        default=[],
+        metavar="PATH=MS",
+        help="엔드포인트별 기본 지연 (예: /kakao/diners/sorted=80, 여러 번 지정 가능)",
+    )
+    parser.add_argument(
+        "--no-batch",
+        action="store_true",
+        help="POST /kakao/diners/batch, /activity-logs/bulk 미지원(404)",
+    )
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    started = time.perf_counter()
+    catalog = FakeOpsCatalog(
+        build_synthetic_catalog(args.diners, seed=args.seed), seed=args.seed
+    )
+    logger.info(f"합성 카탈로그 생성: {time.perf_counter() - started:.1f}초")
+
+    faults = FaultProfile(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        timeout_rate=args.timeout_rate,
+        timeout_ms=args.timeout_ms,
+        endpoint_latency_ms=_parse_endpoint_latency(args.endpoint_latency),
+        seed=args.seed,
+    )
+    FakeOpsServer(
+        catalog,
+        faults,
+        host=args.host,
+        port=args.port,
+        batch_supported=not args.no_batch,
+    ).serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,298 @@
+# src/benchmarks/micro_bench.py
+"""
+DinerSearchEngine / data_processing 핵심 함수 마이크로 벤치마크
+
+합성 한글 상호 카탈로그(기본 1만/10만/50만 행)에서 검색 엔진 초기화와 정확한/부분/자모
+매칭 검색, 반경 필터링, 메뉴 검색, 랜덤 뽑기, 거리 계산의 호출당 지연 백분위수와
+메모리 할당량을 측정하여 JSON으로 저장합니다. 최적화 전후 결과는 benchmarks.report로 비교합니다.
+
+실행:
+    cd src && python -m benchmarks.micro_bench --sizes 10000 100000 500000
+    cd src && python -m benchmarks.report ../.benchmarks/micro-<기준>.json ../.benchmarks/micro-<비교>.json
+"""
+
+import argparse
+import logging
+import time
+import tracemalloc
+from typing import Any, Callable, Optional
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from benchmarks.report import (
+    default_output_path,
+    run_metadata,
+    save_report,
+    summarize_timings,
+)
+from benchmarks.synthetic_catalog import DEFAULT_CENTER, build_synthetic_catalog
+from utils.data_processing import (
+    get_filtered_data,
+    haversine,
+    pick_random_diners,
+    search_menu,
+    search_menu_mask,
+)
+from utils.dataset_version import register_dataset_version
+from utils.search_engine import DinerSearchEngine
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIZES = [10000, 100000, 500000]
+# 벤치마크별 호출 수 상한과 측정 시간 상한 (느린 벤치마크는 최소 MIN_CALLS회만 측정)
+DEFAULT_MAX_CALLS = 50
+DEFAULT_MAX_SECONDS = 5.0
+MIN_CALLS = 3
+# 검색 쿼리/사용자 위치 표본 수 (호출마다 순환하여 사용)
+QUERY_SAMPLES = 20
+MENU_TERMS = ["국밥", "파스타", "세트", "초밥", "떡볶이", "정식"]
+
+
+def _typo(name: str, rng: np.random.Generator) -> str:
+    """
+    한 음절의 받침을 바꾼 오타 쿼리 생성 (정확한/부분 매칭은 실패하고 자모 매칭 경로를 탐)
+    """
+    chars = list(name.replace(" ", ""))
+    syllables = [i for i, c in enumerate(chars) if "가" <= c <= "힣"]
+    i = syllables[int(rng.integers(0, len(syllables)))]
+    code = ord(chars[i]) - 0xAC00
+    final = code % 28
+    chars[i] = chr(0xAC00 + code - final + (final + 1) % 28)
+    return "".join(chars)
+
+
+def build_queries(df: pd.DataFrame, seed: int = 0) -> dict[str, list[str]]:
+    """
+    검색 경로별 쿼리 표본
+
+    Returns:
+        {"exact": 상호 전체, "partial": 상호의 대표 메뉴+지점명 부분, "jamo": 오타 쿼리}
+    """
+    rng = np.random.default_rng(seed)
+    names = df["diner_name"].to_numpy(dtype=object)[
+        rng.integers(0, len(df), QUERY_SAMPLES)
+    ]
+    return {
+        "exact": list(names),
+        "partial": [name.split(" ", 1)[1] for name in names],
+        "jamo": [_typo(name, rng) for name in names],
+    }
+
+
+def _user_locations(seed: int = 0) -> list[tuple[float, float]]:
+    """도심 주변 무작위 사용자 위치 (위치 결과 캐시를 피하도록 서로 다른 격자)"""
+    rng = np.random.default_rng(seed)
+    offsets = rng.normal(0, 0.05, (QUERY_SAMPLES, 2))
+    return [(DEFAULT_CENTER[0] + a, DEFAULT_CENTER[1] + b) for a, b in offsets]
+
+
+def _reset_pick_state():
+    """pick_random_diners가 읽고 쓰는 세션 상태 초기화"""
+    st.session_state.previous_category_small = []
+    st.session_state.consecutive_failures = 0
+
+
+def build_benchmarks(
+    df: pd.DataFrame, seed: int = 0
+) -> dict[str, Callable[[int], Any]]:
+    """
+    {벤치마크 이름: 호출 번호를 받아 한 번 실행하는 함수}
+
+    검색 벤치마크는 초기화된 엔진을 공유하며, 초기화 비용은 load_basic_data로 따로 측정합니다.
+    """
+    # 앱의 공유 저장소 frame처럼 버전을 한 번만 계산해 등록 (인덱스/캐시 경로 측정)
+    register_dataset_version(df)
+    queries = build_queries(df, seed)
+    locations = _user_locations(seed)
+    df_basic = df[["diner_idx", "diner_name"]].assign(
+        distance=np.random.default_rng(seed).uniform(0, 30, len(df))
+    )
+    engine = DinerSearchEngine()
+    engine.load_basic_data(df_basic)
+
+    lats = df["diner_lat"].to_numpy(dtype=np.float64)
+    lons = df["diner_lon"].to_numpy(dtype=np.float64)
+    # search_menu는 행마다 호출되는 함수이므로 1000행 단위로 측정
+    menu_rows = df.head(1000)
+
+    def _search(kind: str) -> Callable[[int], Any]:
+        return lambda i: engine.search(queries[kind][i % QUERY_SAMPLES])
+
+    def _pick(i: int):
+        _reset_pick_state()
+        return pick_random_diners(df)
+
+    return {
+        "load_basic_data": lambda i: DinerSearchEngine().load_basic_data(df_basic),
+        "search_exact": _search("exact"),
+        "search_partial": _search("partial"),
+        "search_jamo": _search("jamo"),
+        "get_filtered_data": lambda i: get_filtered_data(
+            df, *locations[i % QUERY_SAMPLES], max_radius=5
+        ),
+        "search_menu_1k_rows": lambda i: menu_rows.apply(
+            lambda row: search_menu(row, MENU_TERMS[i % len(MENU_TERMS)]), axis=1
+        ),
+        "search_menu_mask": lambda i: search_menu_mask(
+            df, MENU_TERMS[i % len(MENU_TERMS)]
+        ),
+        "pick_random_diners": _pick,
+        "haversine_scalar": lambda i: haversine(
+            *locations[i % QUERY_SAMPLES], lats[i % len(lats)], lons[i % len(lons)]
+        ),
+        "haversine_array": lambda i: haversine(
+            *locations[i % QUERY_SAMPLES], lats, lons
+        ),
+    }
+
+
+def measure(
+    func: Callable[[int], Any],
+    max_calls: int = DEFAULT_MAX_CALLS,
+    max_seconds: float = DEFAULT_MAX_SECONDS,
+    trace_memory: bool = True,
+) -> dict[str, Any]:
+    """
+    첫 호출(캐시/인덱스 생성 포함)을 따로 기록하고 이후 호출의 지연 분포를 측정
+
+    메모리 할당량은 시간 측정이 끝난 뒤 tracemalloc을 켠 1회 호출로 기록합니다.
+
+    Returns:
+        summarize_timings 결과 + first_call_ms (+ peak_bytes, net_bytes)
+    """
+    started = time.perf_counter()
+    func(0)
+    first_call = time.perf_counter() - started
+
+    seconds = []
+    deadline = time.perf_counter() + max_seconds
+    for i in range(1, max_calls + 1):
+        started = time.perf_counter()
+        func(i)
+        seconds.append(time.perf_counter() - started)
+        if len(seconds) >= MIN_CALLS and time.perf_counter() > deadline:
+            break
+
+    stats = summarize_timings(seconds)
+    stats["first_call_ms"] = round(first_call * 1000, 3)
+    if trace_memory:
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            func(len(seconds) + 1)
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        stats.update(peak_bytes=peak - before, net_bytes=current - before)
+    return stats
+
+
+def _search_hit_rates(df: pd.DataFrame, seed: int = 0) -> dict[str, float]:
+    """쿼리 표본이 의도한 검색 경로(매칭 유형)로 처리되는 비율"""
+    queries = build_queries(df, seed)
+    engine = DinerSearchEngine()
+    engine.load_basic_data(df[["diner_idx", "diner_name"]])
+    expected = {"exact": "정확한 매칭", "partial": "부분 매칭", "jamo": "자모 매칭"}
+    rates = {}
+    for kind, match_type in expected.items():
+        hits = [
+            engine._match(engine._normalize(query), 5, 0.9, 0.7)[0] == match_type
+            for query in queries[kind]
+        ]
+        rates[kind] = round(sum(hits) / len(hits), 3)
+    return rates
+
+
+def _quiet_loggers():
+    """bare mode의 ScriptRunContext 경고와 검색 엔진 초기화 로그 숨기기"""
+    logging.getLogger("utils.search_engine").setLevel(logging.WARNING)
+    for name in list(logging.root.manager.loggerDict):
+        if name.startswith("streamlit"):
+            logging.getLogger(name).setLevel(logging.ERROR)
+
+
+def run_benchmark(
+    sizes: list[int] = DEFAULT_SIZES,
+    only: Optional[list[str]] = None,
+    max_calls: int = DEFAULT_MAX_CALLS,
+    max_seconds: float = DEFAULT_MAX_SECONDS,
+    trace_memory: bool = True,
+    seed: int = 0,
+) -> dict[str, Any]:
+    """
+    카탈로그 크기별로 모든(또는 only로 지정한) 마이크로 벤치마크 실행
+
+    Returns:
+        {"meta": 실행 환경, "scenarios": [{"name", "benchmark", "n_diners", "stages"}]}
+        (benchmarks.report.compare_reports로 비교할 수 있는 형식, 단계는 "call" 하나)
+    """
+    _quiet_loggers()
+    meta = run_metadata(
+        sizes=sizes,
+        only=only,
+        max_calls=max_calls,
+        max_seconds=max_seconds,
+        trace_memory=trace_memory,
+        seed=seed,
+    )
+    scenarios = []
+    for n_diners in sizes:
+        started = time.perf_counter()
+        df = build_synthetic_catalog(n_diners, seed=seed)
+        logger.info(
+            f"n={n_diners}: 합성 카탈로그 생성 {time.perf_counter() - started:.1f}초"
+        )
+        meta.setdefault("search_hit_rates", {})[str(n_diners)] = _search_hit_rates(
+            df, seed
+        )
+
+        for name, func in build_benchmarks(df, seed).items():
+            if only and name not in only:
+                continue
+            stats = measure(func, max_calls, max_seconds, trace_memory)
+            logger.info(
+                f"n={n_diners} {name}: p50 {stats['p50_ms']}ms "
+                f"(첫 호출 {stats['first_call_ms']}ms, {stats['n']}회)"
+            )
+            scenarios.append(
+                {
+                    "name": f"{name}/n={n_diners}",
+                    "benchmark": name,
+                    "n_diners": n_diners,
+                    "stages": {"call": stats},
+                }
+            )
+    return {"meta": meta, "scenarios": scenarios}
+
+
+def main(argv: Optional[list[str]] = None):
+    """마이크로 벤치마크 실행 후 결과 JSON 저장"""
+    parser = argparse.ArgumentParser(description="검색/데이터 처리 마이크로 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--only", nargs="+", help="실행할 벤치마크 이름")
+    parser.add_argument("--max-calls", type=int, default=DEFAULT_MAX_CALLS)
+    parser.add_argument("--max-seconds", type=float, default=DEFAULT_MAX_SECONDS)
+    parser.add_argument("--no-memory", action="store_true", help="할당량 측정 생략")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="결과 JSON 경로 (기본: .benchmarks/)")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    report = run_benchmark(
+        sizes=args.sizes,
+        only=args.only,
+        max_calls=args.max_calls,
+        max_seconds=args.max_seconds,
+        trace_memory=not args.no_memory,
+        seed=args.seed,
+    )
+    path = save_report(
+        report, args.output or default_output_path("micro", report["meta"])
+    )
+    logger.info(f"결과 저장: {path}")
+
+
+if __name__ == "__main__":
+    main()
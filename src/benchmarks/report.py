@@ -0,0 +1,193 @@
+# src/benchmarks/report.py
+"""
+벤치마크 결과 집계, JSON 저장, 커밋 간 비교
+
+비교:
+    cd src && python -m benchmarks.report base.json head.json --threshold 0.2
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+from config.constants import ROOT_DIR
+
+# 벤치마크 결과 JSON 기본 저장 디렉토리 (git 추적 제외)
+BENCHMARK_DIR = os.path.join(ROOT_DIR, ".benchmarks")
+
+
+def summarize_timings(seconds: list[float]) -> dict[str, float]:
+    """
+    반복 측정한 소요 시간(초)을 ms 단위 백분위수로 요약
+
+    Returns:
+        {"n", "p50_ms", "p90_ms", "p99_ms", "mean_ms", "max_ms"} 딕셔너리
+    """
+    if not seconds:
+        return {"n": 0}
+    ms = np.asarray(seconds, dtype=np.float64) * 1000
+    p50, p90, p99 = np.percentile(ms, [50, 90, 99])
+    return {
+        "n": len(ms),
+        "p50_ms": round(float(p50), 3),
+        "p90_ms": round(float(p90), 3),
+        "p99_ms": round(float(p99), 3),
+        "mean_ms": round(float(ms.mean()), 3),
+        "max_ms": round(float(ms.max()), 3),
+    }
+
+
+def _git(*args: str) -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", *args],
+            cwd=ROOT_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_metadata(**options: Any) -> dict[str, Any]:
+    """
+    결과 비교에 필요한 실행 환경 정보 (커밋, 버전, 옵션)
+
+    Args:
+        **options: 벤치마크 실행 옵션
+
+    Returns:
+        메타데이터 딕셔너리
+    """
+    status = _git("status", "--porcelain", "--untracked-files=no")
+    return {
+        "commit": _git("rev-parse", "--short", "HEAD"),
+        "dirty": bool(status) if status is not None else None,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "options": options,
+    }
+
+
+def default_output_path(name: str, metadata: dict[str, Any]) -> str:
+    """BENCHMARK_DIR/{name}-{커밋}[-dirty].json 경로"""
+    commit = metadata.get("commit") or "nogit"
+    suffix = "-dirty" if metadata.get("dirty") else ""
+    return os.path.join(BENCHMARK_DIR, f"{name}-{commit}{suffix}.json")
+
+
+def save_report(report: dict[str, Any], path: str) -> str:
+    """결과를 JSON으로 저장하고 경로 반환"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    return path
+
+
+def load_report(path: str) -> dict[str, Any]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare_reports(
+    base: dict[str, Any],
+    head: dict[str, Any],
+    metric: str = "p50_ms",
+    threshold: float = 0.2,
+    min_delta_ms: float = 1.0,
+) -> list[dict[str, Any]]:
+    """
+    두 결과에서 같은 시나리오/단계의 지표를 비교
+
+    상대 변화가 threshold를 넘고 절대 변화가 min_delta_ms 이상이면 회귀로 표시합니다.
+    (수 ms 미만 단계의 측정 잡음으로 회귀가 잡히지 않도록 절대 기준을 함께 사용)
+
+    Args:
+        base: 기준 결과 (save_report 형식)
+        head: 비교 대상 결과
+        metric: 비교할 지표 (p50_ms, p90_ms, p99_ms, mean_ms)
+        threshold: 회귀로 판단할 상대 증가율 (0.2 = 20%)
+        min_delta_ms: 회귀로 판단할 최소 절대 증가량 (ms)
+
+    Returns:
+        [{"scenario", "stage", "base", "head", "change", "regression"}] 리스트
+    """
+    base_stages = {
+        (scenario["name"], stage): stats
+        for scenario in base.get("scenarios", [])
+        for stage, stats in scenario["stages"].items()
+    }
+    rows = []
+    for scenario in head.get("scenarios", []):
+        for stage, stats in scenario["stages"].items():
+            before = base_stages.get((scenario["name"], stage), {}).get(metric)
+            after = stats.get(metric)
+            if before is None or after is None:
+                continue
+            change = (after - before) / before if before > 0 else 0.0
+            rows.append(
+                {
+                    "scenario": scenario["name"],
+                    "stage": stage,
+                    "base": before,
+                    "head": after,
+                    "change": round(change, 4),
+                    "regression": change > threshold and after - before >= min_delta_ms,
+                }
+            )
+    return rows
+
+
+def format_comparison(rows: list[dict[str, Any]], metric: str = "p50_ms") -> str:
+    """compare_reports 결과를 표 문자열로 변환"""
+    if not rows:
+        return "비교할 시나리오가 없습니다."
+    width = max(len(f"{row['scenario']} / {row['stage']}") for row in rows)
+    lines = [f"{'scenario / stage':<{width}}  {'base':>10}  {'head':>10}  change"]
+    for row in rows:
+        label = f"{row['scenario']} / {row['stage']}"
+        mark = "  ← 회귀" if row["regression"] else ""
+        lines.append(
+            f"{label:<{width}}  {row['base']:>10.3f}  {row['head']:>10.3f}"
+            f"  {row['change']:+7.1%}{mark}"
+        )
+    lines.append(f"(지표: {metric})")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """두 결과 JSON 비교 CLI (회귀가 있으면 종료 코드 1)"""
+    parser = argparse.ArgumentParser(description="벤치마크 결과 비교")
+    parser.add_argument("base", help="기준 결과 JSON")
+    parser.add_argument("head", help="비교 대상 결과 JSON")
+    parser.add_argument("--metric", default="p50_ms")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    parser.add_argument("--min-delta-ms", type=float, default=1.0)
+    args = parser.parse_args(argv)
+
+    rows = compare_reports(
+        load_report(args.base),
+        load_report(args.head),
+        metric=args.metric,
+        threshold=args.threshold,
+        min_delta_ms=args.min_delta_ms,
+    )
+    print(format_comparison(rows, args.metric))
+    return 1 if any(row["regression"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
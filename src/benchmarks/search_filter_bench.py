@@ -0,0 +1,368 @@
+# src/benchmarks/search_filter_bench.py
+"""
+검색 필터 페이지 파이프라인 end-to-end 벤치마크
+
+pages/search_filter_page.render의 검색 경로(필터링 API → 클라이언트 반경 필터 →
+정렬 API 또는 개인화 추천 → 결과 목록 렌더링)를 yamyam-ops 대역 서버에 대해
+Streamlit 없이(bare mode) 실행하고, 단계별 지연 백분위수와 메모리 할당량을 JSON으로 저장합니다.
+
+실행:
+    cd src && python -m benchmarks.search_filter_bench --sizes 10000 50000
+    cd src && python -m benchmarks.report base.json head.json
+"""
+
+import argparse
+import itertools
+import logging
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Optional
+
+import pandas as pd
+import streamlit as st
+
+from benchmarks.fake_ops_server import FakeOpsServer, FaultProfile
+from benchmarks.report import (
+    default_output_path,
+    run_metadata,
+    save_report,
+    summarize_timings,
+)
+from benchmarks.synthetic_catalog import DEFAULT_CENTER, build_synthetic_catalog
+from pages.search_filter_page import render_restaurant_dataframe
+from utils.api_client import YamYamOpsClient
+from utils.search_filter import (
+    SearchFilter,
+    apply_personal_ranking,
+    filter_by_radius,
+    request_personal_ranking,
+)
+
+logger = logging.getLogger(__name__)
+
+STAGES = ["filter", "radius", "sort", "personal", "render", "total"]
+DEFAULT_SIZES = [10000, 50000]
+DEFAULT_RADII = [1.0, 3.0, 10.0]
+DEFAULT_SORTS = ["인기도", "숨찐맛", "거리순", "개인화"]
+CATEGORY_MIXES = ["all", "large", "middle"]
+
+# 검색 페이지와 같은 값: 필터링 API는 최소 30km로 호출하고 첫 페이지는 15개
+API_MIN_RADIUS_KM = 30.0
+PAGE_SIZE = 15
+BENCH_USER_ID = "bench-user"
+
+
+class StageRecorder:
+    """단계별 소요 시간 (trace_memory=True면 할당 peak/순증가량도) 기록"""
+
+    def __init__(self, trace_memory: bool = False):
+        self.trace_memory = trace_memory
+        self.seconds: dict[str, float] = {}
+        self.memory: dict[str, dict[str, int]] = {}
+        # 진행 중인 단계의 [시작 시점 할당량, 지금까지의 최대 할당량] (중첩 단계용)
+        self._open: list[list[int]] = []
+
+    def _fold_peak(self) -> int:
+        """tracemalloc peak을 진행 중인 모든 단계에 반영하고 현재 할당량 반환"""
+        current, peak = tracemalloc.get_traced_memory()
+        for frame in self._open:
+            frame[1] = max(frame[1], peak)
+        return current
+
+    @contextmanager
+    def stage(self, name: str):
+        if self.trace_memory:
+            # 안쪽 단계가 peak을 초기화해도 바깥 단계의 최대값은 유지
+            before = self._fold_peak()
+            tracemalloc.reset_peak()
+            self._open.append([before, before])
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[name] = time.perf_counter() - started
+            if self.trace_memory:
+                current = self._fold_peak()
+                before, peak = self._open.pop()
+                self.memory[name] = {
+                    "peak_bytes": peak - before,
+                    "net_bytes": current - before,
+                }
+
+
+def category_mixes(df: pd.DataFrame) -> dict[str, tuple]:
+    """
+    카탈로그에서 가장 흔한 대/중분류로 카테고리 조합 구성
+
+    Returns:
+        {"all": (None, None), "large": ([대분류], None), "middle": ([대분류], [중분류])}
+    """
+    large = df["diner_category_large"].value_counts().index[0]
+    middle = (
+        df.loc[df["diner_category_large"] == large, "diner_category_middle"]
+        .value_counts()
+        .index[0]
+    )
+    return {
+        "all": (None, None),
+        "large": ([large], None),
+        "middle": ([large], [middle]),
+    }
+
+
+def _reset_session(filters: dict[str, Any]):
+    """render_restaurant_dataframe가 읽는 세션 상태 초기화"""
+    st.session_state.search_filters = filters
+    st.session_state.search_display_count = PAGE_SIZE
+
+
+def run_pipeline(
+    search_filter: SearchFilter,
+    api_url: str,
+    filters: dict[str, Any],
+    user_lat: float,
+    user_lon: float,
+    recorder: StageRecorder,
+) -> int:
+    """
+    검색 버튼을 눌렀을 때(필터 변경)의 검색 경로를 한 번 실행
+
+    Args:
+        search_filter: 대역 서버 클라이언트를 지정한 SearchFilter
+        api_url: 개인화 추천 API URL
+        filters: st.session_state.search_filters 형식의 필터
+        user_lat: 사용자 위도
+        user_lon: 사용자 경도
+        recorder: 단계 기록기
+
+    Returns:
+        전체 결과 개수 (반경 내 음식점 수)
+    """
+    _reset_session(filters)
+    large, middle = filters["large_categories"], filters["middle_categories"]
+
+    with recorder.stage("total"):
+        with recorder.stage("filter"):
+            diner_ids, diner_idx, distance_dict, _ = (
+                search_filter.get_filtered_restaurants(
+                    user_lat=user_lat,
+                    user_lon=user_lon,
+                    radius_km=max(API_MIN_RADIUS_KM, filters["radius_km"]),
+                    large_categories=large,
+                    middle_categories=middle,
+                )
+            )
+        if not diner_ids:
+            return 0
+
+        with recorder.stage("radius"):
+            diner_ids, diner_idx, distance_by_id, _ = filter_by_radius(
+                diner_ids, diner_idx, distance_dict, filters["radius_km"]
+            )
+        total_count = len(diner_ids)
+
+        if filters["sort_by"] == "개인화":
+            with recorder.stage("sort"):
+                all_df_results = search_filter.apply_filters(
+                    user_lat=user_lat,
+                    user_lon=user_lon,
+                    radius_km=filters["radius_km"],
+                    large_categories=large,
+                    middle_categories=middle,
+                    sort_by=filters["sort_by"],
+                )
+            with recorder.stage("personal"):
+                if len(all_df_results) > 0:
+                    response = request_personal_ranking(
+                        api_url, all_df_results["diner_idx"].tolist(), BENCH_USER_ID
+                    )
+                    all_df_results = apply_personal_ranking(
+                        all_df_results, response, distance_by_id
+                    )
+                total_count = len(all_df_results)
+                df_results = all_df_results[:PAGE_SIZE]
+        else:
+            with recorder.stage("sort"):
+                df_results = search_filter.sort_restaurants(
+                    diner_ids=diner_ids,
+                    sort_by=filters["sort_by"],
+                    limit=PAGE_SIZE,
+                    offset=0,
+                )
+                if "id" in df_results.columns:
+                    df_results["distance"] = df_results["id"].map(distance_by_id)
+
+        with recorder.stage("render"):
+            render_restaurant_dataframe(df_results, total_count=total_count)
+    return total_count
+
+
+def _scenario_name(n_diners: int, radius_km: float, mix: str, sort_by: str) -> str:
+    return f"n={n_diners}/r={radius_km:g}km/cat={mix}/sort={sort_by}"
+
+
+def bench_scenario(
+    search_filter: SearchFilter,
+    api_url: str,
+    filters: dict[str, Any],
+    iterations: int,
+    warmup: int,
+    trace_memory: bool,
+) -> dict[str, Any]:
+    """
+    한 시나리오를 warmup + iterations회 실행하고 단계별 통계 집계
+
+    메모리 추적은 시간 측정을 왜곡하므로 측정 반복과 분리된 1회 실행으로 기록합니다.
+    """
+    user_lat, user_lon = DEFAULT_CENTER
+    timings: dict[str, list[float]] = {stage: [] for stage in STAGES}
+    counts = []
+    for i in range(warmup + iterations):
+        recorder = StageRecorder()
+        counts.append(
+            run_pipeline(search_filter, api_url, filters, user_lat, user_lon, recorder)
+        )
+        if i >= warmup:
+            for stage, seconds in recorder.seconds.items():
+                timings[stage].append(seconds)
+
+    stages = {
+        stage: summarize_timings(values) for stage, values in timings.items() if values
+    }
+    if trace_memory:
+        recorder = StageRecorder(trace_memory=True)
+        tracemalloc.start()
+        try:
+            run_pipeline(search_filter, api_url, filters, user_lat, user_lon, recorder)
+        finally:
+            tracemalloc.stop()
+        for stage, memory in recorder.memory.items():
+            stages[stage].update(memory)
+    return {"results": counts[-1] if counts else 0, "stages": stages}
+
+
+def _quiet_loggers():
+    """bare mode의 ScriptRunContext 경고와 요청별 httpx 로그 숨기기"""
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    for name in list(logging.root.manager.loggerDict):
+        if name.startswith("streamlit"):
+            logging.getLogger(name).setLevel(logging.ERROR)
+
+
+def run_benchmark(
+    sizes: list[int] = DEFAULT_SIZES,
+    radii: list[float] = DEFAULT_RADII,
+    mixes: list[str] = CATEGORY_MIXES,
+    sorts: list[str] = DEFAULT_SORTS,
+    iterations: int = 10,
+    warmup: int = 2,
+    latency_ms: float = 0.0,
+    jitter_ms: float = 0.0,
+    trace_memory: bool = True,
+    seed: int = 0,
+) -> dict[str, Any]:
+    """
+    카탈로그 크기 × 반경 × 카테고리 조합 × 정렬 기준 시나리오 전체 실행
+
+    카탈로그 크기마다 합성 카탈로그와 대역 서버를 새로 띄웁니다.
+
+    Returns:
+        {"meta": 실행 환경, "scenarios": [{"name", "n_diners", "radius_km",
+        "categories", "sort_by", "results", "stages"}]} 딕셔너리
+    """
+    _quiet_loggers()
+    meta = run_metadata(
+        sizes=sizes,
+        radii=radii,
+        mixes=mixes,
+        sorts=sorts,
+        iterations=iterations,
+        warmup=warmup,
+        latency_ms=latency_ms,
+        jitter_ms=jitter_ms,
+        trace_memory=trace_memory,
+        seed=seed,
+    )
+    scenarios = []
+    for n_diners in sizes:
+        df = build_synthetic_catalog(n_diners, seed=seed)
+        mix_filters = category_mixes(df)
+        faults = FaultProfile(latency_ms=latency_ms, jitter_ms=jitter_ms, seed=seed)
+        with FakeOpsServer(df, faults) as server:
+            search_filter = SearchFilter(
+                client=YamYamOpsClient(server.url, token="bench")
+            )
+            for radius_km, mix, sort_by in itertools.product(radii, mixes, sorts):
+                large, middle = mix_filters[mix]
+                filters = {
+                    "radius_km": radius_km,
+                    "large_categories": large,
+                    "middle_categories": middle,
+                    "sort_by": sort_by,
+                }
+                name = _scenario_name(n_diners, radius_km, mix, sort_by)
+                result = bench_scenario(
+                    search_filter,
+                    server.url,
+                    filters,
+                    iterations,
+                    warmup,
+                    trace_memory,
+                )
+                total = result["stages"].get("total", {}).get("p50_ms")
+                logger.info(f"{name}: {result['results']}개, total p50 {total}ms")
+                scenarios.append(
+                    {
+                        "name": name,
+                        "n_diners": n_diners,
+                        "radius_km": radius_km,
+                        "categories": mix,
+                        "sort_by": sort_by,
+                        **result,
+                    }
+                )
+    return {"meta": meta, "scenarios": scenarios}
+
+
+def main(argv: Optional[list[str]] = None):
+    """벤치마크 실행 후 결과 JSON 저장"""
+    parser = argparse.ArgumentParser(description="검색 필터 파이프라인 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--radii", type=float, nargs="+", default=DEFAULT_RADII)
+    parser.add_argument(
+        "--mixes", nargs="+", choices=CATEGORY_MIXES, default=CATEGORY_MIXES
+    )
+    parser.add_argument(
+        "--sorts", nargs="+", choices=DEFAULT_SORTS, default=DEFAULT_SORTS
+    )
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--no-memory", action="store_true", help="할당량 측정 생략")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="결과 JSON 경로 (기본: .benchmarks/)")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    report = run_benchmark(
+        sizes=args.sizes,
+        radii=args.radii,
+        mixes=args.mixes,
+        sorts=args.sorts,
+        iterations=args.iterations,
+        warmup=args.warmup,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        trace_memory=not args.no_memory,
+        seed=args.seed,
+    )
+    path = save_report(
+        report, args.output or default_output_path("search_filter", report["meta"])
+    )
+    logger.info(f"결과 저장: {path}")
+
+
+if __name__ == "__main__":
+    main()
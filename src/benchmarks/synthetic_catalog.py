@@ -0,0 +1,221 @@
+# src/benchmarks/synthetic_catalog.py
+"""벤치마크용 합성 음식점 카탈로그 생성"""
+
+import time
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from utils.category_index import load_category_table
+
+# 합성 카탈로그 중심 좌표 (서울시청)와 분포 반경
+DEFAULT_CENTER = (37.5665, 126.9780)
+DEFAULT_SPREAD_KM = 12.0
+
+# 지번 주소 생성용 구/동 이름
+DISTRICTS = [
+    "강남구",
+    "강동구",
+    "강서구",
+    "관악구",
+    "광진구",
+    "구로구",
+    "마포구",
+    "서대문구",
+    "서초구",
+    "성동구",
+    "송파구",
+    "영등포구",
+    "용산구",
+    "종로구",
+    "중구",
+]
+NEIGHBORHOODS = ["역삼동", "합정동", "신사동", "성수동", "연남동", "문래동", "이태원동"]
+
+# 카테고리 테이블을 읽을 수 없을 때 사용하는 (대, 중, 소분류) 조합
+FALLBACK_CATEGORIES = [
+    ("한식", "국밥", "순대국"),
+    ("한식", "육류,고기", "삼겹살"),
+    ("한식", "찌개,전골", "김치찌개"),
+    ("일식", "초밥,롤", "초밥"),
+    ("일식", "돈까스,우동", "돈까스"),
+    ("중식", "중국요리", "짜장면"),
+    ("양식", "이탈리안", "파스타"),
+    ("양식", "햄버거", "수제버거"),
+    ("아시아음식", "베트남음식", "쌀국수"),
+    ("분식", "떡볶이", "즉석떡볶이"),
+]
+
+MENU_SUFFIXES = ["", " 정식", " 세트", " 곱빼기", " (2인)", " 특"]
+TAGS = [
+    "혼밥",
+    "데이트",
+    "회식",
+    "가성비",
+    "주차",
+    "포장",
+    "배달",
+    "노포",
+    "뷰맛집",
+    "24시",
+]
+
+# 상호명 생성용 음절 (2~3음절 상호 + 대표 메뉴 + 지점명)
+NAME_SYLLABLES = list(
+    "가나다라마바사아자차카타파하강남동서진미순원명성한대복만수춘향옥정화연림"
+    "해달별솔봄꽃돌산길터집골목장터맛참신고향엄마할매이모삼촌형제부자황금백"
+)
+
+# ULID 형식 ID 생성용 Crockford Base32 문자
+_ULID_ALPHABET = np.array(list("0123456789ABCDEFGHJKMNPQRSTVWXYZ"))
+
+
+def _category_triples() -> list[tuple[str, str, str]]:
+    """카테고리 테이블의 음식점 (대, 중, 소분류) 조합 (없으면 기본 조합)"""
+    table = load_category_table()
+    columns = ["diner_category_large", "diner_category_middle", "diner_category_small"]
+    if table.empty or not set(columns) <= set(table.columns):
+        return FALLBACK_CATEGORIES
+    triples = table[columns].dropna().drop_duplicates()
+    if triples.empty:
+        return FALLBACK_CATEGORIES
+    return list(triples.itertuples(index=False, name=None))
+
+
+def _ulids(rng: np.random.Generator, n: int, created: np.ndarray) -> np.ndarray:
+    """생성 시각(ms) 10자리 + 난수 16자리의 ULID 형식 문자열 배열"""
+    time_chars = np.empty((n, 10), dtype="<U1")
+    value = created.astype(np.int64)
+    for position in range(9, -1, -1):
+        time_chars[:, position] = _ULID_ALPHABET[value % 32]
+        value //= 32
+    random_chars = _ULID_ALPHABET[rng.integers(0, 32, size=(n, 16))]
+    chars = np.concatenate([time_chars, random_chars], axis=1)
+    return np.array(["".join(row) for row in chars], dtype=object)
+
+
+def korean_brand_names(rng: np.random.Generator, n: int) -> np.ndarray:
+    """NAME_SYLLABLES에서 2~3음절을 뽑아 만든 상호 배열"""
+    syllables = np.array(NAME_SYLLABLES)
+    lengths = rng.integers(2, 4, n)
+    picks = syllables[rng.integers(0, len(syllables), (n, 3))]
+    return np.array(
+        ["".join(row[:length]) for row, length in zip(picks.tolist(), lengths)],
+        dtype=object,
+    )
+
+
+def build_synthetic_catalog(
+    n_diners: int = 10000,
+    seed: int = 0,
+    center: tuple[float, float] = DEFAULT_CENTER,
+    spread_km: float = DEFAULT_SPREAD_KM,
+    now: Optional[float] = None,
+) -> pd.DataFrame:
+    """
+    yamyam-ops /kakao/diners/ 응답과 같은 컬럼의 합성 음식점 카탈로그 생성
+
+    같은 seed와 크기면 항상 같은 데이터가 만들어지므로 벤치마크 결과를 비교할 수 있습니다.
+
+    Args:
+        n_diners: 음식점 수
+        seed: 난수 시드
+        center: 좌표 분포 중심 (위도, 경도)
+        spread_km: 좌표 분포 표준편차 (km)
+        now: updated_at 기준 시각 (epoch 초, None이면 2026-01-01 고정)
+
+    Returns:
+        음식점 DataFrame (diner_menu_name, diner_tag는 리스트)
+    """
+    rng = np.random.default_rng(seed)
+    if now is None:
+        now = pd.Timestamp("2026-01-01", tz="UTC").timestamp()
+
+    triples = _category_triples()
+    picks = rng.integers(0, len(triples), n_diners)
+    large, middle, small = (np.array(values, dtype=object) for values in zip(*triples))
+
+    # 도심에 음식점이 몰리도록 정규분포로 좌표 생성
+    lat_sd = spread_km / 111.195
+    lon_sd = spread_km / (111.195 * np.cos(np.radians(center[0])))
+    lats = center[0] + rng.normal(0, lat_sd, n_diners)
+    lons = center[1] + rng.normal(0, lon_sd, n_diners)
+
+    review_cnt = np.floor(rng.lognormal(3.0, 1.2, n_diners)).astype(np.int64)
+    review_avg = np.round(np.clip(rng.normal(3.9, 0.5, n_diners), 1.0, 5.0), 2)
+    # 리뷰 수가 적을수록 전체 평균(3.9)으로 당기는 베이지안 평균
+    bayesian = np.round((review_avg * review_cnt + 3.9 * 20) / (review_cnt + 20), 4)
+    grade = rng.choice([np.nan, 1.0, 2.0, 3.0], n_diners, p=[0.7, 0.15, 0.1, 0.05])
+    hidden = np.round(bayesian * np.exp(-review_cnt / 200), 4)
+
+    created_ms = (now - rng.uniform(0, 3 * 365 * 86400, n_diners)) * 1000
+    updated = now - rng.uniform(0, 30 * 86400, n_diners)
+
+    districts = rng.choice(DISTRICTS, n_diners)
+    neighborhoods = rng.choice(NEIGHBORHOODS, n_diners)
+    numbers = rng.integers(1, 999, n_diners)
+
+    # 행마다 접미사/태그를 중복 없이 무작위로 고름 (난수 정렬 순서의 앞쪽 k개)
+    menu_counts = rng.integers(1, len(MENU_SUFFIXES) + 1, n_diners)
+    tag_counts = rng.integers(0, 4, n_diners)
+    menu_orders = np.argsort(rng.random((n_diners, len(MENU_SUFFIXES))), axis=1)
+    tag_orders = np.argsort(rng.random((n_diners, len(TAGS))), axis=1)
+    bases = small[picks]
+    menus = [
+        [f"{base}{MENU_SUFFIXES[j]}" for j in order[:count]]
+        for base, order, count in zip(bases, menu_orders.tolist(), menu_counts)
+    ]
+    tags = [
+        [TAGS[j] for j in order[:count]]
+        for order, count in zip(tag_orders.tolist(), tag_counts)
+    ]
+    brands = korean_brand_names(rng, n_diners)
+    names = [
+        f"{brand} {base} {neighborhood[:-1]}{i // len(NEIGHBORHOODS) + 1}호점"
+        for i, (brand, neighborhood, base) in enumerate(
+            zip(brands, neighborhoods, bases)
+        )
+    ]
+
+    diner_idx = 1_000_000 + np.arange(n_diners, dtype=np.int64)
+    df = pd.DataFrame(
+        {
+            "id": _ulids(rng, n_diners, created_ms),
+            "diner_idx": diner_idx,
+            "diner_name": names,
+            "diner_category_large": large[picks],
+            "diner_category_middle": middle[picks],
+            "diner_category_small": small[picks],
+            "diner_category_detail": None,
+            "diner_lat": lats,
+            "diner_lon": lons,
+            "diner_num_address": [
+                f"서울 {d} {n} {num}"
+                for d, n, num in zip(districts, neighborhoods, numbers)
+            ],
+            "diner_menu_name": menus,
+            "diner_tag": tags,
+            "diner_review_cnt": review_cnt,
+            "diner_review_avg": review_avg,
+            "diner_grade": grade,
+            "bayesian_score": bayesian,
+            "hidden_score": hidden,
+            "real_bad_review_percent": np.round(rng.uniform(0, 30, n_diners), 1),
+            "diner_url": [f"https://place.map.kakao.com/{idx}" for idx in diner_idx],
+            "created_at": pd.to_datetime(created_ms, unit="ms", utc=True).strftime(
+                "%Y-%m-%dT%H:%M:%SZ"
+            ),
+            "updated_at": pd.to_datetime(updated, unit="s", utc=True).strftime(
+                "%Y-%m-%dT%H:%M:%SZ"
+            ),
+        }
+    )
+    return df
+
+
+def format_timestamp(epoch: Optional[float] = None) -> str:
+    """updated_at 형식(UTC ISO 8601) 문자열"""
+    return time.strftime(
+        "%Y-%m-%dT%H:%M:%SZ", time.gmtime(time.time() if epoch is None else epoch)
+    )
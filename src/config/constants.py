@@ -23,6 +23,16 @@ DINER_REVIEW_AVG = 3.2
 DATA_PATH = os.path.join(ROOT_DIR, "data", "seoul_data", "*.csv")
 ZONE_INFO_PATH = os.path.join(ROOT_DIR, "data", "zone_info.json")
 MODEL_PATH = os.path.join(ROOT_DIR, "data", "model_data")
+CATEGORY_TABLE_PATH = os.path.join(ROOT_DIR, "data", "seoul_data", "category_table.csv")
+
+# 음식점 카탈로그 스냅샷 경로 (버전별 디렉토리 + CURRENT 포인터), 보관할 스냅샷 수
+SNAPSHOT_DIR = os.path.join(ROOT_DIR, "data", "snapshots")
+SNAPSHOT_KEEP = 3
+
+# 반경 조회 결과 캐시 설정 (좌표 스냅 격자 크기, 최대 항목 수, 후보 배열 메모리 상한)
+LOCATION_CACHE_GRID_METERS = 50
+LOCATION_CACHE_MAX_ENTRIES = 512
+LOCATION_CACHE_MAX_BYTES = 64 * 1024 * 1024
 
 # Kakao API settings
 KAKAO_API_URL = "https://dapi.kakao.com/v2/local/search/keyword.json"
@@ -34,6 +44,69 @@ MICROSOFT_CLARITY_ID = st.secrets["MICROSOFT_CLARITY_ID"]
 # yamyam-ops API URL
 API_URL = st.secrets.get("API_URL", "http://localhost:8000")
 
+# yamyam-ops API 연결 풀 설정
+HTTP_POOL_MAX_CONNECTIONS = 50
+HTTP_POOL_MAX_KEEPALIVE = 20
+HTTP_POOL_KEEPALIVE_EXPIRY = 30.0  # 초
+HTTP_POOL_MAX_PER_HOST = 20
+HTTP_POOL_HTTP2 = bool(st.secrets.get("HTTP2_ENABLED", False))
+
+# 음식점 상세 일괄 조회 설정 (배치 요청당 최대 ID 수, 단건 폴백 시 최대 동시 요청 수)
+DINER_BATCH_SIZE = 100
+DINER_DETAIL_CONCURRENCY = 10
+
+# 음식점 카탈로그 페이지 조회 설정 (페이지당 레코드 수, 최대 동시 페이지 요청 수, 페이지 타임아웃)
+CATALOG_PAGE_SIZE = 1000
+CATALOG_FETCH_CONCURRENCY = 4
+CATALOG_PAGE_TIMEOUT = 30.0  # 초
+
+# 음식점 카탈로그 증분 동기화 설정 (변경분 조회 파라미터, 동기화 주기, 0이면 사용 안 함)
+CATALOG_UPDATED_SINCE_PARAM = "updated_since"
+DINER_SYNC_INTERVAL = int(st.secrets.get("DINER_SYNC_INTERVAL", 3600))  # 초
+
+# rerun 프로파일러 설정 (사용 여부, 보관할 최근 트레이스 수, 구간별 백분위수 표본 수, 히스토그램 경계)
+PROFILER_ENABLED = bool(st.secrets.get("PROFILER_ENABLED", False))
+PROFILER_KEEP_TRACES = 50
+PROFILER_MAX_SAMPLES = 1000
+PROFILER_HISTOGRAM_BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+# Firestore 활동 로그 배치 기록 설정 (배치당 최대 문서 수(Firestore 상한 500), 최대 대기 시간,
+# 대기열 상한, 대기열이 가득 찼을 때 정책(drop_oldest | drop_newest | block), block 최대 대기,
+# 커밋 재시도 횟수, 종료 시 flush 최대 대기, 로그 조회 전 flush 최대 대기)
+FIREBASE_LOG_BATCH_SIZE = 200
+FIREBASE_LOG_FLUSH_INTERVAL_MS = 1000
+FIREBASE_LOG_QUEUE_MAX = 10000
+FIREBASE_LOG_DROP_POLICY = st.secrets.get("FIREBASE_LOG_DROP_POLICY", "drop_oldest")
+FIREBASE_LOG_BLOCK_TIMEOUT = 0.05  # 초
+FIREBASE_LOG_MAX_RETRIES = 3
+FIREBASE_LOG_SHUTDOWN_TIMEOUT = 5.0  # 초
+FIREBASE_LOG_READ_FLUSH_TIMEOUT = 2.0  # 초
+
+# 활동 로그 세션 단위 중복 제거 설정 (같은 로그를 하나로 묶는 시간 범위, 같은 페이지라도
+# 새 방문으로 처리하는 무활동 시간, 중복 제거에서 제외할 활동 유형)
+LOG_DEDUP_WINDOW_SECONDS = 5.0
+PAGE_VISIT_IDLE_TIMEOUT_SECONDS = 30 * 60
+LOG_DEDUP_EXEMPT_TYPES = ("login", "signup", "logout")
+
+# yamyam-ops 활동 로그(/activity-logs) 버퍼 전송 설정 (일괄 요청당 최대 이벤트 수, 최대 대기 시간,
+# 대기열 상한, 대기열이 가득 찼을 때 정책, 일괄 엔드포인트 미지원 시 최대 동시 요청 수,
+# 전송 재시도 횟수, 종료 시 flush 최대 대기)
+ACTIVITY_LOG_BATCH_SIZE = 50
+ACTIVITY_LOG_FLUSH_INTERVAL_MS = 2000
+ACTIVITY_LOG_QUEUE_MAX = 5000
+ACTIVITY_LOG_DROP_POLICY = st.secrets.get("ACTIVITY_LOG_DROP_POLICY", "drop_oldest")
+ACTIVITY_LOG_CONCURRENCY = 5
+ACTIVITY_LOG_MAX_RETRIES = 2
+ACTIVITY_LOG_SHUTDOWN_TIMEOUT = 5.0  # 초
+
+# 음식점 상세 정보 공유 캐시 설정 (유효 시간, 추정 메모리 상한)
+DINER_CACHE_TTL_SECONDS = 600
+DINER_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+# 유사 식당 상세 정보 동시 조회 설정 (최대 동시 요청 수, 전체 마감 시간)
+SIMILAR_FETCH_CONCURRENCY = 5
+SIMILAR_FETCH_DEADLINE = 3.0  # 초
+
 # 우선순위를 정의
 PRIORITY_ORDER = {"한식": 1, "중식": 2, "일식": 2, "양식": 2}
 
@@ -2,9 +2,21 @@
 
 import streamlit as st
 
-from config.constants import LOGO_SMALL_IMG_PATH, LOGO_TITLE_IMG_PATH
-from pages import chat_page, my_page, ranking_page, search_filter_page, worldcup_page
+from config.constants import (
+    LOGO_SMALL_IMG_PATH,
+    LOGO_TITLE_IMG_PATH,
+    PROFILER_ENABLED,
+)
+from pages import (
+    chat_page,
+    my_page,
+    profiler_page,
+    ranking_page,
+    search_filter_page,
+    worldcup_page,
+)
 from pages.onboarding import OnboardingPage
+from utils.activity_logger import flush_on_page_change
 from utils.analytics import load_analytics
 from utils.app import What2EatApp
 from utils.auth import (
@@ -14,6 +26,7 @@ from utils.auth import (
     has_completed_onboarding,
     logout,
 )
+from utils.profiler import profile_rerun, profile_span, set_rerun_page
 
 
 def login_page():
@@ -105,6 +118,7 @@ def main():
 
     # 로그인하지 않은 사용자는 로그인 페이지만 표시
     if not is_authenticated:
+        set_rerun_page("login")
         login_page()
         st.stop()  # 로그인 페이지 표시 후 실행 중단
         return
@@ -182,6 +196,18 @@ def main():
         st.Page(chat_page.render, url_path="chat", title="오늘 머먹?", icon="🤤"),
     ]
 
+    # 프로파일러 디버그 페이지 (사이드바에 표시하지 않음, /debug-profiler 로 접근)
+    if PROFILER_ENABLED:
+        pages.append(
+            st.Page(
+                profiler_page.render,
+                url_path="debug-profiler",
+                title="프로파일러",
+                icon="⏱️",
+                visibility="hidden",
+            )
+        )
+
     # 온보딩 완료 직후라면 chat_page를 기본값으로 설정
     if (
         "onboarding_just_completed" in st.session_state
@@ -192,8 +218,14 @@ def main():
 
     # 네비게이션 실행
     pg = st.navigation(pages)
-    pg.run()
+    set_rerun_page(pg.url_path or "search")
+    # 페이지 전환 시 버퍼에 쌓인 활동 로그 전송 요청
+    flush_on_page_change(pg.url_path or "search")
+    with profile_span("page.run"):
+        pg.run()
 
 
 if __name__ == "__main__":
-    main()
+    # PROFILER_ENABLED일 때 rerun 한 번을 트레이스로 기록
+    with profile_rerun():
+        main()
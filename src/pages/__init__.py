@@ -6,6 +6,7 @@
 from . import (
     chat_page,
     my_page,
+    profiler_page,
     ranking_page,
     search_filter_page,
     search_map_page,
@@ -18,6 +19,7 @@ __all__ = [
     "chat_page",
     "ranking_page",
     "my_page",
+    "profiler_page",
     "worldcup_page",
     "search_filter_page",
     "search_map_page",
@@ -7,8 +7,9 @@ from config.constants import PRIORITY_ORDER
 from utils.app import What2EatApp
 from utils.data_processing import (
     category_filters,
+    category_mask,
     get_filtered_data,
-    search_menu,
+    search_menu_mask,
     select_radius,
 )
 from utils.dialogs import change_location, show_restaurant_map
@@ -165,8 +166,10 @@ def render():
             menu_search = st.text_input("찾고 싶은 메뉴를 입력하세요")
             if menu_search:
                 df_menu_filtered = st.session_state.df_filtered[
-                    st.session_state.df_filtered.apply(
-                        lambda row: search_menu(row, menu_search), axis=1
+                    search_menu_mask(
+                        st.session_state.df_filtered,
+                        menu_search,
+                        source_df=app.df_diner,
                     )
                 ]
                 _log_user_activity(
@@ -237,7 +240,8 @@ def render():
                     )
 
                     df_geo_mid_category_filtered = category_filters(
-                        diner_category, st.session_state.df_filtered
+                        diner_category,
+                        st.session_state.df_filtered,
                     )
                     if len(df_geo_mid_category_filtered):
                         my_chat_message(
@@ -256,9 +260,10 @@ def render():
                         if selected_category:
                             df_geo_small_category_filtered = (
                                 df_geo_mid_category_filtered[
-                                    df_geo_mid_category_filtered[
-                                        "diner_category_middle"
-                                    ].isin(selected_category)
+                                    category_mask(
+                                        df_geo_mid_category_filtered,
+                                        middle=selected_category,
+                                    )
                                 ].sort_values(by="bayesian_score", ascending=False)
                             )
                             _log_user_activity(
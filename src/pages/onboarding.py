@@ -1,11 +1,10 @@
 # pages/onboarding.py
 
-import asyncio
-
 import streamlit as st
 
 from utils.api import APIRequester
-from utils.api_client import get_yamyam_ops_client
+from utils.api_client import YamYamOpsClient, get_yamyam_ops_client
+from utils.async_runner import get_async_runner
 from utils.auth import get_current_user
 from utils.category_manager import get_category_manager
 from utils.firebase_logger import get_firebase_logger
@@ -90,9 +89,7 @@ class OnboardingPage:
             # 비동기 함수를 동기적으로 실행
             with st.spinner("🔍 검색 중..."):
                 try:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    results = loop.run_until_complete(
+                    results = get_async_runner().run(
                         client.search_restaurants(
                             query=query,
                             limit=10,
@@ -101,7 +98,6 @@ class OnboardingPage:
                             radius_km=radius_km,
                         )
                     )
-                    loop.close()
                 except Exception as e:
                     st.error(f"❌ 검색 중 오류가 발생했습니다: {str(e)}")
                     return
@@ -1052,9 +1048,12 @@ class OnboardingPage:
                 if rating > 0
             )
             st.write(f"• 평가한 음식점: {rated_count}개")
+            diner_names = self._get_diner_names(
+                [key.split("_")[-1] for key in st.session_state.restaurant_ratings]
+            )
             for key, rating in st.session_state.restaurant_ratings.items():
                 diner_id = key.split("_")[-1]
-                diner_name = self._get_diner_name(diner_id)
+                diner_name = diner_names.get(diner_id, diner_id)
                 st.write(f"• {diner_name} 식당에 {rating}점을 주셨어요.")
 
         # 평가 유형별 통계 (캐시된 값 사용)
@@ -1129,22 +1128,19 @@ class OnboardingPage:
 
                 # PostgreSQL에 온보딩 데이터 저장
                 try:
-                    import asyncio
-
                     from utils.api_client import get_yamyam_ops_client
 
                     client = get_yamyam_ops_client()
                     if client:
                         # 비동기 함수를 동기적으로 실행
-                        loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(loop)
-                        success = loop.run_until_complete(
+                        success = get_async_runner().run(
                             client.save_onboarding_data(
                                 st.session_state.user_profile,
                                 st.session_state.restaurant_ratings,
+                                user_lat=st.session_state.get("user_lat"),
+                                user_lon=st.session_state.get("user_lon"),
                             )
                         )
-                        loop.close()
 
                         if success:
                             st.success(
@@ -1204,7 +1200,14 @@ class OnboardingPage:
                     {"profile_data": st.session_state.user_profile},
                 )
     
-    def _get_diner_name(self, diner_id: str) -> str:
-        # call GET /kakao/diners/{diner_id} API
-        response = self.api_requester.get(api_path=f"/kakao/diners/{diner_id}").json()
-        return response["diner_name"]
\ No newline at end of file
+    def _get_diner_names(self, diner_ids: list[str]) -> dict[str, str]:
+        """여러 음식점 이름을 한 번의 일괄 조회로 가져오기 ({diner_id: 이름})"""
+        try:
+            client = YamYamOpsClient(st.secrets["API_URL"])
+            diners = get_async_runner().run(client.get_restaurants_by_idx(diner_ids))
+        except Exception as e:
+            print(f"음식점 이름 일괄 조회 실패: {e}")
+            return {}
+        return {
+            str(diner.get("diner_idx")): diner.get("diner_name", "") for diner in diners
+        }
\ No newline at end of file
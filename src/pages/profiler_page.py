@@ -0,0 +1,96 @@
+# src/pages/profiler_page.py
+"""rerun 프로파일러 디버그 페이지 (PROFILER_ENABLED일 때만 숨김 페이지로 등록)"""
+
+import json
+
+import pandas as pd
+import streamlit as st
+
+from utils.activity_logger import get_activity_log_stats
+from utils.firebase_logger import get_firebase_logger
+from utils.log_dedup import get_activity_deduplicator
+from utils.profiler import get_profiler
+
+
+def _render_page_latency(page_summary: dict):
+    """페이지별 rerun 지연 요약과 히스토그램"""
+    st.subheader("📊 페이지별 rerun 지연")
+    rows = [
+        {"페이지": page, **{k: v for k, v in summary.items() if k != "histogram"}}
+        for page, summary in page_summary.items()
+    ]
+    st.dataframe(pd.DataFrame(rows), hide_index=True, use_container_width=True)
+
+    page = st.selectbox("히스토그램 페이지", list(page_summary))
+    if page:
+        histogram = page_summary[page]["histogram"]
+        st.bar_chart(pd.Series(histogram, name="rerun 수"))
+
+
+def _render_log_writers():
+    """활동 로그 기록기(yamyam-ops, Firestore) 전송/버림 통계"""
+    st.subheader("📝 활동 로그 전송")
+    rows = [{"기록기": "yamyam-ops /activity-logs", **get_activity_log_stats()}]
+    try:
+        writer = get_firebase_logger().writer
+    except Exception:
+        # Firebase 설정이 없는 환경 (로컬 대역 서버 등)
+        writer = None
+    if writer is not None:
+        rows.append({"기록기": "Firestore", **writer.stats()})
+    st.dataframe(pd.DataFrame(rows), hide_index=True, use_container_width=True)
+
+    dedup = get_activity_deduplicator().stats()
+    st.caption(
+        f"현재 세션 Firestore 로그 요청 {dedup['received']}건 중 "
+        f"{dedup['suppressed']}건을 중복으로 생략 (저장 {dedup['logged']}건, page_dwell 포함)"
+    )
+
+
+def render():
+    """프로파일러 디버그 페이지 렌더링"""
+    st.title("⏱️ rerun 프로파일러")
+
+    _render_log_writers()
+
+    profiler = get_profiler()
+    page_summary = profiler.page_summary()
+    if not page_summary:
+        st.info(
+            "아직 기록된 rerun이 없습니다. 다른 페이지를 사용한 뒤 다시 열어주세요."
+        )
+        return
+
+    _render_page_latency(page_summary)
+
+    page_filter = st.selectbox("페이지 필터", ["전체", *page_summary])
+    page = None if page_filter == "전체" else page_filter
+
+    st.subheader("🔍 구간별 지연")
+    spans = profiler.span_summary(page)
+    if spans:
+        st.dataframe(pd.DataFrame(spans), hide_index=True, use_container_width=True)
+
+    st.subheader("🗄️ 캐시 적중")
+    caches = profiler.cache_summary(page)
+    if caches:
+        st.dataframe(pd.DataFrame(caches), hide_index=True, use_container_width=True)
+    else:
+        st.caption("기록된 캐시 조회가 없습니다.")
+
+    st.subheader("📥 Chrome trace 내보내기")
+    st.caption("chrome://tracing 또는 https://ui.perfetto.dev 에서 열 수 있습니다.")
+    traces = profiler.recent_traces()
+    col1, col2 = st.columns(2)
+    with col1:
+        st.download_button(
+            f"최근 rerun {len(traces)}개 다운로드",
+            data=json.dumps(profiler.chrome_trace(traces), ensure_ascii=False),
+            file_name="what2eat-trace.json",
+            mime="application/json",
+            use_container_width=True,
+        )
+    with col2:
+        if st.button("집계 초기화", use_container_width=True):
+            profiler.clear()
+            st.rerun()
@@ -69,7 +69,7 @@ def render():
     # 카테고리 선택
     from utils.category_manager import get_category_manager
 
-    category_manager = get_category_manager()
+    category_manager = get_category_manager(st.session_state.app)
     large_categories = category_manager.get_large_categories()
 
     category_names = ["전체"] + [cat["name"] for cat in large_categories]
@@ -94,11 +94,10 @@ def render():
         )
 
     # API를 통해 음식점 데이터 가져오기
-    import asyncio
-
     import pandas as pd
 
     from utils.api_client import get_yamyam_ops_client
+    from utils.async_runner import get_async_runner
 
     try:
         client = get_yamyam_ops_client()
@@ -107,9 +106,7 @@ def render():
             return
 
         # 비동기 API 호출
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        restaurants = loop.run_until_complete(
+        restaurants = get_async_runner().run(
             client.get_restaurants(
                 user_lat=user_lat,
                 user_lon=user_lon,
@@ -124,7 +121,6 @@ def render():
                 limit=100,
             )
         )
-        loop.close()
 
         if not restaurants:
             st.warning("⚠️ 조건에 맞는 음식점이 없습니다.")
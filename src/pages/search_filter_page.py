@@ -5,12 +5,17 @@ import pandas as pd
 import streamlit as st
 
 from pages import search_map_page
-from utils.api import APIRequester
 from utils.app import What2EatApp
 from utils.auth import get_current_user, get_user_personalization_status
 from utils.dialogs import change_location
 from utils.firebase_logger import get_firebase_logger
-from utils.search_filter import SearchFilter
+from utils.profiler import profiled
+from utils.search_filter import (
+    SearchFilter,
+    apply_personal_ranking,
+    filter_by_radius,
+    request_personal_ranking,
+)
 
 
 def _log_user_activity(activity_type: str, detail: dict) -> bool:
@@ -137,7 +142,7 @@ def render_filter_ui(app: What2EatApp, search_filter: SearchFilter):
         # 대분류 카테고리 (API에서 가져오기)
         from utils.category_manager import get_category_manager
 
-        category_manager = get_category_manager()
+        category_manager = get_category_manager(app)
         large_categories_data = category_manager.get_large_categories()
         large_categories = [cat["name"] for cat in large_categories_data]
 
@@ -239,6 +244,7 @@ def render_filter_ui(app: What2EatApp, search_filter: SearchFilter):
     return False
 
 
+@profiled("render_restaurant_dataframe")
 def render_restaurant_dataframe(df_results, total_count=None):
     """음식점 목록을 DataFrame으로 렌더링"""
     if total_count is None:
@@ -539,12 +545,6 @@ def render():
                 else:
                     st.error("❌ 필터링된 음식점을 가져올 수 없습니다.")
                     return
-            diner_id_to_idx = dict(
-                zip(
-                    st.session_state.filtered_restaurant_ids_all,
-                    st.session_state.filtered_restaurant_idx_all,
-                )
-            )
             # 클라이언트 사이드에서 사용자가 선택한 반경으로 필터링
             user_radius_km = filters["radius_km"]
 
@@ -553,27 +553,17 @@ def render():
                 st.error("❌ 필터링된 음식점 데이터가 없습니다.")
                 return
 
-            filtered_diner_ids = [
-                diner_id
-                for diner_id in st.session_state.filtered_restaurant_ids_all
-                if st.session_state.filtered_distance_id_mapping_all.get(
-                    diner_id, float("inf")
-                )
-                <= user_radius_km
-            ]
-            filtered_diner_idx = [
-                diner_id_to_idx[diner_id] for diner_id in filtered_diner_ids
-            ]
-            filtered_distance_id_mapping = {
-                diner_id: st.session_state.filtered_distance_id_mapping_all[diner_id]
-                for diner_id in filtered_diner_ids
-            }
-            filtered_distance_idx_mapping = {
-                diner_id_to_idx[
-                    diner_id
-                ]: st.session_state.filtered_distance_id_mapping_all[diner_id]
-                for diner_id in filtered_diner_ids
-            }
+            (
+                filtered_diner_ids,
+                filtered_diner_idx,
+                filtered_distance_id_mapping,
+                filtered_distance_idx_mapping,
+            ) = filter_by_radius(
+                st.session_state.filtered_restaurant_ids_all,
+                st.session_state.filtered_restaurant_idx_all,
+                st.session_state.filtered_distance_id_mapping_all,
+                user_radius_km,
+            )
 
             # 필터링된 결과 사용
             diner_ids = filtered_diner_ids
@@ -610,43 +600,16 @@ def render():
 
                     if all_df_results is not None and len(all_df_results) > 0:
                         # Call personal recommendation API
-                        api = APIRequester(endpoint=st.secrets["API_URL"])
-                        response = api.post(
-                            "/rec/personal",
-                            data={
-                                "diner_ids": diner_idx_list,
-                                "firebase_uid": firebase_uid,
-                            },
-                        ).json()
-
-                        personalized_diner_ids = response["diner_ids"]
-                        personalized_scores = response["scores"]
-
-                        # Handle case where response has fewer items than original
-                        if len(personalized_diner_ids) < len(diner_idx_list):
-                            # Get remaining diner_ids not in personalized response
-                            # These diners are **cold-start** diners, not in train data
-                            remaining_ids = [
-                                id
-                                for id in diner_idx_list
-                                if id not in personalized_diner_ids
-                            ]
-                            # Combine personalized + remaining in original order
-                            final_diner_ids = personalized_diner_ids + remaining_ids
-                            scores = personalized_scores + ["NA"] * len(remaining_ids)
-                        else:
-                            final_diner_ids = personalized_diner_ids.copy()
-                            scores = personalized_scores.copy()
+                        response = request_personal_ranking(
+                            st.secrets["API_URL"], diner_idx_list, firebase_uid
+                        )
 
                         # Reorder all_df_results based on personalized order
-                        all_df_results = (
-                            all_df_results.set_index("diner_idx")
-                            .reindex(final_diner_ids)
-                            .reset_index()
-                        )
-                        all_df_results["personalized_score"] = scores
-                        all_df_results["distance"] = all_df_results["id"].map(
-                            st.session_state.filtered_distance_id_mapping
+                        # (cold-start 음식점은 원래 순서대로 뒤에 추가)
+                        all_df_results = apply_personal_ranking(
+                            all_df_results,
+                            response,
+                            st.session_state.filtered_distance_id_mapping,
                         )
                         # 전체 결과를 세션 상태에 저장 (페이지네이션을 위해)
                         st.session_state.personalized_all_results = all_df_results
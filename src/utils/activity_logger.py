@@ -3,14 +3,109 @@
 ML 추천 모델 학습을 위한 사용자 행동 데이터 수집
 """
 
+import asyncio
 import logging
+import threading
 import uuid
-from typing import Optional
+from typing import Any, Optional
 
 import streamlit as st
 
+from config.constants import (
+    ACTIVITY_LOG_BATCH_SIZE,
+    ACTIVITY_LOG_DROP_POLICY,
+    ACTIVITY_LOG_FLUSH_INTERVAL_MS,
+    ACTIVITY_LOG_MAX_RETRIES,
+    ACTIVITY_LOG_QUEUE_MAX,
+    ACTIVITY_LOG_SHUTDOWN_TIMEOUT,
+)
+from utils.async_runner import get_async_runner
+from utils.batch_writer import BatchWriter
+
 logger = logging.getLogger(__name__)
 
+# 프로세스 전역 활동 로그 기록기 (모든 세션의 이벤트를 모아 세션별로 묶어 전송)
+_activity_writer: Optional[BatchWriter] = None
+_activity_writer_lock = threading.Lock()
+# 요청 수 통계 (기록 스레드에서만 갱신)
+_request_stats = {"requests": 0}
+
+
+def _send_batch(events: list[tuple[str, str, dict[str, Any]]]) -> int:
+    """
+    (API URL, 토큰, 로그) 리스트를 세션(토큰)별로 묶어 전송하고 전송 성공 수 반환
+
+    BatchWriter의 기록 스레드에서 호출되며, 세션별 전송은 공유 이벤트 루프에서 동시에 실행합니다.
+    """
+    from utils.api_client import YamYamOpsClient
+
+    groups: dict[tuple[str, str], list[dict[str, Any]]] = {}
+    for api_url, token, log_data in events:
+        groups.setdefault((api_url, token), []).append(log_data)
+
+    async def _send_all() -> list[tuple[int, int]]:
+        return await asyncio.gather(
+            *(
+                YamYamOpsClient(api_url, token=token).send_activity_logs(logs)
+                for (api_url, token), logs in groups.items()
+            )
+        )
+
+    results = get_async_runner().run(_send_all())
+    _request_stats["requests"] += sum(requests for _, requests in results)
+    sent = sum(sent for sent, _ in results)
+    logger.debug(f"활동 로그 전송: {sent}/{len(events)}건, 세션 {len(groups)}개")
+    return sent
+
+
+def get_activity_log_writer() -> BatchWriter:
+    """활동 로그 기록기 싱글톤 인스턴스 반환"""
+    global _activity_writer
+    if _activity_writer is None:
+        with _activity_writer_lock:
+            if _activity_writer is None:
+                _activity_writer = BatchWriter(
+                    _send_batch,
+                    batch_size=ACTIVITY_LOG_BATCH_SIZE,
+                    flush_interval_ms=ACTIVITY_LOG_FLUSH_INTERVAL_MS,
+                    max_queue=ACTIVITY_LOG_QUEUE_MAX,
+                    drop_policy=ACTIVITY_LOG_DROP_POLICY,
+                    max_retries=ACTIVITY_LOG_MAX_RETRIES,
+                    shutdown_timeout=ACTIVITY_LOG_SHUTDOWN_TIMEOUT,
+                    name="what2eat-activity-logger",
+                )
+    return _activity_writer
+
+
+def get_activity_log_stats() -> dict[str, Any]:
+    """
+    활동 로그 전송 통계
+
+    Returns:
+        BatchWriter.stats() (enqueued, written(전송 성공), dropped, failed, ...)
+        + requests(보낸 HTTP 요청 수), bulk_supported(일괄 엔드포인트 지원 여부)
+    """
+    from utils.api_client import YamYamOpsClient
+
+    return {
+        **get_activity_log_writer().stats(),
+        **_request_stats,
+        "bulk_supported": YamYamOpsClient._bulk_activity_logs_supported,
+    }
+
+
+def flush_on_page_change(page: str):
+    """
+    페이지가 바뀌었으면 대기 중인 활동 로그 전송을 요청 (전송을 기다리지 않음)
+
+    Args:
+        page: 현재 페이지 (url_path)
+    """
+    previous = st.session_state.get("activity_log_page")
+    st.session_state.activity_log_page = page
+    if previous is not None and previous != page and _activity_writer is not None:
+        _activity_writer.flush(timeout=0)
+
 
 class ActivityLogger:
     """사용자 활동 로깅 클래스"""
@@ -45,14 +140,17 @@ class ActivityLogger:
             logger.error(f"Firebase UID 가져오기 실패: {e}")
         return None
 
-    async def _log_event(
+    def _log_event(
         self,
         event_type: str,
         page: str,
         **kwargs,
     ) -> bool:
         """
-        이벤트 로그 전송
+        이벤트 로그를 전송 대기열에 추가 (전송을 기다리지 않음)
+
+        세션 정보(UID, 토큰)는 호출 스레드에서 읽어 이벤트에 담고, 전송은 활동 로그 기록기가
+        크기/시간/페이지 전환 기준으로 세션별로 묶어 처리합니다.
 
         Args:
             event_type: 이벤트 유형
@@ -60,7 +158,7 @@ class ActivityLogger:
             **kwargs: 추가 데이터
 
         Returns:
-            성공 여부
+            대기열 추가 여부
         """
         try:
             firebase_uid = self._get_firebase_uid()
@@ -74,6 +172,9 @@ class ActivityLogger:
             if not client:
                 logger.warning("API 클라이언트를 초기화할 수 없습니다.")
                 return False
+            if not client.token:
+                logger.warning("인증 토큰이 없어 로그를 전송하지 않습니다.")
+                return False
 
             log_data = {
                 "firebase_uid": firebase_uid,
@@ -83,18 +184,10 @@ class ActivityLogger:
                 **kwargs,
             }
 
-            # API 호출
-            result = await client._make_request(
-                "POST", "/activity-logs/", data=log_data
+            return get_activity_log_writer().put(
+                (client.base_url, client.token, log_data)
             )
 
-            if result:
-                logger.info(f"로그 전송 성공: {event_type} on {page}")
-                return True
-            else:
-                logger.warning(f"로그 전송 실패: {event_type} on {page}")
-                return False
-
         except Exception as e:
             logger.error(f"로그 전송 중 오류: {e}")
             return False
@@ -109,23 +202,16 @@ class ActivityLogger:
         page: str = "onboarding",
     ):
         """위치 검색 로그"""
-        import asyncio
-
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            loop.run_until_complete(
-                self._log_event(
-                    event_type="location_search",
-                    page=page,
-                    location_query=query,
-                    location_address=address,
-                    location_lat=lat,
-                    location_lon=lon,
-                    location_method=method,
-                )
+            self._log_event(
+                event_type="location_search",
+                page=page,
+                location_query=query,
+                location_address=address,
+                location_lat=lat,
+                location_lon=lon,
+                location_method=method,
             )
-            loop.close()
         except Exception as e:
             logger.error(f"위치 검색 로그 실패: {e}")
 
@@ -138,22 +224,15 @@ class ActivityLogger:
         page: str = "onboarding",
     ):
         """위치 설정 완료 로그"""
-        import asyncio
-
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            loop.run_until_complete(
-                self._log_event(
-                    event_type="location_set",
-                    page=page,
-                    location_address=address,
-                    location_lat=lat,
-                    location_lon=lon,
-                    location_method=method,
-                )
+            self._log_event(
+                event_type="location_set",
+                page=page,
+                location_address=address,
+                location_lat=lat,
+                location_lon=lon,
+                location_method=method,
             )
-            loop.close()
         except Exception as e:
             logger.error(f"위치 설정 로그 실패: {e}")
 
@@ -171,45 +250,31 @@ class ActivityLogger:
         page: str = "search_filter",
     ):
         """검색 필터 변경 로그"""
-        import asyncio
-
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            loop.run_until_complete(
-                self._log_event(
-                    event_type="filter_change",
-                    page=page,
-                    location_address=address,
-                    location_lat=lat,
-                    location_lon=lon,
-                    location_method=location_method,
-                    search_radius_km=radius,
-                    selected_large_categories=large_categories,
-                    selected_middle_categories=middle_categories,
-                    sort_by=sort_by,
-                    period=period,
-                )
+            self._log_event(
+                event_type="filter_change",
+                page=page,
+                location_address=address,
+                location_lat=lat,
+                location_lon=lon,
+                location_method=location_method,
+                search_radius_km=radius,
+                selected_large_categories=large_categories,
+                selected_middle_categories=middle_categories,
+                sort_by=sort_by,
+                period=period,
             )
-            loop.close()
         except Exception as e:
             logger.error(f"필터 변경 로그 실패: {e}")
 
     def log_sort_change(self, sort_by: str, page: str = "search_filter"):
         """정렬 방식 변경 로그"""
-        import asyncio
-
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            loop.run_until_complete(
-                self._log_event(
-                    event_type="sort_change",
-                    page=page,
-                    sort_by=sort_by,
-                )
+            self._log_event(
+                event_type="sort_change",
+                page=page,
+                sort_by=sort_by,
             )
-            loop.close()
         except Exception as e:
             logger.error(f"정렬 변경 로그 실패: {e}")
 
@@ -220,20 +285,13 @@ class ActivityLogger:
         page: str = "search_filter",
     ):
         """카테고리 선택 로그"""
-        import asyncio
-
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            loop.run_until_complete(
-                self._log_event(
-                    event_type="category_select",
-                    page=page,
-                    selected_large_categories=large_categories,
-                    selected_middle_categories=middle_categories,
-                )
+            self._log_event(
+                event_type="category_select",
+                page=page,
+                selected_large_categories=large_categories,
+                selected_middle_categories=middle_categories,
             )
-            loop.close()
         except Exception as e:
             logger.error(f"카테고리 선택 로그 실패: {e}")
 
@@ -245,21 +303,14 @@ class ActivityLogger:
         page: str = "search_filter",
     ):
         """음식점 클릭 로그"""
-        import asyncio
-
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            loop.run_until_complete(
-                self._log_event(
-                    event_type="diner_click",
-                    page=page,
-                    clicked_diner_idx=diner_idx,
-                    clicked_diner_name=diner_name,
-                    display_position=position,
-                )
+            self._log_event(
+                event_type="diner_click",
+                page=page,
+                clicked_diner_idx=diner_idx,
+                clicked_diner_name=diner_name,
+                display_position=position,
             )
-            loop.close()
         except Exception as e:
             logger.error(f"음식점 클릭 로그 실패: {e}")
 
@@ -272,27 +323,18 @@ class ActivityLogger:
         middle_category: Optional[str] = None,
     ):
         """랭킹 페이지 조회 로그"""
-        import asyncio
-
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            loop.run_until_complete(
-                self._log_event(
-                    event_type="ranking_view",
-                    page="ranking",
-                    selected_city=city,
-                    selected_region=region,
-                    selected_grades=grades,
-                    selected_large_categories=[large_category]
-                    if large_category
-                    else None,
-                    selected_middle_categories=[middle_category]
-                    if middle_category
-                    else None,
-                )
+            self._log_event(
+                event_type="ranking_view",
+                page="ranking",
+                selected_city=city,
+                selected_region=region,
+                selected_grades=grades,
+                selected_large_categories=[large_category] if large_category else None,
+                selected_middle_categories=[middle_category]
+                if middle_category
+                else None,
             )
-            loop.close()
         except Exception as e:
             logger.error(f"랭킹 조회 로그 실패: {e}")
 
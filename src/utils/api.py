@@ -3,6 +3,8 @@ from typing import Any, Optional
 
 import requests
 
+from utils.profiler import http_span_name, profile_span
+
 logger = logging.getLogger(__name__)
 
 
@@ -77,7 +79,8 @@ class APIRequester:
         request_headers = self._get_headers(headers, include_content_type=False)
 
         try:
-            response = requests.get(url, params=params, headers=request_headers)
+            with profile_span(http_span_name("GET", url), "http"):
+                response = requests.get(url, params=params, headers=request_headers)
             response.raise_for_status()
             return response
         except requests.exceptions.RequestException as e:
@@ -105,7 +108,8 @@ class APIRequester:
         request_headers = self._get_headers(headers)
 
         try:
-            response = requests.post(url, json=data, headers=request_headers)
+            with profile_span(http_span_name("POST", url), "http"):
+                response = requests.post(url, json=data, headers=request_headers)
             response.raise_for_status()
             return response
         except requests.exceptions.RequestException as e:
@@ -135,9 +139,10 @@ class APIRequester:
         request_headers = self._get_headers(headers)
 
         try:
-            response = requests.put(
-                url, json=data, params=params, headers=request_headers
-            )
+            with profile_span(http_span_name("PUT", url), "http"):
+                response = requests.put(
+                    url, json=data, params=params, headers=request_headers
+                )
             response.raise_for_status()
             return response
         except requests.exceptions.RequestException as e:
@@ -3,6 +3,7 @@ yamyam-ops API 클라이언트
 Firebase 인증을 사용하여 yamyam-ops PostgreSQL과 통신
 """
 
+import asyncio
 import logging
 from datetime import datetime, timedelta
 from typing import Any, Optional
@@ -10,20 +11,38 @@ from typing import Any, Optional
 import httpx
 import streamlit as st
 
+from config.constants import (
+    ACTIVITY_LOG_BATCH_SIZE,
+    ACTIVITY_LOG_CONCURRENCY,
+    DINER_BATCH_SIZE,
+    DINER_DETAIL_CONCURRENCY,
+)
+from utils.diner_cache import get_diner_detail_cache
+from utils.http_pool import get_http_pool
+
 logger = logging.getLogger(__name__)
 
 
 class YamYamOpsClient:
     """yamyam-ops API 클라이언트"""
 
-    def __init__(self, base_url: str, timeout: float = 10.0):
+    # 배치 상세 조회 엔드포인트 지원 여부 (None: 미확인, False: 미지원), 프로세스 전역 공유
+    _batch_detail_supported: Optional[bool] = None
+    # 활동 로그 일괄 전송 엔드포인트 지원 여부 (None: 미확인, False: 미지원), 프로세스 전역 공유
+    _bulk_activity_logs_supported: Optional[bool] = None
+
+    def __init__(
+        self, base_url: str, timeout: float = 10.0, token: Optional[str] = None
+    ):
         """
         Args:
             base_url: yamyam-ops API 베이스 URL
             timeout: 요청 타임아웃 (초)
+            token: 미리 가져온 인증 토큰 (None이면 요청 시 세션에서 조회)
         """
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
+        self.token = token
 
     def _get_firebase_token(self) -> Optional[str]:
         """세션에서 JWT Access Token 또는 Firebase ID Token 가져오기 (yamyam-ops용)"""
@@ -170,7 +189,7 @@ class YamYamOpsClient:
         Returns:
             응답 데이터 또는 None (실패 시)
         """
-        token = self._get_firebase_token()
+        token = self.token or self._get_firebase_token()
         if not token:
             logger.error("Firebase token을 가져올 수 없습니다.")
             return None
@@ -181,25 +200,29 @@ class YamYamOpsClient:
             "Content-Type": "application/json",
         }
 
+        pool = get_http_pool()
+
         for attempt in range(max_retries):
             try:
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    if method.upper() == "GET":
-                        response = await client.get(url, headers=headers, params=params)
-                    elif method.upper() == "POST":
-                        response = await client.post(
-                            url, headers=headers, json=data, params=params
-                        )
-                    elif method.upper() == "PATCH":
-                        response = await client.patch(
-                            url, headers=headers, json=data, params=params
-                        )
-                    else:
-                        logger.error(f"지원하지 않는 HTTP 메서드: {method}")
-                        return None
+                if method.upper() == "GET":
+                    response = await pool.request(
+                        "GET", url, headers=headers, params=params, timeout=self.timeout
+                    )
+                elif method.upper() in ("POST", "PATCH"):
+                    response = await pool.request(
+                        method.upper(),
+                        url,
+                        headers=headers,
+                        json=data,
+                        params=params,
+                        timeout=self.timeout,
+                    )
+                else:
+                    logger.error(f"지원하지 않는 HTTP 메서드: {method}")
+                    return None
 
-                    response.raise_for_status()
-                    return response.json()
+                response.raise_for_status()
+                return response.json()
 
             except httpx.HTTPStatusError as e:
                 logger.error(
@@ -328,7 +351,7 @@ class YamYamOpsClient:
         large_categories: Optional[list[str]] = None,
         middle_categories: Optional[list[str]] = None,
         limit: Optional[int] = None,
-    ) -> tuple[list[str], list[int], dict[str, float]]:
+    ) -> tuple[list[str], list[int], dict[str, float], dict[int, float]]:
         """
         음식점 필터링 (지역/카테고리)
 
@@ -341,9 +364,9 @@ class YamYamOpsClient:
             limit: 최대 결과 수
 
         Returns:
-            (diner_ids 리스트, diner_idx 리스트, 거리 딕셔너리) 튜플
+            (diner_ids 리스트, diner_idx 리스트, 거리 딕셔너리, diner_idx별 거리 딕셔너리) 튜플
             거리 딕셔너리: {id: distance} 형식
-            결과가 없을 경우: ([], [], {})
+            결과가 없을 경우: ([], [], {}, {})
         """
         try:
             params = {
@@ -367,7 +390,7 @@ class YamYamOpsClient:
             )
 
             if not result:
-                return ([], [], {})
+                return ([], [], {}, {})
 
             # diner_ids 리스트와 거리 딕셔너리 추출
             diner_ids = [item["id"] for item in result]
@@ -381,7 +404,7 @@ class YamYamOpsClient:
 
         except Exception as e:
             logger.error(f"음식점 필터링 중 예외 발생: {e}")
-            return ([], [], {})
+            return ([], [], {}, {})
 
     async def sort_restaurants(
         self,
@@ -446,14 +469,277 @@ class YamYamOpsClient:
         Returns:
             음식점 정보 또는 None
         """
+
+        async def _fetch(idxs: list[str]) -> dict[str, dict[str, Any]]:
+            result = await self._make_request("GET", f"/kakao/diners/{idxs[0]}")
+            return {idxs[0]: result} if result else {}
+
         try:
-            result = await self._make_request("GET", f"/kakao/diners/{diner_idx}")
-            return result
+            found = await get_diner_detail_cache().get_many([str(diner_idx)], _fetch)
+            return found.get(str(diner_idx))
 
         except Exception as e:
             logger.error(f"음식점 상세 조회 중 예외 발생: {e}")
             return None
 
+    async def get_restaurants_by_idx(
+        self,
+        diner_idxs: list[int],
+        max_concurrency: int = DINER_DETAIL_CONCURRENCY,
+        timeout: Optional[float] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        여러 음식점 상세 일괄 조회
+
+        공유 캐시(DinerDetailCache)에 없는 ID만 조회합니다. 배치 엔드포인트
+        (POST /kakao/diners/batch)를 우선 사용하고, 백엔드가 지원하지 않으면 (404/405)
+        이를 기억해 두고 단건 조회를 동시에 실행합니다.
+
+        Args:
+            diner_idxs: 음식점 인덱스 리스트 (중복은 제거)
+            max_concurrency: 단건 조회 폴백 시 최대 동시 요청 수
+            timeout: 전체 최대 대기 시간 (초, 초과 시 도착한 결과만 반환)
+
+        Returns:
+            조회된 음식점 정보 리스트 (입력 순서 유지, 조회 실패한 ID는 제외)
+        """
+        idxs = list(
+            dict.fromkeys(str(idx) for idx in diner_idxs if idx not in (None, ""))
+        )
+        if not idxs:
+            return []
+
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+
+        def _remaining() -> Optional[float]:
+            """전체 마감까지 남은 시간 (timeout이 없으면 None)"""
+            return None if deadline is None else max(0.0, deadline - loop.time())
+
+        async def _fetch_missing(
+            missing: list[str],
+        ) -> dict[str, dict[str, Any]]:
+            found = None
+            if YamYamOpsClient._batch_detail_supported is not False:
+                found = await self._fetch_restaurants_batch(missing, _remaining())
+            if found is None:
+                # 배치 조회에 쓴 시간을 뺀 남은 시간 안에서만 단건 조회
+                remaining = _remaining()
+                if remaining == 0:
+                    logger.warning(
+                        "음식점 상세 조회 시간 초과: 단건 조회를 생략합니다."
+                    )
+                    return {}
+                found = await self._fetch_restaurants_concurrently(
+                    missing, max_concurrency, remaining
+                )
+            return found
+
+        try:
+            # 공유 캐시에 없는 ID만 조회 (다른 요청이 조회 중인 ID는 그 결과를 공유)
+            found = await get_diner_detail_cache().get_many(
+                idxs, _fetch_missing, timeout
+            )
+            return [found[idx] for idx in idxs if found.get(idx)]
+
+        except Exception as e:
+            logger.error(f"음식점 일괄 조회 중 예외 발생: {e}")
+            return []
+
+    def _detail_headers(self) -> dict[str, str]:
+        """상세 조회 요청 헤더 (토큰이 있으면 인증 헤더 포함)"""
+        headers = {"Content-Type": "application/json"}
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        return headers
+
+    async def _fetch_restaurants_batch(
+        self, idxs: list[str], timeout: Optional[float]
+    ) -> Optional[dict[str, dict[str, Any]]]:
+        """
+        배치 엔드포인트로 음식점 상세 조회
+
+        Returns:
+            {diner_idx: 음식점 정보} 딕셔너리 또는 None (배치 조회 불가 시)
+        """
+        pool = get_http_pool()
+        url = f"{self.base_url}/kakao/diners/batch"
+        found: dict[str, dict[str, Any]] = {}
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+
+        try:
+            for start in range(0, len(idxs), DINER_BATCH_SIZE):
+                chunk = idxs[start : start + DINER_BATCH_SIZE]
+                if deadline is not None:
+                    # 여러 배치 요청이 전체 timeout을 나눠 쓰도록 남은 시간만 사용
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        raise asyncio.TimeoutError("배치 상세 조회 시간 초과")
+                response = await pool.request(
+                    "POST",
+                    url,
+                    headers=self._detail_headers(),
+                    json={
+                        "diner_idxs": [
+                            int(idx) if idx.isdigit() else idx for idx in chunk
+                        ]
+                    },
+                    timeout=timeout or self.timeout,
+                )
+                if response.status_code in (404, 405):
+                    logger.info("배치 상세 조회 미지원: 단건 동시 조회로 전환합니다.")
+                    YamYamOpsClient._batch_detail_supported = False
+                    return None
+                response.raise_for_status()
+                YamYamOpsClient._batch_detail_supported = True
+
+                for diner in response.json() or []:
+                    found[str(diner.get("diner_idx"))] = diner
+            return found
+
+        except Exception as e:
+            logger.warning(f"배치 상세 조회 실패, 단건 조회로 재시도: {e}")
+            return None
+
+    async def _fetch_restaurants_concurrently(
+        self, idxs: list[str], max_concurrency: int, timeout: Optional[float]
+    ) -> dict[str, dict[str, Any]]:
+        """단건 상세 조회를 동시에 실행 (timeout 초과 시 남은 요청 취소)"""
+        pool = get_http_pool()
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _fetch_one(idx: str) -> Optional[dict[str, Any]]:
+            try:
+                async with semaphore:
+                    response = await pool.request(
+                        "GET",
+                        f"{self.base_url}/kakao/diners/{idx}",
+                        headers=self._detail_headers(),
+                        timeout=timeout or self.timeout,
+                    )
+                if response.status_code == 200:
+                    return response.json()
+                return None
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"음식점 상세 조회 실패 (diner_idx: {idx}): {e}")
+                return None
+
+        tasks = {idx: asyncio.create_task(_fetch_one(idx)) for idx in idxs}
+        done, pending = await asyncio.wait(tasks.values(), timeout=timeout)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+            logger.warning(f"음식점 상세 조회 시간 초과: {len(pending)}건 취소")
+
+        return {
+            idx: task.result()
+            for idx, task in tasks.items()
+            if task in done and task.result()
+        }
+
+    async def send_activity_logs(
+        self,
+        logs: list[dict[str, Any]],
+        max_concurrency: int = ACTIVITY_LOG_CONCURRENCY,
+    ) -> tuple[int, int]:
+        """
+        활동 로그 여러 건 전송
+
+        일괄 엔드포인트(POST /activity-logs/bulk)를 우선 사용하고, 백엔드가 지원하지 않으면
+        (404/405) 이를 기억해 두고 POST /activity-logs/ 단건 요청을 동시에 실행합니다.
+
+        Args:
+            logs: 활동 로그 리스트 (같은 사용자/세션의 로그)
+            max_concurrency: 단건 전송 폴백 시 최대 동시 요청 수
+
+        Returns:
+            (전송에 성공한 로그 수, 보낸 요청 수)
+        """
+        if not logs:
+            return 0, 0
+
+        if YamYamOpsClient._bulk_activity_logs_supported is not False:
+            result = await self._send_activity_logs_bulk(logs)
+            if result is not None:
+                return result
+        return await self._send_activity_logs_concurrently(logs, max_concurrency)
+
+    async def _send_activity_logs_bulk(
+        self, logs: list[dict[str, Any]]
+    ) -> Optional[tuple[int, int]]:
+        """
+        일괄 엔드포인트로 활동 로그 전송
+
+        Returns:
+            (전송 성공 로그 수, 요청 수) 또는 None (일괄 전송 미지원 시)
+        """
+        pool = get_http_pool()
+        url = f"{self.base_url}/activity-logs/bulk"
+        sent = requests = 0
+
+        for start in range(0, len(logs), ACTIVITY_LOG_BATCH_SIZE):
+            chunk = logs[start : start + ACTIVITY_LOG_BATCH_SIZE]
+            try:
+                response = await pool.request(
+                    "POST",
+                    url,
+                    headers=self._detail_headers(),
+                    json={"logs": chunk},
+                    timeout=self.timeout,
+                )
+                requests += 1
+                if response.status_code in (404, 405):
+                    logger.info(
+                        "활동 로그 일괄 전송 미지원: 단건 동시 전송으로 전환합니다."
+                    )
+                    YamYamOpsClient._bulk_activity_logs_supported = False
+                    if sent:
+                        # 이미 보낸 청크는 제외하고 남은 로그만 단건으로 전송
+                        (
+                            rest_sent,
+                            rest_requests,
+                        ) = await self._send_activity_logs_concurrently(
+                            logs[start:], ACTIVITY_LOG_CONCURRENCY
+                        )
+                        return sent + rest_sent, requests + rest_requests
+                    return None
+                response.raise_for_status()
+                YamYamOpsClient._bulk_activity_logs_supported = True
+                sent += len(chunk)
+            except Exception as e:
+                logger.error(f"활동 로그 일괄 전송 실패 ({len(chunk)}건): {e}")
+        return sent, requests
+
+    async def _send_activity_logs_concurrently(
+        self, logs: list[dict[str, Any]], max_concurrency: int
+    ) -> tuple[int, int]:
+        """활동 로그 단건 전송을 동시에 실행"""
+        pool = get_http_pool()
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _send_one(log: dict[str, Any]) -> bool:
+            try:
+                async with semaphore:
+                    response = await pool.request(
+                        "POST",
+                        f"{self.base_url}/activity-logs/",
+                        headers=self._detail_headers(),
+                        json=log,
+                        timeout=self.timeout,
+                    )
+                response.raise_for_status()
+                return True
+            except Exception as e:
+                logger.error(f"활동 로그 전송 실패 ({log.get('event_type')}): {e}")
+                return False
+
+        results = await asyncio.gather(*(_send_one(log) for log in logs))
+        return sum(results), len(logs)
+
     async def search_restaurants(
         self,
         query: str,
@@ -553,7 +839,11 @@ class YamYamOpsClient:
             return None
 
     async def save_onboarding_data(
-        self, profile_data: dict[str, Any], ratings_data: dict[str, int]
+        self,
+        profile_data: dict[str, Any],
+        ratings_data: dict[str, int],
+        user_lat: Optional[float] = None,
+        user_lon: Optional[float] = None,
     ) -> bool:
         """
         온보딩 완료 시 프로필 데이터를 PostgreSQL에 저장
@@ -561,6 +851,8 @@ class YamYamOpsClient:
         Args:
             profile_data: 온보딩 프로필 데이터
             ratings_data: 음식점 평가 데이터
+            user_lat: 사용자 위도
+            user_lon: 사용자 경도
 
         Returns:
             성공 여부
@@ -570,8 +862,8 @@ class YamYamOpsClient:
             onboarding_data = {
                 "location": profile_data.get("location"),
                 "location_method": profile_data.get("location_method"),
-                "user_lat": st.session_state.get("user_lat"),
-                "user_lon": st.session_state.get("user_lon"),
+                "user_lat": user_lat,
+                "user_lon": user_lon,
                 "birth_year": profile_data.get("birth_year"),
                 "gender": profile_data.get("gender"),
                 "dining_companions": profile_data.get("dining_companions"),
@@ -610,7 +902,11 @@ def get_yamyam_ops_client() -> Optional[YamYamOpsClient]:
             logger.warning("API_URL이 설정되지 않았습니다.")
             return None
 
-        return YamYamOpsClient(api_url)
+        client = YamYamOpsClient(api_url)
+        # 요청은 백그라운드 이벤트 루프 스레드에서 실행되어 세션 상태에 접근할 수 없으므로
+        # 토큰을 호출 스레드(Streamlit 스크립트 스레드)에서 미리 가져와 둔다
+        client.token = client._get_firebase_token()
+        return client
 
     except Exception as e:
         logger.error(f"yamyam-ops 클라이언트 초기화 실패: {e}")
@@ -1,13 +1,30 @@
 # src/utils/api_data_loader.py
 """API를 통한 데이터 로딩 유틸리티"""
 
+import asyncio
+import logging
 import os
-from typing import Optional
+from collections.abc import AsyncIterator, Iterator
+from typing import Any, Callable, Optional
 
+import httpx
 import pandas as pd
-import requests
 import streamlit as st
 
+from config.constants import (
+    CATALOG_FETCH_CONCURRENCY,
+    CATALOG_PAGE_SIZE,
+    CATALOG_PAGE_TIMEOUT,
+)
+from utils.async_runner import get_async_runner
+from utils.diner_store import DinerStore, DinerStoreBuilder
+from utils.http_pool import get_http_pool
+
+logger = logging.getLogger(__name__)
+
+# 페이지 조회 재시도 횟수
+CATALOG_PAGE_RETRIES = 3
+
 
 def get_api_url() -> str:
     """
@@ -23,6 +40,235 @@ def get_api_url() -> str:
     return os.getenv("API_URL")
 
 
+async def _fetch_page(
+    url: str,
+    params: dict[str, Any],
+    offset: int,
+    size: int,
+    timeout: float,
+) -> list[dict[str, Any]]:
+    """
+    음식점 목록 한 페이지 조회 (네트워크 오류/5xx는 재시도)
+
+    Returns:
+        음식점 딕셔너리 리스트
+    """
+    pool = get_http_pool()
+    page_params = {**params, "limit": size, "offset": offset}
+    for attempt in range(CATALOG_PAGE_RETRIES):
+        try:
+            response = await pool.request(
+                "GET", url, params=page_params, timeout=timeout
+            )
+            response.raise_for_status()
+            records = response.json()
+            if not isinstance(records, list):
+                raise ValueError(f"페이지 응답 형식 오류 (offset={offset})")
+            return records
+        except (httpx.TransportError, httpx.HTTPStatusError) as e:
+            retryable = isinstance(e, httpx.TransportError) or (
+                e.response.status_code >= 500
+            )
+            if not retryable or attempt == CATALOG_PAGE_RETRIES - 1:
+                raise
+            logger.warning(f"페이지 조회 재시도 (offset={offset}): {e}")
+            await asyncio.sleep(0.5 * 2**attempt)
+    return []
+
+
+async def aiter_diner_pages(
+    api_url: str,
+    params: Optional[dict[str, Any]] = None,
+    page_size: int = CATALOG_PAGE_SIZE,
+    max_concurrency: int = CATALOG_FETCH_CONCURRENCY,
+    limit: Optional[int] = None,
+    timeout: float = CATALOG_PAGE_TIMEOUT,
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """
+    /kakao/diners/ 를 limit/offset 페이지로 조회하여 offset 순서대로 반환
+
+    첫 페이지를 단독으로 요청해 서버가 limit을 지키는지(요청한 크기 이하인지) 확인한 뒤,
+    최대 max_concurrency개의 페이지를 미리 요청해 두고(슬라이딩 윈도우) 가장 앞선 페이지가
+    도착하는 대로 반환합니다. 요청한 크기보다 짧은 페이지를 받으면 그 이후 페이지는 취소합니다.
+    서버가 limit을 무시하고 더 많은 레코드를 주면 첫 응답만 사용합니다.
+
+    Args:
+        api_url: API 베이스 URL
+        params: 추가 쿼리 파라미터 (카테고리, 최소 평점 등)
+        page_size: 페이지당 레코드 수
+        max_concurrency: 동시에 진행할 최대 페이지 요청 수
+        limit: 가져올 최대 레코드 수 (None이면 전체)
+        timeout: 페이지 요청 타임아웃 (초)
+
+    Yields:
+        페이지별 음식점 딕셔너리 리스트
+    """
+    url = f"{api_url}/kakao/diners/"
+    params = dict(params or {})
+    total = limit
+    tasks: dict[int, asyncio.Task] = {}
+    next_offset = 0
+    end_offset: Optional[int] = None
+    first_ids: set = set()
+
+    def page_length(offset: int) -> int:
+        return page_size if total is None else min(page_size, total - offset)
+
+    def schedule():
+        nonlocal next_offset
+        while len(tasks) < max_concurrency:
+            if end_offset is not None and next_offset >= end_offset:
+                return
+            if total is not None and next_offset >= total:
+                return
+            tasks[next_offset] = asyncio.create_task(
+                _fetch_page(url, params, next_offset, page_length(next_offset), timeout)
+            )
+            next_offset += page_size
+
+    try:
+        first_length = page_length(0)
+        if first_length <= 0:
+            return
+        records = await _fetch_page(url, params, 0, first_length, timeout)
+        if len(records) > first_length:
+            # limit을 무시하는 서버에 동시 요청하면 같은 데이터를 여러 번 받게 되므로 중단
+            logger.warning("API가 limit을 지원하지 않아 첫 응답만 사용합니다.")
+            yield records if total is None else records[:total]
+            return
+        if records:
+            first_ids.add(records[0].get("diner_idx"))
+            yield records
+        if len(records) < first_length:
+            return
+
+        offset = next_offset = page_size
+        schedule()
+        while offset in tasks:
+            records = await tasks.pop(offset)
+            if len(records) < page_length(offset):
+                # 마지막 페이지: 이후 offset 요청은 취소
+                end_offset = offset + len(records)
+                for pending_offset in [o for o in tasks if o >= end_offset]:
+                    tasks.pop(pending_offset).cancel()
+
+            if records:
+                # offset을 무시하는 서버라면 같은 페이지가 반복되므로 중단
+                first_id = records[0].get("diner_idx")
+                if first_id is not None and first_id in first_ids:
+                    logger.warning(
+                        "API가 offset을 지원하지 않아 페이지 조회를 중단합니다."
+                    )
+                    return
+                first_ids.add(first_id)
+                yield records
+
+            offset += page_size
+            schedule()
+    finally:
+        for task in tasks.values():
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+
+def _page_frame(records: list[dict[str, Any]]) -> pd.DataFrame:
+    """페이지 레코드를 DataFrame으로 변환 (기존 코드 호환 컬럼 추가)"""
+    df = pd.DataFrame.from_records(records)
+    # diner_url 컬럼이 없으면 생성
+    if "diner_url" not in df.columns and "diner_idx" in df.columns:
+        df["diner_url"] = (
+            "https://place.map.kakao.com/" + df["diner_idx"].astype(str)
+        ).where(df["diner_idx"].notna(), "")
+    return df
+
+
+def iter_diner_pages(
+    api_url: Optional[str] = None,
+    params: Optional[dict[str, Any]] = None,
+    page_size: int = CATALOG_PAGE_SIZE,
+    max_concurrency: int = CATALOG_FETCH_CONCURRENCY,
+    limit: Optional[int] = None,
+    timeout: float = CATALOG_PAGE_TIMEOUT,
+) -> Iterator[pd.DataFrame]:
+    """
+    음식점 카탈로그를 페이지 단위 DataFrame으로 순서대로 반환 (동기 이터레이터)
+
+    페이지 요청은 백그라운드 이벤트 루프에서 동시에 진행되므로, 호출자가 한 페이지를
+    처리하는 동안에도 다음 페이지들이 내려받아집니다.
+
+    Args:
+        api_url: API 베이스 URL (None이면 secrets에서 가져옴)
+        params: 추가 쿼리 파라미터
+        page_size: 페이지당 레코드 수
+        max_concurrency: 동시에 진행할 최대 페이지 요청 수
+        limit: 가져올 최대 레코드 수 (None이면 전체)
+        timeout: 페이지 요청 타임아웃 (초)
+
+    Yields:
+        페이지별 음식점 DataFrame
+    """
+    # secrets는 스크립트 스레드에서 미리 읽어 둠
+    if api_url is None:
+        api_url = get_api_url()
+
+    runner = get_async_runner()
+    pages = aiter_diner_pages(
+        api_url, params, page_size, max_concurrency, limit, timeout
+    )
+    done = object()
+
+    async def _next_page():
+        try:
+            return await pages.__anext__()
+        except StopAsyncIteration:
+            return done
+
+    try:
+        while True:
+            records = runner.run(_next_page())
+            if records is done:
+                return
+            yield _page_frame(records)
+    finally:
+        try:
+            runner.run(pages.aclose(), timeout=5.0)
+        except Exception as e:
+            logger.warning(f"페이지 조회 정리 실패: {e}")
+
+
+def stream_diner_store(
+    api_url: Optional[str] = None,
+    params: Optional[dict[str, Any]] = None,
+    limit: Optional[int] = None,
+    on_page: Optional[Callable[[pd.DataFrame, int], None]] = None,
+    **page_options: Any,
+) -> DinerStore:
+    """
+    음식점 카탈로그를 페이지 단위로 받아 DinerStore로 누적
+
+    전체 JSON을 한 번에 메모리에 올리지 않고 페이지마다 압축하여 누적하므로
+    원본 레코드는 진행 중인 몇 개 페이지만 메모리에 남습니다.
+
+    Args:
+        api_url: API 베이스 URL (None이면 secrets에서 가져옴)
+        params: 추가 쿼리 파라미터
+        limit: 가져올 최대 레코드 수 (None이면 전체)
+        on_page: 페이지를 받을 때마다 (페이지 DataFrame, 누적 행 수)로 호출되는 콜백
+            (다운로드가 끝나기 전에 첫 결과를 사용할 때 활용)
+        **page_options: iter_diner_pages에 전달할 옵션 (page_size, max_concurrency, timeout)
+
+    Returns:
+        DinerStore 인스턴스
+    """
+    builder = DinerStoreBuilder()
+    for page in iter_diner_pages(api_url, params, limit=limit, **page_options):
+        builder.append(page)
+        if on_page is not None:
+            on_page(page, builder.n_rows)
+    return builder.build()
+
+
 @st.cache_data(ttl=3600)  # 1시간 캐시
 def load_diners_from_api(
     api_url: Optional[str] = None,
@@ -34,6 +280,8 @@ def load_diners_from_api(
     """
     API에서 카카오 음식점 데이터를 가져옵니다.
 
+    /kakao/diners/ 를 페이지 단위로 동시에 조회하여 압축된 DataFrame으로 누적합니다.
+
     Args:
         api_url: API 베이스 URL (None이면 secrets에서 가져옴)
         category_large: 대분류 카테고리 (선택)
@@ -42,20 +290,11 @@ def load_diners_from_api(
         limit: 가져올 최대 레코드 수 (None이면 전체)
 
     Returns:
-        음식점 데이터프레임
+        음식점 데이터프레임 (카테고리 범주형, 좌표 float32)
     """
-    # api_url이 제공되지 않으면 secrets에서 가져오기
-    if api_url is None:
-        api_url = get_api_url()
-
     try:
-        # API 엔드포인트
-        endpoint = f"{api_url}/kakao/diners/"
-
         # 쿼리 파라미터 설정
         params = {}
-        if limit is not None:
-            params["limit"] = limit
         if category_large:
             params["diner_category_large"] = category_large
         if category_middle:
@@ -63,30 +302,16 @@ def load_diners_from_api(
         if min_rating is not None:
             params["min_rating"] = min_rating
 
-        # API 요청
-        response = requests.get(endpoint, params=params, timeout=60)
-        response.raise_for_status()
+        df = stream_diner_store(api_url, params, limit=limit).frame
 
-        # JSON 데이터를 DataFrame으로 변환
-        diners_data = response.json()
-
-        if not diners_data:
+        if df.empty:
             st.error("⚠️ API에서 데이터를 가져오지 못했습니다.")
             return pd.DataFrame()
 
-        df = pd.DataFrame(diners_data)
-
-        # 기존 코드와 호환되도록 컬럼 이름 확인 및 변환
-        # diner_url 컬럼이 없으면 생성
-        if "diner_url" not in df.columns and "diner_idx" in df.columns:
-            df["diner_url"] = df["diner_idx"].apply(
-                lambda x: f"https://place.map.kakao.com/{x}" if pd.notna(x) else ""
-            )
-
-        print(f"✅ API에서 {len(df)}개의 음식점 데이터를 로드했습니다.")
+        logger.info(f"API에서 {len(df)}개의 음식점 데이터를 로드했습니다.")
         return df
 
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         st.error(f"❌ API 요청 실패: {str(e)}")
         return pd.DataFrame()
     except Exception as e:
@@ -1,19 +1,24 @@
 # src/utils/app.py
 
-import pandas as pd
-import streamlit as st
-
+from utils.delta_sync import maybe_start_background_sync
+from utils.diner_store import get_diner_store
 from utils.map_renderer import MapRenderer
 from utils.search_manager import SearchManager
 from utils.session_state import get_session_state
 
 
-@st.cache_data
 def load_app_data():
-    """앱 데이터 로딩 (API 기반으로 변경됨, 레거시 호환성 유지)"""
-    # API 기반으로 변경되어 빈 DataFrame 반환
-    # 실제 데이터는 각 페이지에서 API를 통해 가져옴
-    return pd.DataFrame()
+    """
+    앱 데이터 로딩 (모든 세션이 공유하는 읽기 전용 음식점 DataFrame)
+
+    st.cache_data는 호출마다 DataFrame 복사본을 반환하므로, 프로세스 전역 DinerStore의
+    압축된 frame을 그대로 공유합니다. 로컬 데이터가 없으면 빈 DataFrame이며
+    실제 데이터는 각 페이지에서 API를 통해 가져옵니다.
+    증분 동기화가 반영되면 이후 세션부터 새 frame을 받습니다.
+    """
+    # 마지막 동기화 후 DINER_SYNC_INTERVAL이 지났으면 변경분만 백그라운드로 반영
+    maybe_start_background_sync()
+    return get_diner_store().frame
 
 
 class What2EatApp:
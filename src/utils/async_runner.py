@@ -0,0 +1,152 @@
+# src/utils/async_runner.py
+"""백그라운드 스레드에서 하나의 이벤트 루프를 유지하는 비동기 실행기"""
+
+import asyncio
+import atexit
+import concurrent.futures
+import logging
+import threading
+from collections.abc import Coroutine
+from typing import Any, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class AsyncRunner:
+    """
+    프로세스 전역 이벤트 루프 실행기
+
+    Streamlit 스크립트(동기 코드)에서 코루틴을 실행할 때마다 루프를 만들고 닫는 대신,
+    백그라운드 스레드의 루프 하나에 코루틴을 제출하고 결과를 기다립니다.
+    같은 루프를 계속 사용하므로 HTTP 연결 풀을 재사용하고 요청을 동시에 실행할 수 있습니다.
+
+    Note:
+        코루틴은 Streamlit 스크립트 스레드가 아닌 백그라운드 스레드에서 실행되므로
+        st.session_state 등 세션 정보는 제출 전에 호출 스레드에서 읽어 두어야 합니다.
+    """
+
+    def __init__(self, name: str = "what2eat-async-runner"):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run_loop, name=name, daemon=True)
+        self._thread.start()
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """실행기의 이벤트 루프"""
+        return self._loop
+
+    def is_running(self) -> bool:
+        """실행기 루프가 동작 중인지 확인"""
+        return self._thread.is_alive() and not self._loop.is_closed()
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> concurrent.futures.Future:
+        """
+        코루틴을 루프에 제출하고 결과를 기다리지 않고 Future 반환
+
+        Args:
+            coro: 실행할 코루틴
+
+        Returns:
+            concurrent.futures.Future
+        """
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError(
+                "실행기 루프 내부에서는 submit/run을 호출할 수 없습니다."
+            )
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+        """
+        코루틴을 실행하고 결과를 동기적으로 반환
+
+        Args:
+            coro: 실행할 코루틴
+            timeout: 최대 대기 시간 (초, None이면 무제한)
+
+        Returns:
+            코루틴 결과
+
+        Raises:
+            TimeoutError: timeout 내에 완료되지 않은 경우 (코루틴은 취소됨)
+        """
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise TimeoutError(f"비동기 작업이 {timeout}초 내에 완료되지 않았습니다.")
+
+    def gather(
+        self,
+        *coros: Coroutine[Any, Any, Any],
+        timeout: Optional[float] = None,
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """
+        여러 코루틴을 동시에 실행하고 결과를 입력 순서대로 반환
+
+        Args:
+            *coros: 실행할 코루틴들
+            timeout: 전체 최대 대기 시간 (초)
+            return_exceptions: True면 예외를 결과 리스트에 담아 반환
+
+        Returns:
+            결과 리스트
+        """
+
+        async def _gather():
+            return await asyncio.gather(*coros, return_exceptions=return_exceptions)
+
+        return self.run(_gather(), timeout)
+
+    def shutdown(self, timeout: float = 5.0):
+        """남은 작업을 취소하고 루프와 스레드 종료"""
+        if self._loop.is_closed():
+            return
+
+        async def _cancel_pending():
+            # 루프에 묶인 HTTP 연결 풀 클라이언트를 먼저 정리
+            from utils.http_pool import get_http_pool
+
+            await get_http_pool().aclose()
+
+            current = asyncio.current_task()
+            tasks = [task for task in asyncio.all_tasks() if task is not current]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        try:
+            if self._thread.is_alive():
+                asyncio.run_coroutine_threadsafe(_cancel_pending(), self._loop).result(
+                    timeout
+                )
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._thread.join(timeout)
+        except Exception as e:
+            logger.warning(f"비동기 실행기 종료 중 오류: {e}")
+        finally:
+            if not self._loop.is_running():
+                self._loop.close()
+
+
+_async_runner: Optional[AsyncRunner] = None
+_async_runner_lock = threading.Lock()
+
+
+def get_async_runner() -> AsyncRunner:
+    """프로세스 전역 AsyncRunner 싱글톤 반환"""
+    global _async_runner
+    if _async_runner is None or not _async_runner.is_running():
+        with _async_runner_lock:
+            if _async_runner is None or not _async_runner.is_running():
+                _async_runner = AsyncRunner()
+                atexit.register(_async_runner.shutdown)
+    return _async_runner
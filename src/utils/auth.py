@@ -9,6 +9,7 @@ from firebase_admin import auth, firestore
 
 from config.firebase_config import initialize_firebase_admin
 from utils.firebase_logger import get_firebase_logger
+from utils.profiler import profiled
 from utils.session_manager import get_session_manager
 
 
@@ -94,6 +95,7 @@ class AuthManager:
         st.session_state._cookie_restore_attempted = False
         st.session_state._cookie_restore_rerun = False
     
+    @profiled("auth.check_authentication")
     def check_authentication(self) -> bool:
         """세션의 인증 상태를 확인"""
         return self.session_manager.check_authentication()
@@ -243,21 +245,17 @@ class FirebaseAuth:
 
             # PostgreSQL에 사용자 동기화 (비동기 처리)
             try:
-                import asyncio
-
                 from utils.api_client import get_yamyam_ops_client
+                from utils.async_runner import get_async_runner
 
                 client = get_yamyam_ops_client()
                 if client:
                     # 비동기 함수를 동기적으로 실행
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    success = loop.run_until_complete(
+                    success = get_async_runner().run(
                         client.sync_user_from_firebase(
                             user.uid, user.email, user.display_name or email.split("@")[0]
                         )
                     )
-                    loop.close()
 
                     if success:
                         st.success("✅ 사용자 정보가 동기화되었습니다.")
@@ -699,19 +697,15 @@ def get_cached_user_info() -> Optional[Dict[str, Any]]:
             return None
         
         try:
-            import asyncio
-
             from utils.api_client import get_yamyam_ops_client
+            from utils.async_runner import get_async_runner
             
             client = get_yamyam_ops_client()
             if not client:
                 return None
             
             # 비동기 API 호출을 동기적으로 실행
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            user_data = loop.run_until_complete(client.get_current_user_info())
-            loop.close()
+            user_data = get_async_runner().run(client.get_current_user_info())
             
             if user_data:
                 # 캐시에 저장
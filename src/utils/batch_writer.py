@@ -0,0 +1,226 @@
+# src/utils/batch_writer.py
+"""로그 이벤트를 메모리 대기열에 모아 백그라운드 스레드에서 배치로 기록하는 기록기"""
+
+import atexit
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+DROP_POLICIES = ("drop_oldest", "drop_newest", "block")
+# 배치 기록 실패 시 첫 재시도 대기 시간 (재시도마다 2배)
+RETRY_BACKOFF_SECONDS = 0.2
+
+
+class BatchWriter:
+    """
+    백그라운드 배치 기록기
+
+    put()은 이벤트를 대기열에 넣고 바로 반환하며, 기록 스레드가 batch_size개가 모이거나
+    가장 오래된 이벤트가 flush_interval_ms 동안 기다리면 write_batch(items)를 호출합니다.
+    대기열이 max_queue에 도달하면 drop_policy에 따라 가장 오래된 이벤트를 버리거나
+    (drop_oldest), 새 이벤트를 버리거나(drop_newest), block_timeout 동안 자리가 나기를
+    기다린 뒤 버립니다(block). 프로세스 종료 시 남은 이벤트를 기록합니다.
+
+    Note:
+        write_batch는 기록 스레드에서 실행되므로 st.session_state 등 세션 정보는
+        put() 전에 호출 스레드에서 이벤트에 담아 두어야 합니다.
+    """
+
+    def __init__(
+        self,
+        write_batch: Callable[[list[Any]], Optional[int]],
+        batch_size: int = 100,
+        flush_interval_ms: float = 1000,
+        max_queue: int = 10000,
+        drop_policy: str = "drop_oldest",
+        block_timeout: float = 0.05,
+        max_retries: int = 3,
+        shutdown_timeout: float = 5.0,
+        name: str = "what2eat-batch-writer",
+    ):
+        """
+        Args:
+            write_batch: 이벤트 리스트를 기록하는 함수 (실패 시 예외 발생, 일부만 기록하면
+                기록한 이벤트 수 반환, 나머지는 재시도 없이 실패로 집계)
+            batch_size: 한 번에 기록할 최대 이벤트 수
+            flush_interval_ms: 이벤트가 대기열에서 기다리는 최대 시간 (ms)
+            max_queue: 대기열 최대 이벤트 수
+            drop_policy: 대기열이 가득 찼을 때 정책 (drop_oldest | drop_newest | block)
+            block_timeout: block 정책에서 자리를 기다리는 최대 시간 (초)
+            max_retries: 배치 기록 실패 시 재시도 횟수
+            shutdown_timeout: 종료 시 남은 이벤트 기록을 기다리는 최대 시간 (초)
+            name: 기록 스레드 이름
+        """
+        if drop_policy not in DROP_POLICIES:
+            logger.warning(
+                f"알 수 없는 drop_policy '{drop_policy}', drop_oldest를 사용합니다."
+            )
+            drop_policy = "drop_oldest"
+
+        self._write_batch = write_batch
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval_ms / 1000
+        self.max_queue = max(self.batch_size, max_queue)
+        self.drop_policy = drop_policy
+        self.block_timeout = block_timeout
+        self.max_retries = max_retries
+        self.shutdown_timeout = shutdown_timeout
+
+        # (대기열 진입 시각, 이벤트)
+        self._queue: deque[tuple[float, Any]] = deque()
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._flush_requested = False
+        self._closed = False
+        self._stats = {
+            "enqueued": 0,
+            "written": 0,
+            "dropped": 0,
+            "failed": 0,
+            "batches": 0,
+            "retries": 0,
+        }
+
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def put(self, item: Any) -> bool:
+        """
+        이벤트를 대기열에 추가 (기록을 기다리지 않음)
+
+        Args:
+            item: write_batch에 전달할 이벤트
+
+        Returns:
+            대기열 추가 여부 (종료되었거나 정책에 따라 버려지면 False)
+        """
+        with self._cond:
+            if self._closed:
+                self._stats["dropped"] += 1
+                return False
+
+            if len(self._queue) >= self.max_queue:
+                if self.drop_policy == "drop_oldest":
+                    self._queue.popleft()
+                    self._stats["dropped"] += 1
+                elif self.drop_policy == "block":
+                    self._cond.wait_for(
+                        lambda: len(self._queue) < self.max_queue or self._closed,
+                        timeout=self.block_timeout,
+                    )
+                if len(self._queue) >= self.max_queue or self._closed:
+                    self._stats["dropped"] += 1
+                    return False
+
+            self._queue.append((time.monotonic(), item))
+            self._stats["enqueued"] += 1
+            if len(self._queue) >= self.batch_size:
+                self._cond.notify_all()
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        대기 중인 이벤트를 즉시 기록하도록 요청하고 완료를 기다림
+
+        Args:
+            timeout: 최대 대기 시간 (초, 0이면 요청만 하고 바로 반환, None이면 무제한)
+
+        Returns:
+            timeout 내에 대기열이 모두 기록(또는 실패 처리)되었는지 여부
+        """
+        with self._cond:
+            self._flush_requested = True
+            self._cond.notify_all()
+            if timeout == 0:
+                return not self._queue and not self._in_flight
+            return self._cond.wait_for(
+                lambda: not self._queue and not self._in_flight, timeout=timeout
+            )
+
+    def close(self, timeout: Optional[float] = None):
+        """
+        새 이벤트를 받지 않고 남은 이벤트를 기록한 뒤 기록 스레드 종료
+
+        Args:
+            timeout: 최대 대기 시간 (초, None이면 shutdown_timeout)
+        """
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(self.shutdown_timeout if timeout is None else timeout)
+        if self._thread.is_alive():
+            logger.warning(
+                f"배치 기록기 종료 시간 초과: 이벤트 {len(self._queue)}개 미기록"
+            )
+
+    def stats(self) -> dict[str, int]:
+        """누적 통계 (enqueued, written, dropped, failed, batches, retries, queued)"""
+        with self._cond:
+            return {**self._stats, "queued": len(self._queue)}
+
+    def _ready(self) -> bool:
+        if not self._queue:
+            return False
+        return (
+            self._closed
+            or self._flush_requested
+            or len(self._queue) >= self.batch_size
+            or time.monotonic() - self._queue[0][0] >= self.flush_interval
+        )
+
+    def _next_batch(self) -> Optional[list[Any]]:
+        """기록할 배치를 꺼냄 (종료되었고 대기열이 비었으면 None)"""
+        with self._cond:
+            while not self._ready():
+                if self._closed:
+                    return None
+                if not self._queue:
+                    self._flush_requested = False
+                    self._cond.wait()
+                else:
+                    waited = time.monotonic() - self._queue[0][0]
+                    self._cond.wait(self.flush_interval - waited)
+
+            size = min(self.batch_size, len(self._queue))
+            batch = [self._queue.popleft()[1] for _ in range(size)]
+            self._in_flight = size
+            # block 정책으로 기다리는 put()을 깨움
+            self._cond.notify_all()
+            return batch
+
+    def _write_with_retry(self, batch: list[Any]) -> int:
+        """배치를 기록하고 기록된 이벤트 수 반환 (재시도를 모두 실패하면 0)"""
+        for attempt in range(self.max_retries + 1):
+            try:
+                written = self._write_batch(batch)
+                return len(batch) if written is None else written
+            except Exception as e:
+                if attempt == self.max_retries:
+                    logger.error(f"배치 기록 실패 (이벤트 {len(batch)}개 버림): {e}")
+                    return 0
+                with self._cond:
+                    self._stats["retries"] += 1
+                logger.warning(f"배치 기록 실패, 재시도 {attempt + 1}회: {e}")
+                time.sleep(RETRY_BACKOFF_SECONDS * 2**attempt)
+        return 0
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            written = self._write_with_retry(batch)
+            with self._cond:
+                self._in_flight = 0
+                self._stats["batches"] += 1
+                self._stats["written"] += written
+                self._stats["failed"] += len(batch) - written
+                self._cond.notify_all()
@@ -0,0 +1,356 @@
+# src/utils/category_index.py
+"""대/중/소분류 카테고리 행 역색인 기반 카테고리 필터링과 음식점 수 집계"""
+
+import logging
+from typing import Any, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from config.constants import CATEGORY_TABLE_PATH
+from utils.dataset_version import get_dataset_version
+from utils.index_delta import (
+    apply_posting_delta,
+    group_positions,
+    remember_index,
+    take_prepared_index,
+)
+
+logger = logging.getLogger(__name__)
+
+# 카테고리 단계 → 음식점 DataFrame 컬럼
+CATEGORY_LEVELS = {
+    "large": "diner_category_large",
+    "middle": "diner_category_middle",
+    "small": "diner_category_small",
+}
+
+# category_table.csv에서 음식점 카테고리 계층을 나타내는 업종
+RESTAURANT_INDUSTRY = "음식점"
+
+
+def _group_rows(values: np.ndarray) -> dict[str, np.ndarray]:
+    """값 배열을 {값: 행 위치 배열(오름차순)}으로 묶음 (결측값 제외)"""
+    codes, uniques = pd.factorize(values)
+    order = np.argsort(codes, kind="stable")
+    sorted_codes = codes[order]
+    valid = sorted_codes >= 0
+    order, sorted_codes = order[valid].astype(np.int32), sorted_codes[valid]
+    if len(order) == 0:
+        return {}
+    starts = np.flatnonzero(np.diff(sorted_codes)) + 1
+    names = [uniques[code] for code in sorted_codes[np.concatenate(([0], starts))]]
+    return dict(zip(names, np.split(order, starts)))
+
+
+def load_category_table(path: str = CATEGORY_TABLE_PATH) -> pd.DataFrame:
+    """
+    카테고리 계층 테이블 로드 (음식점 업종만)
+
+    Args:
+        path: category_table.csv 경로
+
+    Returns:
+        대/중/소분류 컬럼을 가진 DataFrame (로드 실패 시 빈 DataFrame)
+    """
+    try:
+        table = pd.read_csv(path, encoding="utf-8-sig")
+    except Exception as e:
+        logger.warning(f"카테고리 테이블 로드 실패: {e}")
+        return pd.DataFrame(columns=list(CATEGORY_LEVELS.values()))
+    if "industry_category" in table.columns:
+        table = table[table["industry_category"] == RESTAURANT_INDUSTRY]
+    return table
+
+
+class CategoryIndex:
+    """
+    카테고리 단계별 행 역색인
+
+    대/중/소분류 값마다 해당 음식점의 행 위치 배열을 미리 만들어 두고,
+    카테고리 조합은 행 위치 배열의 합집합(같은 단계)과 교집합(다른 단계)으로 계산합니다.
+    상위 카테고리별 하위 카테고리 목록은 category_table.csv 계층과 실제 데이터의 조합을
+    합쳐 만들며, 카테고리별 음식점 수도 같은 구조에서 바로 집계합니다.
+    """
+
+    def __init__(self, df: pd.DataFrame, category_table: Optional[pd.DataFrame] = None):
+        """
+        Args:
+            df: 음식점 DataFrame
+            category_table: 카테고리 계층 테이블 (None이면 category_table.csv 로드)
+        """
+        self.labels = df.index.to_numpy()
+        self.n_rows = len(df)
+
+        values = {}
+        self._rows: dict[str, dict[str, np.ndarray]] = {}
+        for level, column in CATEGORY_LEVELS.items():
+            if column in df.columns:
+                values[level] = df[column].to_numpy(dtype=object)
+            else:
+                values[level] = np.full(len(df), None, dtype=object)
+            self._rows[level] = _group_rows(values[level])
+
+        if category_table is None:
+            category_table = load_category_table()
+        self._children = self._build_hierarchy(values, category_table)
+
+        logger.info(
+            f"카테고리 역색인 생성 완료: {self.n_rows}개 음식점, "
+            + ", ".join(f"{level} {len(rows)}개" for level, rows in self._rows.items())
+        )
+
+    @staticmethod
+    def _build_hierarchy(
+        values: dict[str, np.ndarray], category_table: pd.DataFrame
+    ) -> dict[tuple[str, ...], set[str]]:
+        """
+        상위 카테고리 경로 → 하위 카테고리 집합
+
+        키는 (대분류,) 또는 (대분류, 중분류) 형태입니다.
+        """
+        children: dict[tuple[str, ...], set[str]] = {}
+        sources = [
+            pd.DataFrame(values),
+            category_table.rename(
+                columns={column: level for level, column in CATEGORY_LEVELS.items()}
+            ),
+        ]
+        for frame in sources:
+            for parents, child in (["large"], "middle"), (["large", "middle"], "small"):
+                columns = parents + [child]
+                if not set(columns) <= set(frame.columns):
+                    continue
+                pairs = frame[columns].dropna().drop_duplicates()
+                for row in pairs.itertuples(index=False):
+                    children.setdefault(tuple(row[:-1]), set()).add(row[-1])
+        return children
+
+    def apply_delta(
+        self, old_df: pd.DataFrame, new_df: pd.DataFrame, delta
+    ) -> "CategoryIndex":
+        """
+        행 변경을 반영한 새 역색인 생성 (변경 행이 속했던/속하는 카테고리만 다시 계산)
+
+        Args:
+            old_df: 이 역색인을 만든 DataFrame
+            new_df: 변경 후 DataFrame
+            delta: DinerStore.apply_delta가 반환한 행 위치 변경 정보
+
+        Returns:
+            CategoryIndex 인스턴스
+        """
+        index = CategoryIndex.__new__(CategoryIndex)
+        index.labels = new_df.index.to_numpy()
+        index.n_rows = len(new_df)
+        index._rows = {}
+
+        changed_values = {}
+        for level, column in CATEGORY_LEVELS.items():
+            if column not in new_df.columns:
+                index._rows[level] = {}
+                changed_values[level] = np.full(len(delta.changed), None, dtype=object)
+                continue
+            stale = []
+            if column in old_df.columns:
+                stale = old_df[column].iloc[delta.stale_old].dropna().unique()
+            values = new_df[column].iloc[delta.changed].to_numpy(dtype=object)
+            changed_values[level] = values
+            present = pd.notna(values)
+            added = group_positions(values[present], delta.changed[present])
+            index._rows[level] = apply_posting_delta(
+                self._rows[level], delta, stale, added
+            )
+
+        # 계층은 새 조합만 추가 (행이 없어진 카테고리는 children/counts에서 제외됨)
+        index._children = {path: set(names) for path, names in self._children.items()}
+        for path, names in self._build_hierarchy(
+            changed_values, pd.DataFrame()
+        ).items():
+            index._children.setdefault(path, set()).update(names)
+        return index
+
+    def rows(self, level: str, names: Optional[Iterable[str]]) -> np.ndarray:
+        """
+        한 단계에서 names 중 하나에 속하는 행 위치 (합집합, 오름차순)
+
+        Args:
+            level: "large", "middle", "small"
+            names: 카테고리명 목록 (None이면 전체 행)
+
+        Returns:
+            행 위치 배열
+        """
+        if names is None:
+            return np.arange(self.n_rows, dtype=np.int32)
+        if isinstance(names, str):
+            names = [names]
+        level_rows = self._rows[level]
+        parts = [level_rows[name] for name in names if name in level_rows]
+        if not parts:
+            return np.empty(0, dtype=np.int32)
+        if len(parts) == 1:
+            return parts[0]
+        return np.unique(np.concatenate(parts))
+
+    def select(
+        self,
+        large: Optional[Iterable[str]] = None,
+        middle: Optional[Iterable[str]] = None,
+        small: Optional[Iterable[str]] = None,
+    ) -> np.ndarray:
+        """
+        카테고리 조합에 해당하는 행 위치 (단계 간 교집합, 오름차순)
+
+        Args:
+            large: 대분류 목록 (None이면 제한 없음)
+            middle: 중분류 목록 (None이면 제한 없음)
+            small: 소분류 목록 (None이면 제한 없음)
+
+        Returns:
+            행 위치 배열
+        """
+        selected = [
+            self.rows(level, names)
+            for level, names in (("large", large), ("middle", middle), ("small", small))
+            if names is not None
+        ]
+        if not selected:
+            return np.arange(self.n_rows, dtype=np.int32)
+
+        selected.sort(key=len)
+        result = selected[0]
+        for rows in selected[1:]:
+            result = np.intersect1d(result, rows, assume_unique=True)
+            if len(result) == 0:
+                break
+        return result
+
+    def mask(
+        self,
+        df: pd.DataFrame,
+        large: Optional[Iterable[str]] = None,
+        middle: Optional[Iterable[str]] = None,
+        small: Optional[Iterable[str]] = None,
+    ) -> np.ndarray:
+        """
+        df의 각 행이 카테고리 조합에 해당하는지 나타내는 불리언 마스크
+
+        Args:
+            df: 인덱스를 만든 DataFrame 또는 그 부분집합 (행 인덱스 라벨 유지)
+            large: 대분류 목록
+            middle: 중분류 목록
+            small: 소분류 목록
+
+        Returns:
+            df 행 순서의 불리언 배열
+        """
+        positions = self.select(large=large, middle=middle, small=small)
+        if len(df) == self.n_rows and df.index.equals(pd.Index(self.labels)):
+            mask = np.zeros(self.n_rows, dtype=bool)
+            mask[positions] = True
+            return mask
+        return df.index.isin(self.labels[positions])
+
+    def children(
+        self, level: str, large: Optional[str] = None, middle: Optional[str] = None
+    ) -> list[str]:
+        """
+        상위 카테고리에 속하는 level 단계 카테고리명 목록
+
+        Args:
+            level: "large", "middle", "small"
+            large: 대분류 (None이면 모든 대분류)
+            middle: 중분류 (level이 "small"일 때만 사용, None이면 모든 중분류)
+
+        Returns:
+            카테고리명 리스트
+        """
+        if level == "large" or (large is None and middle is None):
+            return list(self._rows[level])
+
+        depth = 1 if level == "middle" else 2
+        names: set[str] = set()
+        for path, child_names in self._children.items():
+            if len(path) != depth:
+                continue
+            if large is not None and path[0] != large:
+                continue
+            if depth == 2 and middle is not None and path[1] != middle:
+                continue
+            names |= child_names
+        return [name for name in self._rows[level] if name in names]
+
+    def counts(
+        self,
+        level: str,
+        large: Optional[str] = None,
+        middle: Optional[str] = None,
+        rows: Optional[np.ndarray] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        level 단계 카테고리별 음식점 수 (음식점 수 많은 순)
+
+        Args:
+            level: "large", "middle", "small"
+            large: 대분류 (지정 시 해당 대분류 안에서 집계)
+            middle: 중분류 (지정 시 해당 중분류 안에서 집계)
+            rows: 집계 대상 행 위치 배열 (None이면 전체)
+
+        Returns:
+            [{"name": 카테고리명, "count": 음식점 수}, ...]
+            (/kakao/diners/categories 응답과 같은 형식)
+        """
+        scope = None
+        if large is not None or middle is not None:
+            scope = self.select(
+                large=None if large is None else [large],
+                middle=None if middle is None else [middle],
+            )
+        if rows is not None:
+            rows = np.asarray(rows)
+            scope = rows if scope is None else np.intersect1d(scope, rows)
+
+        bitmap = None
+        if scope is not None:
+            bitmap = np.zeros(self.n_rows, dtype=bool)
+            bitmap[scope] = True
+
+        level_rows = self._rows[level]
+        result = []
+        for name in self.children(level, large=large, middle=middle):
+            positions = level_rows[name]
+            count = len(positions) if bitmap is None else int(bitmap[positions].sum())
+            if count:
+                result.append({"name": name, "count": count})
+        result.sort(key=lambda item: item["count"], reverse=True)
+        return result
+
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def _load_category_index(dataset_version: str, _df: pd.DataFrame) -> CategoryIndex:
+    """데이터셋 버전별로 한 번만 역색인을 생성하여 모든 세션이 공유"""
+    index = take_prepared_index("category", dataset_version)
+    if index is None:
+        index = CategoryIndex(_df)
+    remember_index("category", dataset_version, index)
+    return index
+
+
+def get_category_index(
+    df: pd.DataFrame, dataset_version: Optional[str] = None
+) -> CategoryIndex:
+    """
+    음식점 DataFrame에 대한 공유 카테고리 역색인 반환
+
+    Args:
+        df: 음식점 DataFrame
+        dataset_version: 데이터셋 버전 (None이면 계산)
+
+    Returns:
+        CategoryIndex 인스턴스
+    """
+    if dataset_version is None:
+        dataset_version = get_dataset_version(df)
+    return _load_category_index(dataset_version, df)
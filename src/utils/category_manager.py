@@ -1,27 +1,52 @@
 # utils/category_manager.py
 
-import asyncio
-from typing import Any
+from typing import Any, Optional
 
 from utils.api_client import get_yamyam_ops_client
+from utils.async_runner import get_async_runner
+from utils.category_index import CategoryIndex, get_category_index
+from utils.dataset_version import lookup_dataset_version
 
 
 class CategoryManager:
-    """음식점 카테고리 관리 클래스 (API 기반)"""
+    """음식점 카테고리 관리 클래스 (로컬 데이터가 있으면 카테고리 역색인, 없으면 API)"""
 
     def __init__(self, app=None):
         self.app = app
         self._large_categories_cache = None
         self._middle_categories_cache = {}
 
+    def _get_local_index(self) -> Optional[CategoryIndex]:
+        """앱에 로드된 음식점 데이터의 카테고리 역색인 (데이터가 없으면 None)"""
+        df = getattr(self.app, "df_diner", None)
+        if df is None or df.empty or not df.index.is_unique:
+            return None
+        # 저장소에서 한 번 계산해 둔 버전이 없으면 해시 계산 대신 API 경로 사용
+        dataset_version = lookup_dataset_version(df)
+        if dataset_version is None:
+            return None
+        try:
+            return get_category_index(df, dataset_version)
+        except Exception as e:
+            print(f"카테고리 역색인 생성 실패: {e}")
+            return None
+
     def get_large_categories(self) -> list[dict[str, Any]]:
         """
-        대분류 카테고리 목록을 diner_count 높은 순으로 반환 (API 호출)
+        대분류 카테고리 목록을 diner_count 높은 순으로 반환 (로컬 역색인 또는 API 호출)
         """
         # 캐시가 있으면 반환
         if self._large_categories_cache is not None:
             return self._large_categories_cache
 
+        # 로컬 데이터가 있으면 API 호출 없이 역색인에서 집계
+        index = self._get_local_index()
+        if index is not None:
+            categories = index.counts("large")
+            if categories:
+                self._large_categories_cache = categories
+                return categories
+
         try:
             # API 클라이언트 가져오기
             client = get_yamyam_ops_client()
@@ -29,12 +54,7 @@ class CategoryManager:
                 return self._get_fallback_large_categories()
 
             # 비동기 API 호출을 동기적으로 실행
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            categories = loop.run_until_complete(
-                client.get_category_statistics("large")
-            )
-            loop.close()
+            categories = get_async_runner().run(client.get_category_statistics("large"))
 
             if categories:
                 self._large_categories_cache = categories
@@ -48,12 +68,20 @@ class CategoryManager:
 
     def get_middle_categories(self, large_category: str) -> list[dict[str, Any]]:
         """
-        특정 대분류의 중분류 카테고리 목록을 diner_count 높은 순으로 반환 (API 호출)
+        특정 대분류의 중분류 카테고리 목록을 diner_count 높은 순으로 반환 (로컬 역색인 또는 API 호출)
         """
         # 캐시가 있으면 반환
         if large_category in self._middle_categories_cache:
             return self._middle_categories_cache[large_category]
 
+        # 로컬 데이터가 있으면 API 호출 없이 역색인에서 집계
+        index = self._get_local_index()
+        if index is not None:
+            categories = index.counts("middle", large=large_category)
+            if categories:
+                self._middle_categories_cache[large_category] = categories
+                return categories
+
         try:
             # API 클라이언트 가져오기
             client = get_yamyam_ops_client()
@@ -61,12 +89,9 @@ class CategoryManager:
                 return []
 
             # 비동기 API 호출을 동기적으로 실행
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            categories = loop.run_until_complete(
+            categories = get_async_runner().run(
                 client.get_category_statistics("middle", large_category)
             )
-            loop.close()
 
             if categories:
                 self._middle_categories_cache[large_category] = categories
@@ -1,11 +1,17 @@
 # src/utils/data_processing.py
 
-from math import atan2, cos, radians, sin, sqrt
-
 import matplotlib.colors as mcolors  # 색상 변환에 사용
+import numpy as np
 import pandas as pd
 import streamlit as st
 
+from utils.category_index import get_category_index
+from utils.dataset_version import lookup_dataset_version
+from utils.distance import distances_from, haversine_np
+from utils.menu_index import get_menu_index
+from utils.result_cache import get_location_result_cache
+from utils.spatial_index import get_spatial_index
+
 
 # 리스트나 기타 iterable 객체를 안전하게 처리하는 함수 추가
 def safe_item_access(item, index=None):
@@ -37,23 +43,104 @@ def safe_item_access(item, index=None):
     return str(item)
 
 
-@st.cache_data(hash_funcs={pd.DataFrame: lambda _: None})
 def get_filtered_data(df, user_lat, user_lon, max_radius=30):
-    df["distance"] = df.apply(
-        lambda row: haversine(user_lat, user_lon, row["diner_lat"], row["diner_lon"]),
-        axis=1,
+    if df.empty:
+        return df.assign(distance=pd.Series(dtype="float64"))
+
+    # 공유 저장소 frame이 아니면(부분집합, 임시 DataFrame 등) 인덱스 없이 전체 행 거리 계산
+    dataset_version = lookup_dataset_version(df)
+    if dataset_version is None:
+        distances = distances_from(df, user_lat, user_lon)
+        mask = distances <= max_radius
+        filtered_df = df[mask].copy()
+        filtered_df["distance"] = distances[mask]
+        return filtered_df
+
+    spatial_index = get_spatial_index(df, dataset_version)
+
+    # 격자 스냅된 위치의 후보 행을 세션 간 공유 캐시에서 조회
+    candidates = get_location_result_cache().get_candidates(
+        dataset_version,
+        user_lat,
+        user_lon,
+        max_radius,
+        compute=spatial_index.query_radius,
+    )
+
+    # 실제 좌표 기준 정확한 거리로 최종 필터링
+    distances = np.atleast_1d(
+        haversine_np(
+            user_lat,
+            user_lon,
+            spatial_index.lats[candidates],
+            spatial_index.lons[candidates],
+        )
     )
+    mask = distances <= max_radius
 
-    # 거리 계산 및 필터링
-    filtered_df = df[df["distance"] <= max_radius]
+    filtered_df = df.iloc[candidates[mask]].copy()
+    filtered_df["distance"] = distances[mask]
     return filtered_df
 
 
-@st.cache_data(hash_funcs={pd.DataFrame: lambda _: None})
+def _index_source(df, source_df=None):
+    """
+    공유 역색인을 사용할 DataFrame과 버전 선택
+
+    버전이 등록된 공유 DataFrame(DinerStore.frame)의 역색인만 사용하며, df가 source_df의
+    부분집합(행 인덱스 라벨 유지)이면 source_df의 역색인을 사용합니다.
+
+    Returns:
+        (역색인 원본 DataFrame, 데이터셋 버전), 사용할 수 없으면 (None, None)
+    """
+    for source in (source_df, df):
+        if source is None or source.empty:
+            continue
+        dataset_version = lookup_dataset_version(source)
+        if dataset_version is None or not source.index.is_unique:
+            continue
+        if source is df or (source.index.get_indexer(df.index) >= 0).all():
+            return source, dataset_version
+    return None, None
+
+
+def category_mask(df, large=None, middle=None, small=None):
+    """
+    대/중/소분류 조합에 해당하는 행의 불리언 마스크
+
+    공유 DataFrame 전체는 카테고리 역색인을, 반경 필터링 결과처럼 작은 DataFrame은
+    범주형 컬럼의 isin을 사용합니다.
+
+    Args:
+        df: 필터링할 DataFrame
+        large: 대분류 목록 (None이면 제한 없음)
+        middle: 중분류 목록 (None이면 제한 없음)
+        small: 소분류 목록 (None이면 제한 없음)
+
+    Returns:
+        df 행 순서의 불리언 배열
+    """
+    dataset_version = lookup_dataset_version(df)
+    if dataset_version is not None and df.index.is_unique:
+        return get_category_index(df, dataset_version).mask(
+            df, large=large, middle=middle, small=small
+        )
+
+    mask = np.ones(len(df), dtype=bool)
+    for column, names in (
+        ("diner_category_large", large),
+        ("diner_category_middle", middle),
+        ("diner_category_small", small),
+    ):
+        if names is not None:
+            mask &= df[column].isin(names).to_numpy()
+    return mask
+
+
 def category_filters(diner_category, df_diner_real_review):
-    category_filted_df = df_diner_real_review.query(
-        "diner_category_large in @diner_category"
-    )
+    category_filted_df = df_diner_real_review[
+        category_mask(df_diner_real_review, large=diner_category)
+    ]
 
     return category_filted_df
 
@@ -87,26 +174,17 @@ def grade_to_stars(diner_grade):
 
 
 def haversine(lat1, lon1, lat2, lon2):
-    lat1, lon1, lat2, lon2 = map(radians, [lat1, lon1, lat2, lon2])
-
-    dlat = lat2 - lat1
-    dlon = lon2 - lon1
-    a = sin(dlat / 2) ** 2 + cos(lat1) * cos(lat2) * sin(dlon / 2) ** 2
-    c = 2 * atan2(sqrt(a), sqrt(1 - a))
-    distance = 6371 * c
-
-    return distance
+    # 스칼라/배열 모두 utils.distance.haversine_np 로 계산
+    return haversine_np(lat1, lon1, lat2, lon2)
 
 
 def filter_recommendations_by_distance_memory(
     recommended_items_df, user_lat, user_lon, radius
 ):
     # 거리 계산
-    distances = recommended_items_df.apply(
-        lambda row: haversine(user_lat, user_lon, row["diner_lat"], row["diner_lon"]),
-        axis=1,
+    recommended_items_df["distance"] = distances_from(
+        recommended_items_df, user_lat, user_lon
     )
-    recommended_items_df["distance"] = distances
     # 반경 내의 아이템 필터링
     filtered_df = recommended_items_df[recommended_items_df["distance"] <= radius]
     return filtered_df
@@ -179,8 +257,7 @@ def recommend_items_model(user_id, algo, trainset, num_recommendations=5):
     return top_items_df
 
 
-# 랜덤 뽑기 함수
-@st.cache_data(hash_funcs={pd.DataFrame: lambda _: None})
+# 랜덤 뽑기 함수 (매 호출마다 새로 뽑고 세션 상태를 갱신하므로 캐시하지 않음)
 def pick_random_diners(df, num_to_select=25):
     high_grade_diners = df[df["diner_grade"] >= 2]
     # 조건: 이미 선택된 카테고리는 제외
@@ -232,3 +309,26 @@ def search_menu(row, search_term):
             if search_term in row[field]:
                 return True
     return False
+
+
+def search_menu_mask(df, search_term, source_df=None):
+    """
+    메뉴/태그/카테고리 필드에 검색어가 포함된 행의 불리언 마스크 (search_menu와 같은 결과)
+
+    행마다 search_menu를 적용하는 대신 공유 DataFrame의 등록된 버전별로 한 번 만든
+    역색인을 사용합니다. 버전이 등록되지 않은 DataFrame은 행마다 search_menu를 적용합니다.
+
+    Args:
+        df: 검색할 DataFrame (source_df의 부분집합이면 source_df의 역색인 사용)
+        search_term: 검색어
+        source_df: df를 잘라낸 원본 DataFrame (반경 필터링 전 전체 데이터)
+
+    Returns:
+        df 행 순서의 불리언 배열
+    """
+    source, dataset_version = _index_source(df, source_df)
+    if source is None:
+        return df.apply(lambda row: search_menu(row, search_term), axis=1).to_numpy(
+            dtype=bool
+        )
+    return get_menu_index(source, dataset_version).mask(df, search_term)
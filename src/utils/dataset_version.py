@@ -0,0 +1,117 @@
+# src/utils/dataset_version.py
+"""음식점 데이터셋 버전(지문) 계산 유틸리티"""
+
+import hashlib
+import threading
+import weakref
+from typing import Optional
+
+import pandas as pd
+
+# 버전 계산에 사용하는 컬럼 (존재하는 컬럼만 사용)
+VERSION_COLUMNS = [
+    "diner_idx",
+    "diner_lat",
+    "diner_lon",
+    "diner_category_large",
+    "diner_category_middle",
+    "diner_category_small",
+    "diner_category_detail",
+    "updated_at",
+]
+
+
+# 버전을 미리 계산해 둔 DataFrame {id(df): (약한 참조, 버전)}
+_registered_versions: dict[int, tuple[weakref.ref, str]] = {}
+# 약한 참조 콜백이 같은 스레드에서 실행될 수 있어 재진입 가능한 락 사용
+_registered_lock = threading.RLock()
+
+
+def register_dataset_version(df: pd.DataFrame, version: Optional[str] = None) -> str:
+    """
+    공유 DataFrame의 버전을 등록합니다.
+
+    DinerStore처럼 로드 후 제자리 수정하지 않는 DataFrame에 한 번만 호출하며, 이후
+    lookup_dataset_version/get_dataset_version은 해시 계산 없이 등록된 버전을 반환합니다.
+    DataFrame이 해제되면 등록도 함께 제거됩니다.
+
+    Args:
+        df: 음식점 DataFrame
+        version: 미리 알고 있는 버전 (스냅샷 manifest 등, None이면 계산)
+
+    Returns:
+        등록된 데이터셋 버전 문자열
+    """
+    if version is None:
+        version = compute_dataset_version(df)
+
+    key = id(df)
+
+    def _forget(ref: weakref.ref):
+        with _registered_lock:
+            entry = _registered_versions.get(key)
+            if entry is not None and entry[0] is ref:
+                del _registered_versions[key]
+
+    with _registered_lock:
+        _registered_versions[key] = (weakref.ref(df, _forget), version)
+    return version
+
+
+def lookup_dataset_version(df: pd.DataFrame) -> Optional[str]:
+    """
+    등록된 DataFrame의 버전 조회 (해시를 계산하지 않음)
+
+    Args:
+        df: 음식점 DataFrame
+
+    Returns:
+        등록된 버전 문자열 (등록되지 않은 DataFrame이면 None)
+    """
+    with _registered_lock:
+        entry = _registered_versions.get(id(df))
+    if entry is not None and entry[0]() is df:
+        return entry[1]
+    return None
+
+
+def get_dataset_version(df: pd.DataFrame) -> str:
+    """
+    DataFrame의 버전 반환 (등록된 버전이 있으면 사용하고, 없으면 계산)
+
+    Args:
+        df: 음식점 DataFrame
+
+    Returns:
+        데이터셋 버전 문자열
+    """
+    version = lookup_dataset_version(df)
+    return compute_dataset_version(df) if version is None else version
+
+
+def compute_dataset_version(df: pd.DataFrame) -> str:
+    """
+    DataFrame의 내용과 행 순서를 반영한 버전 문자열을 계산합니다.
+
+    공간/카테고리 인덱스처럼 행 위치(position)를 저장하는 구조의 캐시 키로 사용하므로
+    같은 데이터라도 행 순서가 다르면 다른 버전이 됩니다. 전체 행을 해시하므로
+    요청마다 호출하지 말고 register_dataset_version으로 한 번만 계산해 두세요.
+
+    Args:
+        df: 음식점 DataFrame
+
+    Returns:
+        데이터셋 버전 문자열
+    """
+    if df is None or len(df) == 0:
+        return "empty"
+
+    columns = [col for col in VERSION_COLUMNS if col in df.columns]
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(f"{len(df)}:{','.join(columns)}".encode())
+
+    if columns:
+        row_hashes = pd.util.hash_pandas_object(df[columns], index=False)
+        hasher.update(row_hashes.to_numpy().tobytes())
+
+    return hasher.hexdigest()
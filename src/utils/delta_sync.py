@@ -0,0 +1,215 @@
+# src/utils/delta_sync.py
+"""음식점 카탈로그 증분 동기화 (updated_at 이후 변경분만 받아 저장소와 인덱스에 반영)"""
+
+import logging
+import threading
+import time
+from typing import Any, Optional
+
+import pandas as pd
+
+from config.constants import (
+    CATALOG_UPDATED_SINCE_PARAM,
+    DINER_SYNC_INTERVAL,
+    SNAPSHOT_DIR,
+)
+from utils.api_data_loader import get_api_url, iter_diner_pages
+from utils.dataset_version import get_dataset_version
+from utils.diner_store import DinerDelta, DinerStore, get_diner_store
+from utils.index_delta import built_index, prepare_index
+from utils.spatial_index import spatial_index_kind
+
+logger = logging.getLogger(__name__)
+
+# 삭제(tombstone) 레코드를 나타내는 필드
+TOMBSTONE_COLUMNS = ["is_deleted", "deleted_at"]
+
+_sync_lock = threading.Lock()
+_last_sync_started = 0.0
+
+
+def _split_tombstones(changes: pd.DataFrame) -> tuple[pd.DataFrame, list]:
+    """
+    변경 레코드를 추가/수정 행과 삭제된 diner_idx로 분리
+
+    Returns:
+        (추가/수정 DataFrame, 삭제된 diner_idx 리스트)
+    """
+    deleted = pd.Series(False, index=changes.index)
+    if "is_deleted" in changes.columns:
+        deleted |= changes["is_deleted"].fillna(False).astype(bool)
+    if "deleted_at" in changes.columns:
+        deleted |= changes["deleted_at"].notna()
+
+    deleted_ids = changes.loc[deleted, "diner_idx"].tolist()
+    upserts = changes[~deleted].drop(
+        columns=[c for c in TOMBSTONE_COLUMNS if c in changes.columns]
+    )
+    return upserts, deleted_ids
+
+
+def fetch_diner_changes(
+    since: str, api_url: Optional[str] = None, **page_options: Any
+) -> tuple[pd.DataFrame, list]:
+    """
+    since 이후 변경된 음식점만 조회
+
+    /kakao/diners/ 에 updated_since 파라미터를 붙여 페이지 단위로 받습니다.
+    삭제된 음식점은 is_deleted 또는 deleted_at이 채워진 레코드로 내려온다고 가정합니다.
+
+    Args:
+        since: 기준 시각 (ISO 8601, 저장소의 updated_at 최댓값)
+        api_url: API 베이스 URL (None이면 secrets에서 가져옴)
+        **page_options: iter_diner_pages에 전달할 옵션 (page_size, max_concurrency, timeout)
+
+    Returns:
+        (추가/수정 DataFrame, 삭제된 diner_idx 리스트)
+    """
+    params = {CATALOG_UPDATED_SINCE_PARAM: since}
+    pages = [
+        page
+        for page in iter_diner_pages(api_url, params, **page_options)
+        if not page.empty
+    ]
+    if not pages:
+        return pd.DataFrame(), []
+    return _split_tombstones(pd.concat(pages, ignore_index=True))
+
+
+def _advance_indexes(
+    old_frame: pd.DataFrame, new_frame: pd.DataFrame, delta: DinerDelta
+) -> list[str]:
+    """
+    이전 버전에 대해 만들어 둔 공유 인덱스를 증분 갱신하여 새 버전으로 등록
+
+    이전 버전 인덱스가 없는 종류는 건너뛰며, 처음 요청될 때 새로 생성됩니다.
+
+    Returns:
+        증분 갱신한 인덱스 종류 목록
+    """
+    old_version = get_dataset_version(old_frame)
+    new_version = get_dataset_version(new_frame)
+    updaters = {
+        spatial_index_kind(): lambda index: index.apply_delta(
+            new_frame["diner_lat"].to_numpy(dtype="float64"),
+            new_frame["diner_lon"].to_numpy(dtype="float64"),
+            delta,
+        ),
+        "category": lambda index: index.apply_delta(old_frame, new_frame, delta),
+        "menu": lambda index: index.apply_delta(old_frame, new_frame, delta),
+    }
+
+    advanced = []
+    for kind, update in updaters.items():
+        index = built_index(kind, old_version)
+        if index is None:
+            continue
+        try:
+            prepare_index(kind, new_version, update(index))
+            advanced.append(kind)
+        except Exception as e:
+            logger.warning(f"{kind} 인덱스 증분 갱신 실패 (다음 요청 시 재생성): {e}")
+    return advanced
+
+
+def sync_diner_store(
+    store: Optional[DinerStore] = None,
+    api_url: Optional[str] = None,
+    root: Optional[str] = SNAPSHOT_DIR,
+    **page_options: Any,
+) -> dict[str, Any]:
+    """
+    저장소의 updated_at 이후 변경분만 받아 저장소, 공유 인덱스, 스냅샷을 갱신
+
+    변경된 행은 같은 자리에서 교체되고 새 행은 끝에 추가되며, 공간/카테고리/메뉴 인덱스는
+    변경 행이 속했던/속하는 셀과 항목만 다시 계산합니다. store의 내용은 새 저장소로 교체되므로
+    이후 get_diner_store().frame을 읽는 세션부터 새 데이터를 사용합니다.
+
+    Args:
+        store: 갱신할 저장소 (None이면 공유 저장소)
+        api_url: API 베이스 URL (None이면 secrets에서 가져옴)
+        root: 스냅샷 루트 디렉토리 (None이면 스냅샷을 저장하지 않음)
+        **page_options: iter_diner_pages에 전달할 옵션
+
+    Returns:
+        {"status": "no_watermark" | "unchanged" | "applied", "since", "inserted",
+        "updated", "deleted", "rows", "indexes", "snapshot"} 딕셔너리
+    """
+    if store is None:
+        store = get_diner_store()
+
+    since = store.watermark()
+    stats: dict[str, Any] = {"status": "no_watermark", "since": since}
+    if since is None:
+        logger.info("updated_at 기준 시각이 없어 증분 동기화를 건너뜁니다.")
+        return stats
+
+    started = time.perf_counter()
+    upserts, deleted_ids = fetch_diner_changes(since, api_url, **page_options)
+    stats.update(changes=len(upserts) + len(deleted_ids), snapshot=None)
+
+    old_frame = store.frame
+    new_store, delta = store.apply_delta(upserts, deleted_ids)
+    stats.update(delta.summary(), rows=len(new_store.frame), indexes=[])
+    if delta.is_empty or new_store.version == store.version:
+        stats["status"] = "unchanged"
+        logger.info(f"변경된 음식점이 없습니다 (기준 시각 {since}).")
+        return stats
+
+    stats["indexes"] = _advance_indexes(old_frame, new_store.frame, delta)
+    store.replace_with(new_store)
+    stats["status"] = "applied"
+
+    if root is not None:
+        # 순환 import 방지 (diner_snapshot이 증분 갱신 CLI에서 이 모듈을 사용)
+        from utils.diner_snapshot import write_snapshot
+
+        try:
+            stats["snapshot"] = write_snapshot(store, root)
+        except Exception as e:
+            logger.warning(f"증분 동기화 스냅샷 저장 실패: {e}")
+
+    logger.info(
+        f"증분 동기화 완료 ({time.perf_counter() - started:.2f}초): "
+        f"추가 {delta.n_inserted}, 수정 {len(delta.updated_old)}, "
+        f"삭제 {len(delta.removed)}, 인덱스 {', '.join(stats['indexes']) or '없음'}"
+    )
+    return stats
+
+
+def maybe_start_background_sync(interval: int = DINER_SYNC_INTERVAL) -> bool:
+    """
+    마지막 동기화 후 interval초가 지났으면 백그라운드 스레드에서 증분 동기화 시작
+
+    페이지 로드 경로에서 호출되므로 대기하지 않고 바로 반환합니다.
+    API URL(secrets)과 공유 저장소는 스크립트 스레드에서 미리 가져와 전달합니다.
+
+    Args:
+        interval: 동기화 주기 (초, 0 이하면 사용 안 함)
+
+    Returns:
+        동기화를 시작했으면 True
+    """
+    global _last_sync_started
+
+    if interval <= 0 or time.monotonic() - _last_sync_started < interval:
+        return False
+    if not _sync_lock.acquire(blocking=False):
+        return False
+    _last_sync_started = time.monotonic()
+    api_url = get_api_url()
+    if not api_url:
+        _sync_lock.release()
+        return False
+    store = get_diner_store()
+
+    def _run():
+        try:
+            sync_diner_store(store, api_url=api_url)
+        except Exception as e:
+            logger.warning(f"백그라운드 증분 동기화 실패: {e}")
+        finally:
+            _sync_lock.release()
+
+    threading.Thread(target=_run, name="diner-delta-sync", daemon=True).start()
+    return True
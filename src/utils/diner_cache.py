@@ -0,0 +1,231 @@
+# src/utils/diner_cache.py
+"""프로세스 전역 음식점 상세 정보 캐시 (TTL + 메모리 상한 LRU)"""
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable
+from typing import Any, Callable, Optional
+
+from config.constants import DINER_CACHE_MAX_BYTES, DINER_CACHE_TTL_SECONDS
+from utils.profiler import record_cache
+
+logger = logging.getLogger(__name__)
+
+# 누락된 diner_idx 리스트 → {diner_idx: 음식점 정보} 를 반환하는 비동기 조회 함수
+FetchMany = Callable[[list[str]], Awaitable[dict[str, dict[str, Any]]]]
+
+
+def _estimate_size(value: dict[str, Any]) -> int:
+    """JSON 직렬화 길이로 항목의 메모리 사용량 추정 (bytes)"""
+    try:
+        return len(json.dumps(value, ensure_ascii=False, default=str).encode())
+    except Exception:
+        return 1024
+
+
+class DinerDetailCache:
+    """
+    diner_idx 기준 read-through 캐시
+
+    항목은 TTL이 지나면 만료되고, 추정 메모리 합계가 상한을 넘으면 가장 오래 사용하지 않은
+    항목부터 제거합니다. 같은 키에 대한 동시 미스는 진행 중인 조회(Future)를 공유하므로
+    상위 API 호출은 한 번만 발생합니다.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = DINER_CACHE_TTL_SECONDS,
+        max_bytes: int = DINER_CACHE_MAX_BYTES,
+    ):
+        """
+        Args:
+            ttl_seconds: 항목 유효 시간 (초)
+            max_bytes: 캐시 전체 추정 메모리 상한 (bytes)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        # diner_idx → (만료 시각, 추정 크기, 음식점 정보)
+        self._entries: OrderedDict[str, tuple[float, int, dict[str, Any]]] = (
+            OrderedDict()
+        )
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, diner_idx: Any) -> Optional[dict[str, Any]]:
+        """
+        캐시된 음식점 정보 조회 (만료되었거나 없으면 None)
+
+        Args:
+            diner_idx: 음식점 인덱스
+
+        Returns:
+            음식점 정보 또는 None
+        """
+        key = str(diner_idx)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, size, value = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, diner_idx: Any, value: dict[str, Any]):
+        """
+        음식점 정보 저장 (메모리 상한 초과 시 LRU 항목 제거)
+
+        Args:
+            diner_idx: 음식점 인덱스
+            value: 음식점 정보
+        """
+        key = str(diner_idx)
+        size = _estimate_size(value)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, size, value)
+            self._bytes += size
+            while self._bytes > self.max_bytes and self._entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def _remove(self, key: str):
+        """항목 제거 (lock 보유 상태에서 호출)"""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[1]
+
+    def invalidate(self, diner_idx: Any):
+        """특정 음식점 항목 무효화"""
+        with self._lock:
+            self._remove(str(diner_idx))
+
+    def clear(self):
+        """캐시 비우기"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    async def get_many(
+        self,
+        diner_idxs: list[str],
+        fetch_many: FetchMany,
+        timeout: Optional[float] = None,
+    ) -> dict[str, dict[str, Any]]:
+        """
+        여러 음식점 정보를 캐시에서 읽고, 없는 항목만 fetch_many로 조회하여 채움
+
+        다른 요청이 이미 조회 중인 키는 새로 요청하지 않고 그 결과를 기다립니다.
+
+        Args:
+            diner_idxs: 음식점 인덱스 리스트 (중복 없음)
+            fetch_many: 누락된 인덱스 리스트를 조회하는 비동기 함수
+            timeout: 다른 요청의 조회 결과를 기다리는 최대 시간 (초)
+
+        Returns:
+            {diner_idx: 음식점 정보} 딕셔너리 (조회 실패한 ID는 제외)
+        """
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+        found: dict[str, dict[str, Any]] = {}
+        waiting: dict[str, asyncio.Future] = {}
+        missing: list[str] = []
+
+        for idx in diner_idxs:
+            value = self.get(idx)
+            with self._lock:
+                if value is not None:
+                    self.hits += 1
+                    found[idx] = value
+                    continue
+                future = self._inflight.get(idx)
+                if future is not None and future.get_loop() is loop:
+                    self.coalesced += 1
+                    waiting[idx] = future
+                    continue
+                self.misses += 1
+                self._inflight[idx] = loop.create_future()
+                missing.append(idx)
+
+        record_cache("diner_detail", True, len(found) + len(waiting))
+        record_cache("diner_detail", False, len(missing))
+
+        if missing:
+            fetched: dict[str, dict[str, Any]] = {}
+            try:
+                fetched = await fetch_many(missing) or {}
+            finally:
+                # 조회가 실패하거나 취소되어도 기다리는 요청이 멈추지 않도록 항상 결과 설정
+                for idx in missing:
+                    value = fetched.get(idx)
+                    if value:
+                        self.put(idx, value)
+                        found[idx] = value
+                    with self._lock:
+                        future = self._inflight.pop(idx, None)
+                    if future is not None and not future.done():
+                        future.set_result(value)
+
+        if waiting:
+            remaining = None
+            if timeout is not None:
+                remaining = max(timeout - (loop.time() - started_at), 0)
+            # asyncio.wait는 기다리던 Future를 취소하지 않으므로 조회 중인 요청에 영향 없음
+            done, _ = await asyncio.wait(waiting.values(), timeout=remaining)
+            for idx, future in waiting.items():
+                if future in done and not future.cancelled() and future.result():
+                    found[idx] = future.result()
+
+        return found
+
+    def stats(self) -> dict[str, Any]:
+        """캐시 적중 통계 반환"""
+        with self._lock:
+            lookups = self.hits + self.misses + self.coalesced
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "size": len(self._entries),
+                "bytes": self._bytes,
+                "inflight": len(self._inflight),
+                # 진행 중인 조회를 공유한 경우도 상위 호출을 피했으므로 적중으로 집계
+                "hit_rate": (self.hits + self.coalesced) / lookups if lookups else 0.0,
+            }
+
+
+_diner_cache: Optional[DinerDetailCache] = None
+_diner_cache_lock = threading.Lock()
+
+
+def get_diner_detail_cache() -> DinerDetailCache:
+    """
+    모든 세션이 공유하는 음식점 상세 캐시 싱글톤 반환
+
+    백그라운드 이벤트 루프 스레드에서도 호출되므로 st.cache_resource 대신 모듈 전역으로 관리
+    """
+    global _diner_cache
+    if _diner_cache is None:
+        with _diner_cache_lock:
+            if _diner_cache is None:
+                _diner_cache = DinerDetailCache()
+    return _diner_cache
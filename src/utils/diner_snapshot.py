@@ -0,0 +1,507 @@
+# src/utils/diner_snapshot.py
+"""
+메모리 매핑 가능한 음식점 카탈로그 스냅샷 (.npy 컬럼 + manifest.json)
+
+스냅샷 디렉토리 구조:
+    SNAPSHOT_DIR/
+        CURRENT              현재 스냅샷 디렉토리 이름 (os.replace로 원자적 교체)
+        v<버전>/
+            manifest.json    컬럼 목록, 종류, dtype, 범주 등 메타데이터
+            <컬럼>.*.npy     컬럼 배열 (np.load(mmap_mode="r")로 열기)
+
+숫자 컬럼과 범주/리스트 코드 배열은 메모리 매핑 배열을 그대로 사용하므로(복사 없음)
+같은 스냅샷을 여는 모든 프로세스가 OS 페이지 캐시를 공유합니다. 문자열 컬럼은 고유값만
+변환한 뒤 코드로 모으고, 메뉴/태그 리스트 컬럼은 행별 파이썬 리스트로 만들어야 하므로
+로드 시간의 대부분을 차지합니다(20만 행 기준 전체 약 0.6초, 그중 리스트 약 0.4초).
+CSV 파싱과 DinerStore 압축 변환은 생략됩니다.
+
+갱신 작업:
+    cd src && python -m utils.diner_snapshot refresh --source api
+"""
+
+import argparse
+import json
+import logging
+import os
+import shutil
+import time
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+from config.constants import SNAPSHOT_DIR, SNAPSHOT_KEEP
+from utils.diner_store import DinerStore, ListColumn, load_diner_frame
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+CURRENT_NAME = "CURRENT"
+
+# 문자열 배열 저장 시 구분자 (문자열에 포함되면 저장 실패)
+STRING_SEPARATOR = "\x00"
+
+
+def _fsync_write(path: str, data: bytes):
+    """파일을 쓰고 디스크에 동기화"""
+    with open(path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _encode_strings(values) -> np.ndarray:
+    """문자열 목록을 구분자로 이어 붙인 UTF-8 바이트 배열로 인코딩"""
+    texts = [str(value) for value in values]
+    joined = STRING_SEPARATOR.join(texts)
+    if joined.count(STRING_SEPARATOR) != max(len(texts) - 1, 0):
+        raise ValueError("NUL 문자가 포함된 문자열은 스냅샷에 저장할 수 없습니다.")
+    return np.frombuffer(joined.encode("utf-8"), dtype=np.uint8)
+
+
+def _decode_strings(data: np.ndarray, count: int) -> np.ndarray:
+    """_encode_strings의 역변환 (object 배열)"""
+    result = np.empty(count, dtype=object)
+    if count:
+        result[:] = data.tobytes().decode("utf-8").split(STRING_SEPARATOR)
+    return result
+
+
+def _is_string_column(series: pd.Series) -> bool:
+    """문자열(또는 결측값)만 담긴 컬럼인지 확인"""
+    if pd.api.types.is_string_dtype(series.dtype) and series.dtype != object:
+        return True
+    if series.dtype != object:
+        return False
+    values = series.dropna()
+    return bool(values.map(lambda value: isinstance(value, str)).all())
+
+
+class _SnapshotWriter:
+    """한 스냅샷 디렉토리에 컬럼 배열을 저장하고 manifest 항목을 만듦"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.columns: list[dict[str, Any]] = []
+
+    def save(self, name: str, array: np.ndarray) -> str:
+        """배열을 .npy 파일로 저장하고 파일 이름 반환"""
+        filename = f"{len(self.columns):03d}.{name}.npy"
+        np.save(os.path.join(self.path, filename), np.ascontiguousarray(array))
+        return filename
+
+    def _vocab(self, vocab) -> dict[str, Any]:
+        """고유 문자열 배열 저장 (manifest 항목 반환)"""
+        return {
+            "vocab": self.save("vocab", _encode_strings(vocab)),
+            "vocab_size": len(vocab),
+        }
+
+    def add_column(
+        self, name: str, series: pd.Series, packed: Optional[ListColumn] = None
+    ):
+        """컬럼 종류(list/categorical/numeric/masked/string/json)에 맞게 저장"""
+        entry: dict[str, Any] = {"name": name, "dtype": str(series.dtype)}
+
+        if packed is not None:
+            entry.update(
+                kind="list",
+                offsets=self.save("offsets", packed.offsets),
+                codes=self.save("codes", packed.codes),
+                **self._vocab(packed.vocab),
+            )
+        elif isinstance(series.dtype, pd.CategoricalDtype):
+            categories = series.cat.categories
+            entry.update(
+                kind="categorical",
+                codes=self.save("codes", series.cat.codes.to_numpy()),
+                categories=categories.astype(object).tolist(),
+                categories_dtype=str(categories.dtype),
+                ordered=bool(series.cat.ordered),
+            )
+        elif isinstance(series.dtype, np.dtype) and series.dtype.kind in "biufmM":
+            entry.update(kind="numeric", values=self.save("values", series.to_numpy()))
+        elif (
+            pd.api.types.is_numeric_dtype(series.dtype)
+            or pd.api.types.is_bool_dtype(series.dtype)
+        ) and hasattr(series.dtype, "numpy_dtype"):
+            # nullable 정수/실수/불리언 (Int64, Float64, boolean 등)
+            mask = series.isna().to_numpy()
+            values = series.to_numpy(dtype=series.dtype.numpy_dtype, na_value=0)
+            entry.update(
+                kind="masked",
+                values=self.save("values", values),
+                mask=self.save("mask", mask),
+            )
+        elif _is_string_column(series):
+            codes, vocab = pd.factorize(series.astype(object), use_na_sentinel=True)
+            entry.update(
+                kind="string",
+                codes=self.save("codes", codes.astype(np.int32)),
+                **self._vocab(vocab),
+            )
+        else:
+            # 그 밖의 컬럼(중첩 객체 등)은 컬럼 전체를 하나의 JSON 배열로 저장
+            values = series.astype(object).where(series.notna(), None).tolist()
+            text = json.dumps(values, ensure_ascii=False, default=str)
+            entry.update(
+                kind="json",
+                data=self.save("data", np.frombuffer(text.encode(), dtype=np.uint8)),
+            )
+
+        self.columns.append(entry)
+
+
+def write_snapshot(
+    store: DinerStore,
+    root: str = SNAPSHOT_DIR,
+    version: Optional[str] = None,
+    keep: int = SNAPSHOT_KEEP,
+) -> str:
+    """
+    DinerStore를 새 버전 스냅샷으로 저장하고 CURRENT 포인터를 원자적으로 교체
+
+    임시 디렉토리에 모든 파일을 쓴 뒤 디렉토리 이름을 바꾸고(os.replace),
+    마지막에 CURRENT 파일을 교체하므로 읽는 쪽은 항상 완성된 스냅샷만 봅니다.
+
+    Args:
+        store: 저장할 음식점 저장소
+        root: 스냅샷 루트 디렉토리
+        version: 스냅샷 버전 (None이면 생성 시각 + 데이터셋 버전)
+        keep: 보관할 스냅샷 수 (현재 스냅샷 포함)
+
+    Returns:
+        생성된 스냅샷 디렉토리 이름
+    """
+    frame = store.frame
+    dataset_version = store.version
+    if version is None:
+        version = f"{time.strftime('%Y%m%d%H%M%S')}-{dataset_version[:12]}"
+    name = f"v{version}"
+
+    os.makedirs(root, exist_ok=True)
+    final_path = os.path.join(root, name)
+    tmp_path = os.path.join(root, f".{name}.tmp-{os.getpid()}")
+    if os.path.exists(final_path):
+        raise FileExistsError(f"이미 존재하는 스냅샷입니다: {final_path}")
+
+    os.makedirs(tmp_path)
+    try:
+        writer = _SnapshotWriter(tmp_path)
+        for column in frame.columns:
+            writer.add_column(column, frame[column], store.list_columns.get(column))
+
+        index = None
+        if not isinstance(frame.index, pd.RangeIndex) or frame.index.start != 0:
+            if frame.index.dtype.kind not in "iu":
+                raise ValueError(
+                    "정수형이 아닌 행 인덱스는 스냅샷에 저장할 수 없습니다."
+                )
+            index = writer.save("index", frame.index.to_numpy())
+
+        manifest = {
+            "format_version": SNAPSHOT_FORMAT_VERSION,
+            "version": version,
+            "dataset_version": dataset_version,
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "row_count": len(frame),
+            "watermark": store.watermark(),
+            "index": index,
+            "columns": writer.columns,
+            "source_bytes": {k: int(v) for k, v in store.source_bytes.items()},
+        }
+        _fsync_write(
+            os.path.join(tmp_path, MANIFEST_NAME),
+            json.dumps(manifest, ensure_ascii=False, indent=2).encode("utf-8"),
+        )
+        os.replace(tmp_path, final_path)
+    except BaseException:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        raise
+
+    _set_current(root, name)
+    _prune_snapshots(root, keep)
+    logger.info(f"스냅샷 저장 완료: {final_path} ({len(frame)}개 음식점)")
+    return name
+
+
+def _set_current(root: str, name: str):
+    """CURRENT 포인터를 원자적으로 교체"""
+    tmp_path = os.path.join(root, f".{CURRENT_NAME}.tmp-{os.getpid()}")
+    _fsync_write(tmp_path, name.encode("utf-8"))
+    os.replace(tmp_path, os.path.join(root, CURRENT_NAME))
+
+
+def current_snapshot_name(root: str = SNAPSHOT_DIR) -> Optional[str]:
+    """CURRENT가 가리키는 스냅샷 디렉토리 이름 (없으면 None)"""
+    try:
+        with open(os.path.join(root, CURRENT_NAME), encoding="utf-8") as f:
+            name = f.read().strip()
+    except FileNotFoundError:
+        return None
+    return name or None
+
+
+def list_snapshots(root: str = SNAPSHOT_DIR) -> list[str]:
+    """완성된 스냅샷 디렉토리 이름 목록 (오래된 순)"""
+    if not os.path.isdir(root):
+        return []
+    return sorted(
+        name
+        for name in os.listdir(root)
+        if name.startswith("v")
+        and os.path.isfile(os.path.join(root, name, MANIFEST_NAME))
+    )
+
+
+def _prune_snapshots(root: str, keep: int):
+    """현재 스냅샷과 최신 keep개를 제외한 오래된 스냅샷 삭제"""
+    current = current_snapshot_name(root)
+    names = list_snapshots(root)
+    retained = set(names[-keep:]) if keep > 0 else set()
+    for name in names:
+        if name == current or name in retained:
+            continue
+        # 이미 매핑한 프로세스는 파일 삭제 후에도 기존 페이지를 계속 읽을 수 있음
+        shutil.rmtree(os.path.join(root, name), ignore_errors=True)
+
+
+class DinerSnapshot:
+    """메모리 매핑으로 연 음식점 카탈로그 스냅샷"""
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: 스냅샷 디렉토리 경로
+        """
+        self.path = path
+        with open(os.path.join(path, MANIFEST_NAME), encoding="utf-8") as f:
+            self.manifest = json.load(f)
+        if self.manifest.get("format_version") != SNAPSHOT_FORMAT_VERSION:
+            raise ValueError(
+                f"지원하지 않는 스냅샷 형식입니다: {self.manifest.get('format_version')}"
+            )
+
+    @property
+    def version(self) -> str:
+        return self.manifest["version"]
+
+    @property
+    def dataset_version(self) -> str:
+        return self.manifest["dataset_version"]
+
+    @property
+    def watermark(self) -> Optional[str]:
+        """증분 동기화 기준 시각 (updated_at 최댓값, 없으면 None)"""
+        return self.manifest.get("watermark")
+
+    def _load(self, filename: str) -> np.ndarray:
+        return np.load(os.path.join(self.path, filename), mmap_mode="r")
+
+    def _vocab(self, entry: dict[str, Any]) -> np.ndarray:
+        return _decode_strings(self._load(entry["vocab"]), entry["vocab_size"])
+
+    def to_store(self) -> DinerStore:
+        """
+        스냅샷으로 DinerStore 생성
+
+        숫자 컬럼과 범주 코드는 메모리 매핑 배열을 그대로 사용합니다(복사 없음).
+        문자열/리스트 컬럼은 프로세스마다 메모리에 새로 만듭니다.
+
+        Returns:
+            DinerStore 인스턴스
+        """
+        row_count = self.manifest["row_count"]
+        if self.manifest.get("index"):
+            index = pd.Index(self._load(self.manifest["index"]))
+        else:
+            index = pd.RangeIndex(row_count)
+
+        columns: dict[str, Any] = {}
+        list_columns: dict[str, ListColumn] = {}
+        for entry in self.manifest["columns"]:
+            kind = entry["kind"]
+            if kind == "numeric":
+                columns[entry["name"]] = self._load(entry["values"])
+            elif kind == "categorical":
+                categories = pd.Index(
+                    entry["categories"], dtype=entry.get("categories_dtype")
+                )
+                dtype = pd.CategoricalDtype(categories, entry["ordered"])
+                columns[entry["name"]] = pd.Categorical.from_codes(
+                    self._load(entry["codes"]), dtype=dtype, validate=False
+                )
+            elif kind == "masked":
+                array = pd.array(self._load(entry["values"]), dtype=entry["dtype"])
+                array[np.asarray(self._load(entry["mask"]))] = pd.NA
+                columns[entry["name"]] = array
+            elif kind == "string":
+                # 고유 문자열만 dtype으로 변환한 뒤 코드로 모음
+                # (결측 코드 -1은 마지막 원소(None)를 가리킴)
+                vocab = pd.array(
+                    np.append(self._vocab(entry), None), dtype=entry["dtype"]
+                )
+                columns[entry["name"]] = vocab.take(self._load(entry["codes"]))
+            elif kind == "list":
+                packed = ListColumn(
+                    self._load(entry["offsets"]),
+                    self._load(entry["codes"]),
+                    self._vocab(entry),
+                )
+                list_columns[entry["name"]] = packed
+                columns[entry["name"]] = packed.to_lists()
+            else:
+                text = self._load(entry["data"]).tobytes().decode("utf-8")
+                values = np.empty(row_count, dtype=object)
+                values[:] = json.loads(text)
+                columns[entry["name"]] = values
+
+        frame = pd.DataFrame(columns, index=index, copy=False)
+        return DinerStore.from_compact(
+            frame,
+            list_columns,
+            self.manifest.get("source_bytes"),
+            version=self.dataset_version,
+        )
+
+
+def open_snapshot(root: str = SNAPSHOT_DIR) -> Optional[DinerSnapshot]:
+    """
+    CURRENT가 가리키는 스냅샷 열기
+
+    Args:
+        root: 스냅샷 루트 디렉토리
+
+    Returns:
+        DinerSnapshot 또는 None (스냅샷이 없거나 손상된 경우)
+    """
+    name = current_snapshot_name(root)
+    if name is None:
+        return None
+    try:
+        return DinerSnapshot(os.path.join(root, name))
+    except Exception as e:
+        logger.warning(f"스냅샷 열기 실패 ({name}): {e}")
+        return None
+
+
+def load_snapshot_store(root: str = SNAPSHOT_DIR) -> Optional[DinerStore]:
+    """
+    현재 스냅샷으로 DinerStore 로드
+
+    Args:
+        root: 스냅샷 루트 디렉토리
+
+    Returns:
+        DinerStore 또는 None (스냅샷이 없거나 로드 실패)
+    """
+    snapshot = open_snapshot(root)
+    if snapshot is None:
+        return None
+    try:
+        started = time.perf_counter()
+        store = snapshot.to_store()
+        logger.info(
+            f"스냅샷 로드 완료: {snapshot.version} "
+            f"({len(store.frame)}개 음식점, {time.perf_counter() - started:.3f}초)"
+        )
+        return store
+    except Exception as e:
+        logger.warning(f"스냅샷 로드 실패 ({snapshot.path}): {e}")
+        return None
+
+
+def refresh_snapshot(
+    source: str = "api",
+    root: str = SNAPSHOT_DIR,
+    api_url: Optional[str] = None,
+    force: bool = False,
+    incremental: bool = False,
+) -> Optional[str]:
+    """
+    원본 데이터를 받아 새 스냅샷을 만들고 CURRENT를 교체
+
+    Args:
+        source: "api" (yamyam-ops /kakao/diners/) 또는 "csv" (DATA_PATH)
+        root: 스냅샷 루트 디렉토리
+        api_url: API 베이스 URL (None이면 secrets/환경변수)
+        force: 데이터가 현재 스냅샷과 같아도 새로 저장
+        incremental: source가 "api"일 때 현재 스냅샷의 기준 시각 이후 변경분만 받아 반영
+            (스냅샷이나 기준 시각이 없으면 전체 갱신)
+
+    Returns:
+        생성된 스냅샷 이름 (데이터가 없거나 변경이 없으면 None)
+    """
+    if source == "api" and incremental and not force:
+        current = open_snapshot(root)
+        if current is not None and current.watermark is not None:
+            from utils.delta_sync import sync_diner_store
+
+            stats = sync_diner_store(current.to_store(), api_url, root=root)
+            return stats.get("snapshot")
+        logger.info("증분 기준 스냅샷이 없어 전체 갱신합니다.")
+
+    if source == "api":
+        from utils.api_data_loader import stream_diner_store
+
+        store = stream_diner_store(api_url)
+    elif source == "csv":
+        store = DinerStore(load_diner_frame())
+    else:
+        raise ValueError(f"알 수 없는 source: {source}")
+
+    if store.frame.empty:
+        logger.warning("스냅샷 원본 데이터가 비어 있어 갱신하지 않습니다.")
+        return None
+
+    current = open_snapshot(root)
+    if not force and current is not None and current.dataset_version == store.version:
+        logger.info(f"변경 사항이 없어 현재 스냅샷을 유지합니다: {current.version}")
+        return None
+    return write_snapshot(store, root)
+
+
+def main(argv: Optional[list[str]] = None):
+    """스냅샷 관리 CLI"""
+    parser = argparse.ArgumentParser(description="음식점 카탈로그 스냅샷 관리")
+    parser.add_argument("--root", default=SNAPSHOT_DIR, help="스냅샷 루트 디렉토리")
+    subparsers = parser.add_subparsers(dest="command")
+
+    refresh = subparsers.add_parser("refresh", help="새 스냅샷 생성")
+    refresh.add_argument("--source", choices=["api", "csv"], default="api")
+    refresh.add_argument("--api-url", default=None)
+    refresh.add_argument("--force", action="store_true")
+    refresh.add_argument(
+        "--incremental", action="store_true", help="updated_at 이후 변경분만 반영"
+    )
+
+    subparsers.add_parser("info", help="현재 스냅샷 정보 출력")
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    if args.command in (None, "refresh"):
+        name = refresh_snapshot(
+            source=getattr(args, "source", "api"),
+            root=args.root,
+            api_url=getattr(args, "api_url", None),
+            force=getattr(args, "force", False),
+            incremental=getattr(args, "incremental", False),
+        )
+        print(f"현재 스냅샷: {name or current_snapshot_name(args.root)}")
+    elif args.command == "info":
+        snapshot = open_snapshot(args.root)
+        if snapshot is None:
+            print("스냅샷이 없습니다.")
+            return
+        manifest = snapshot.manifest
+        print(f"버전: {manifest['version']}")
+        print(f"생성 시각: {manifest['created_at']}")
+        print(f"음식점 수: {manifest['row_count']}")
+        print(f"기준 시각: {snapshot.watermark or '-'}")
+        print(f"보관 중인 스냅샷: {', '.join(list_snapshots(args.root))}")
+
+
+if __name__ == "__main__":
+    main()
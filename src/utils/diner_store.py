@@ -0,0 +1,727 @@
+# src/utils/diner_store.py
+"""모든 세션이 공유하는 읽기 전용 음식점 데이터 저장소 (범주형/float32/리스트 컬럼 압축)"""
+
+import ast
+import glob
+import itertools
+import logging
+import os
+import sys
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from config.constants import CATEGORY_TABLE_PATH, DATA_PATH
+from utils.category_index import load_category_table
+from utils.dataset_version import register_dataset_version
+
+logger = logging.getLogger(__name__)
+
+# 범주형(category)으로 저장할 카테고리 컬럼
+CATEGORY_COLUMNS = [
+    "diner_category_large",
+    "diner_category_middle",
+    "diner_category_small",
+    "diner_category_detail",
+]
+
+# float32로 저장할 좌표 컬럼
+COORDINATE_COLUMNS = ["diner_lat", "diner_lon"]
+
+# 오프셋 + 값 배열로 압축할 리스트 컬럼
+LIST_COLUMNS = ["diner_menu_name", "diner_tag"]
+
+# 결측 카테고리를 채울 때 사용하는 값 (범주에 항상 포함)
+FILL_CATEGORY = "기타"
+
+
+def _as_list(value: Any) -> list:
+    """리스트 컬럼 값을 리스트로 변환 (CSV의 문자열 표현 포함, 결측값은 빈 리스트)"""
+    if isinstance(value, list):
+        return value
+    if isinstance(value, (tuple, np.ndarray)):
+        return list(value)
+    if isinstance(value, str):
+        text = value.strip()
+        if text.startswith("["):
+            try:
+                parsed = ast.literal_eval(text)
+                return list(parsed) if isinstance(parsed, (list, tuple)) else [parsed]
+            except (ValueError, SyntaxError):
+                pass
+        return [value] if text else []
+    return []
+
+
+# 객체 컬럼 메모리 추정 시 측정할 최대 표본 수
+MEMORY_SAMPLE_SIZE = 20000
+
+
+def _object_bytes(
+    values,
+    sample_size: Optional[int] = MEMORY_SAMPLE_SIZE,
+    include_items: bool = True,
+) -> int:
+    """
+    객체 배열이 참조하는 파이썬 객체의 메모리 합계 추정
+
+    값이 sample_size보다 많으면 균등 간격 표본으로 측정한 뒤 전체 크기로 환산합니다.
+
+    Args:
+        values: 객체 배열
+        sample_size: 최대 표본 수 (None이면 전체 측정)
+        include_items: 리스트/튜플 원소 크기 포함 여부
+    """
+    values = np.asarray(values, dtype=object)
+    scale = 1.0
+    if sample_size is not None and len(values) > sample_size:
+        scale = len(values) / sample_size
+        values = values[np.linspace(0, len(values) - 1, sample_size).astype(np.int64)]
+
+    total = 0
+    for value in values:
+        total += sys.getsizeof(value)
+        if include_items and isinstance(value, (list, tuple)):
+            total += sum(sys.getsizeof(item) for item in value)
+    return int(total * scale)
+
+
+def _column_bytes(series: pd.Series) -> int:
+    """컬럼 메모리 사용량 (객체 컬럼은 원소 크기 포함)"""
+    if series.dtype == object:
+        return series.memory_usage(index=False, deep=False) + _object_bytes(series)
+    return int(series.memory_usage(index=False, deep=True))
+
+
+class ListColumn:
+    """
+    리스트 컬럼을 오프셋 + 값 배열로 저장
+
+    행 i의 항목은 vocab[codes[offsets[i]:offsets[i + 1]]] 입니다.
+    같은 문자열(메뉴명, 태그)은 vocab에 한 번만 저장되고 행에는 정수 코드만 남습니다.
+    """
+
+    def __init__(self, offsets: np.ndarray, codes: np.ndarray, vocab: np.ndarray):
+        """
+        Args:
+            offsets: 행별 시작 위치 배열 (길이 = 행 수 + 1)
+            codes: 항목 코드 배열 (vocab 위치)
+            vocab: 고유 항목 배열
+        """
+        self.offsets = offsets
+        self.codes = codes
+        self.vocab = vocab
+        for array in (self.offsets, self.codes):
+            array.flags.writeable = False
+
+    @classmethod
+    def from_values(cls, values) -> "ListColumn":
+        """
+        리스트(또는 리스트 문자열 표현) 값 배열로 생성
+
+        Args:
+            values: 행별 리스트 값 배열
+
+        Returns:
+            ListColumn 인스턴스
+        """
+        lists = [_as_list(value) for value in values]
+        lengths = np.fromiter(map(len, lists), dtype=np.int64, count=len(lists))
+        offsets = np.zeros(len(lists) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+
+        items = np.empty(int(offsets[-1]), dtype=object)
+        items[:] = list(itertools.chain.from_iterable(lists))
+        codes, vocab = pd.factorize(items)
+        return cls(offsets, codes.astype(np.int32), np.asarray(vocab, dtype=object))
+
+    @classmethod
+    def concat(cls, parts: list["ListColumn"]) -> "ListColumn":
+        """
+        여러 ListColumn을 행 순서대로 이어 붙임 (고유 항목 사전 병합)
+
+        Args:
+            parts: ListColumn 리스트
+
+        Returns:
+            ListColumn 인스턴스
+        """
+        if not parts:
+            return cls.from_values([])
+
+        global_codes, vocab = pd.factorize(
+            np.concatenate([part.vocab for part in parts])
+        )
+        offsets, codes = [], []
+        vocab_start, row_start = 0, 0
+        for part in parts:
+            mapping = global_codes[vocab_start : vocab_start + len(part.vocab)]
+            codes.append(mapping[part.codes].astype(np.int32))
+            offsets.append(part.offsets[:-1] + row_start)
+            vocab_start += len(part.vocab)
+            row_start += int(part.offsets[-1])
+        offsets.append(np.array([row_start], dtype=np.int64))
+        return cls(
+            np.concatenate(offsets).astype(np.int64),
+            np.concatenate(codes),
+            np.asarray(vocab, dtype=object),
+        )
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, row: int) -> list:
+        start, end = self.offsets[row], self.offsets[row + 1]
+        return self.vocab[self.codes[start:end]].tolist()
+
+    def lengths(self) -> np.ndarray:
+        """행별 항목 수"""
+        return np.diff(self.offsets)
+
+    def take(self, rows: np.ndarray) -> "ListColumn":
+        """
+        지정한 행들만 순서대로 모은 ListColumn (고유 항목 사전은 공유)
+
+        Args:
+            rows: 행 위치 배열
+
+        Returns:
+            ListColumn 인스턴스
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        lengths = self.lengths()[rows]
+        offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        # 각 항목의 원본 위치 = 원본 행 시작 위치 + 행 안에서의 순번
+        item_positions = np.repeat(self.offsets[:-1][rows] - offsets[:-1], lengths)
+        item_positions += np.arange(offsets[-1], dtype=np.int64)
+        return ListColumn(offsets, self.codes[item_positions], self.vocab)
+
+    def to_lists(self, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        행별 파이썬 리스트 객체 배열 생성
+
+        리스트의 원소는 vocab의 문자열 객체를 그대로 참조하므로 문자열은 복제되지 않습니다.
+
+        Args:
+            rows: 행 위치 배열 (None이면 전체)
+
+        Returns:
+            리스트를 담은 object 배열
+        """
+        flat = self.vocab[self.codes].tolist()
+        offsets = self.offsets.tolist()
+        if rows is None:
+            rows = range(len(self))
+        result = np.empty(len(rows), dtype=object)
+        result[:] = [flat[offsets[row] : offsets[row + 1]] for row in rows]
+        return result
+
+    @property
+    def nbytes(self) -> int:
+        """오프셋/코드 배열과 고유 항목 문자열의 메모리 합계"""
+        return (
+            self.offsets.nbytes
+            + self.codes.nbytes
+            + self.vocab.nbytes
+            + _object_bytes(self.vocab)
+        )
+
+
+class DinerDelta:
+    """
+    증분 동기화 한 번으로 바뀐 행 위치 정보
+
+    Attributes:
+        old_to_new: 이전 행 위치 → 새 행 위치 배열 (삭제된 행은 -1)
+        removed: 삭제된 이전 행 위치 (오름차순)
+        updated_old: 내용이 바뀐 이전 행 위치 (오름차순, 새 위치는 old_to_new로 조회)
+        changed: 추가/수정된 새 행 위치 (오름차순)
+        n_inserted: 새로 추가된 행 수
+        stale_old: 인덱스에서 빼야 하는 이전 행 위치 (삭제 + 수정, 오름차순)
+    """
+
+    def __init__(
+        self,
+        old_to_new: np.ndarray,
+        removed: np.ndarray,
+        updated_old: np.ndarray,
+        changed: np.ndarray,
+        n_inserted: int,
+    ):
+        self.old_to_new = old_to_new
+        self.removed = removed
+        self.updated_old = updated_old
+        self.changed = changed
+        self.n_inserted = n_inserted
+        # 인덱스에서 빼야 하는 이전 행 위치 (삭제 + 수정, 오름차순)
+        self.stale_old = np.union1d(removed, updated_old)
+
+    @property
+    def is_empty(self) -> bool:
+        return len(self.removed) == 0 and len(self.changed) == 0
+
+    def summary(self) -> dict[str, int]:
+        """변경 건수 요약"""
+        return {
+            "inserted": self.n_inserted,
+            "updated": len(self.updated_old),
+            "deleted": len(self.removed),
+        }
+
+
+class DinerStore:
+    """
+    음식점 데이터 압축 저장소
+
+    카테고리 컬럼은 범주형, 좌표는 float32, 메뉴/태그 리스트는 ListColumn으로 저장합니다.
+    frame의 리스트 컬럼 값은 ListColumn의 고유 문자열을 참조하는 리스트이므로
+    같은 메뉴명/태그 문자열이 행마다 복제되지 않습니다.
+
+    Note:
+        frame은 모든 세션이 공유하는 읽기 전용 DataFrame입니다.
+        컬럼을 추가/수정해야 하면 필터링한 결과나 copy()에 대해 수행해야 합니다.
+        데이터셋 버전(version)은 frame을 만들 때 한 번만 계산하여 등록합니다.
+    """
+
+    def __init__(self, df: pd.DataFrame, category_table: Optional[pd.DataFrame] = None):
+        """
+        Args:
+            df: 원본 음식점 DataFrame
+            category_table: 카테고리 계층 테이블 (None이면 category_table.csv 로드)
+        """
+        self.source_bytes = {column: _column_bytes(df[column]) for column in df.columns}
+        self.list_columns: dict[str, ListColumn] = {}
+
+        frame = df.copy()
+        if not frame.empty:
+            if category_table is None and any(c in frame for c in CATEGORY_COLUMNS):
+                category_table = load_category_table(CATEGORY_TABLE_PATH)
+            self._compact_categories(frame, category_table)
+            self._compact_coordinates(frame)
+            self._pack_lists(frame)
+            self._add_regions(frame)
+        self.frame = frame
+        self.version = register_dataset_version(frame)
+
+        if not frame.empty:
+            report = self.memory_report()
+            logger.info(
+                f"음식점 저장소 생성 완료: {len(frame)}개 음식점, "
+                f"{report['source_bytes'].sum() / 2**20:.1f}MB → "
+                f"{report['store_bytes'].sum() / 2**20:.1f}MB"
+            )
+
+    @classmethod
+    def from_compact(
+        cls,
+        frame: pd.DataFrame,
+        list_columns: dict[str, ListColumn],
+        source_bytes: Optional[dict[str, int]] = None,
+        version: Optional[str] = None,
+    ) -> "DinerStore":
+        """
+        이미 압축된 frame과 리스트 컬럼으로 생성 (스냅샷 로드 등, 변환 과정 생략)
+
+        Args:
+            frame: 압축된 음식점 DataFrame
+            list_columns: {컬럼명: ListColumn}
+            source_bytes: 원본 컬럼별 메모리 사용량 (memory_report 비교용)
+            version: frame의 데이터셋 버전 (스냅샷 manifest 등, None이면 계산)
+
+        Returns:
+            DinerStore 인스턴스
+        """
+        store = cls.__new__(cls)
+        store.frame = frame
+        store.list_columns = dict(list_columns)
+        store.source_bytes = dict(source_bytes or {})
+        store.version = register_dataset_version(frame, version)
+        return store
+
+    @staticmethod
+    def _compact_categories(
+        frame: pd.DataFrame, category_table: Optional[pd.DataFrame]
+    ):
+        """카테고리 컬럼을 범주형으로 변환 (범주: 데이터 값 + 카테고리 테이블 값 + 기타)"""
+        for column in CATEGORY_COLUMNS:
+            if column not in frame.columns:
+                continue
+            values = frame[column].astype(object).where(frame[column].notna(), None)
+            names = set(values.dropna())
+            if category_table is not None and column in category_table.columns:
+                names |= set(category_table[column].dropna())
+            names.add(FILL_CATEGORY)
+            dtype = pd.CategoricalDtype(sorted(names, key=str))
+            frame[column] = values.astype(dtype)
+
+    @staticmethod
+    def _compact_coordinates(frame: pd.DataFrame):
+        """좌표 컬럼을 float32로 변환"""
+        for column in COORDINATE_COLUMNS:
+            if column in frame.columns:
+                frame[column] = pd.to_numeric(frame[column], errors="coerce").astype(
+                    np.float32
+                )
+
+    def _pack_lists(self, frame: pd.DataFrame):
+        """리스트 컬럼을 ListColumn으로 압축하고 frame에는 문자열을 공유하는 리스트로 저장"""
+        for column in LIST_COLUMNS:
+            if column not in frame.columns:
+                continue
+            packed = ListColumn.from_values(frame[column].to_numpy(dtype=object))
+            self.list_columns[column] = packed
+            frame[column] = pd.Series(packed.to_lists(), index=frame.index)
+
+    @staticmethod
+    def _add_regions(frame: pd.DataFrame):
+        """지번 주소에서 시/구(city/region) 범주형 컬럼 생성"""
+        if "diner_num_address" not in frame.columns or "city" in frame.columns:
+            return
+        parts = (
+            frame["diner_num_address"]
+            .astype("string")
+            .str.split(" ", n=2, expand=True)
+            .reindex(columns=[0, 1])
+        )
+        frame["city"] = parts[0].astype("category")
+        frame["region"] = parts[1].astype("category")
+
+    def list_column(self, column: str) -> Optional[ListColumn]:
+        """압축된 리스트 컬럼 반환 (없으면 None)"""
+        return self.list_columns.get(column)
+
+    def watermark(self) -> Optional[str]:
+        """
+        증분 동기화 기준 시각 (updated_at 최댓값, ISO 8601 문자열)
+
+        Returns:
+            기준 시각 문자열 또는 None (updated_at 컬럼이 없거나 비어 있음)
+        """
+        if "updated_at" not in self.frame.columns or self.frame.empty:
+            return None
+        latest = pd.to_datetime(self.frame["updated_at"], errors="coerce", utc=True)
+        latest = latest.max()
+        return None if pd.isna(latest) else latest.isoformat()
+
+    def _align_upserts(
+        self, upserts: pd.DataFrame
+    ) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        변경 행을 저장소와 같은 dtype으로 변환하고 범주형 컬럼의 범주를 합침
+
+        Returns:
+            (범주가 확장된 기존 frame, 변환된 변경 행 DataFrame)
+        """
+        frame = self.frame
+        upserts = upserts.reset_index(drop=True).copy()
+        self._compact_coordinates(upserts)
+        if "city" in frame.columns:
+            self._add_regions(upserts)
+
+        columns = list(frame.columns) + [
+            column for column in upserts.columns if column not in frame.columns
+        ]
+        frame = frame.reindex(columns=columns, copy=False)
+        upserts = upserts.reindex(columns=columns)
+
+        for column in columns:
+            dtype = frame[column].dtype
+            if isinstance(dtype, pd.CategoricalDtype):
+                values = (
+                    upserts[column].astype(object).where(upserts[column].notna(), None)
+                )
+                new_names = sorted(
+                    set(values.dropna()) - set(dtype.categories), key=str
+                )
+                if new_names:
+                    # 기존 코드가 유지되도록 새 범주는 뒤에 추가
+                    frame[column] = frame[column].cat.add_categories(new_names)
+                upserts[column] = values.astype(frame[column].dtype)
+            elif column in COORDINATE_COLUMNS:
+                upserts[column] = upserts[column].astype(dtype)
+        return frame, upserts
+
+    def apply_delta(
+        self, upserts: pd.DataFrame, deleted_ids: Optional[list] = None
+    ) -> tuple["DinerStore", DinerDelta]:
+        """
+        변경 행(upsert)과 삭제 ID(tombstone)를 반영한 새 저장소 생성
+
+        기존 행의 상대 순서는 유지하고, 수정된 행은 같은 자리에서 교체하며
+        새 행은 끝에 추가합니다. 기존 저장소는 바뀌지 않습니다.
+
+        Args:
+            upserts: 추가/수정된 음식점 DataFrame (diner_idx 필수)
+            deleted_ids: 삭제된 diner_idx 목록
+
+        Returns:
+            (새 DinerStore, 행 위치 변경 정보)
+        """
+        if "diner_idx" not in self.frame.columns:
+            raise ValueError("diner_idx 컬럼이 없는 저장소는 증분 반영할 수 없습니다.")
+
+        frame = self.frame
+        n_old = len(frame)
+        ids = frame["diner_idx"].astype(str)
+        deleted = pd.Index([str(idx) for idx in (deleted_ids or [])])
+
+        if upserts is None or upserts.empty:
+            upserts = frame.iloc[0:0]
+        upserts = upserts[~upserts["diner_idx"].astype(str).isin(deleted)]
+        upserts = upserts.drop_duplicates(subset="diner_idx", keep="last")
+
+        existing = pd.Index(ids).get_indexer(upserts["diner_idx"].astype(str))
+        is_update = existing >= 0
+        keep = ~ids.isin(deleted).to_numpy()
+        old_to_new = np.where(keep, np.cumsum(keep) - 1, -1).astype(np.int64)
+
+        # 합친 행 번호: 0..n_old-1은 기존 행, n_old + j는 변경 행 j
+        source = np.arange(n_old, dtype=np.int64)
+        source[existing[is_update]] = n_old + np.flatnonzero(is_update)
+        inserted = n_old + np.flatnonzero(~is_update)
+        order = np.concatenate([source[keep], inserted])
+
+        base, aligned = self._align_upserts(upserts)
+        new_frame = pd.concat([base, aligned], ignore_index=True).iloc[order]
+        new_frame = new_frame.reset_index(drop=True)
+
+        list_columns = {}
+        for column, packed in self.list_columns.items():
+            values = (
+                aligned[column].to_numpy(dtype=object)
+                if column in aligned.columns
+                else [None] * len(aligned)
+            )
+            combined = ListColumn.concat([packed, ListColumn.from_values(values)])
+            list_columns[column] = combined.take(order)
+            # 기존 행의 리스트 객체는 재사용하고 변경 행만 새로 만듦
+            lists = np.concatenate(
+                [
+                    frame[column].to_numpy(dtype=object),
+                    combined.to_lists(np.arange(n_old, len(combined))),
+                ]
+            )
+            new_frame[column] = pd.Series(lists[order], index=new_frame.index)
+
+        updated_old = np.sort(existing[is_update]).astype(np.int64)
+        n_kept = int(keep.sum())
+        changed = np.union1d(
+            old_to_new[updated_old],
+            np.arange(n_kept, n_kept + len(inserted), dtype=np.int64),
+        )
+        delta = DinerDelta(
+            old_to_new=old_to_new,
+            removed=np.flatnonzero(~keep).astype(np.int64),
+            updated_old=updated_old,
+            changed=changed.astype(np.int64),
+            n_inserted=len(inserted),
+        )
+        store = DinerStore.from_compact(new_frame, list_columns, self.source_bytes)
+        return store, delta
+
+    def replace_with(self, other: "DinerStore"):
+        """다른 저장소의 내용으로 교체 (공유 싱글톤 갱신용, frame은 마지막에 교체)"""
+        self.list_columns = other.list_columns
+        self.source_bytes = other.source_bytes
+        self.version = other.version
+        self.frame = other.frame
+
+    def memory_report(self) -> pd.DataFrame:
+        """
+        컬럼별 메모리 사용량 비교
+
+        Returns:
+            column, source_dtype, store_dtype, source_bytes, store_bytes, packed_bytes 컬럼의
+            DataFrame (packed_bytes는 리스트 컬럼의 오프셋 + 값 배열 크기)
+        """
+        rows = []
+        for column in self.frame.columns:
+            series = self.frame[column]
+            store_bytes = int(series.memory_usage(index=False, deep=False))
+            if column in self.list_columns:
+                # 리스트 객체(원소 포인터)와 공유 문자열(vocab)만 계산
+                store_bytes += _object_bytes(series, include_items=False)
+                store_bytes += _object_bytes(self.list_columns[column].vocab)
+            else:
+                store_bytes = _column_bytes(series)
+            packed = self.list_columns.get(column)
+            rows.append(
+                {
+                    "column": column,
+                    "store_dtype": str(series.dtype),
+                    "source_bytes": self.source_bytes.get(column, 0),
+                    "store_bytes": store_bytes,
+                    "packed_bytes": packed.nbytes if packed is not None else 0,
+                }
+            )
+        return pd.DataFrame(
+            rows,
+            columns=[
+                "column",
+                "store_dtype",
+                "source_bytes",
+                "store_bytes",
+                "packed_bytes",
+            ],
+        )
+
+
+class DinerStoreBuilder:
+    """
+    페이지 단위로 받은 음식점 레코드를 압축하여 누적하는 컬럼 빌더
+
+    페이지마다 카테고리는 범주형, 좌표는 float32, 메뉴/태그 리스트는 ListColumn으로 바로
+    변환하고 원본 레코드는 버리므로, 전체 JSON을 메모리에 올리지 않고 DinerStore를 만듭니다.
+    """
+
+    def __init__(self, category_table: Optional[pd.DataFrame] = None):
+        """
+        Args:
+            category_table: 카테고리 계층 테이블 (None이면 build 시 category_table.csv 로드)
+        """
+        self.category_table = category_table
+        self.source_bytes: dict[str, int] = {}
+        self.n_rows = 0
+        self._chunks: list[pd.DataFrame] = []
+        self._lists: dict[str, list[ListColumn]] = {}
+        self._list_rows: dict[str, int] = {}
+        self._seen_ids: set = set()
+
+    def _pad_lists(self, column: str, n_rows: int):
+        """리스트 컬럼이 없던 구간을 빈 리스트로 채움"""
+        missing = n_rows - self._list_rows.get(column, 0)
+        if missing > 0:
+            self._lists.setdefault(column, []).append(
+                ListColumn.from_values([None] * missing)
+            )
+            self._list_rows[column] = n_rows
+
+    def append(self, records) -> int:
+        """
+        레코드 한 페이지 추가 (이미 추가된 diner_idx는 제외)
+
+        Args:
+            records: 음식점 딕셔너리 리스트 또는 DataFrame
+
+        Returns:
+            새로 추가된 행 수
+        """
+        chunk = (
+            records.reset_index(drop=True)
+            if isinstance(records, pd.DataFrame)
+            else pd.DataFrame.from_records(records)
+        )
+        if chunk.empty:
+            return 0
+
+        if "diner_idx" in chunk.columns:
+            ids = chunk["diner_idx"]
+            duplicated = ids.isin(self._seen_ids) | ids.duplicated()
+            if duplicated.any():
+                chunk = chunk[~duplicated.to_numpy()].reset_index(drop=True)
+            self._seen_ids.update(chunk["diner_idx"].tolist())
+            if chunk.empty:
+                return 0
+
+        for column in chunk.columns:
+            self.source_bytes[column] = self.source_bytes.get(column, 0) + (
+                _column_bytes(chunk[column])
+            )
+
+        for column in CATEGORY_COLUMNS:
+            if column in chunk.columns:
+                chunk[column] = chunk[column].astype("category")
+        DinerStore._compact_coordinates(chunk)
+
+        for column in LIST_COLUMNS:
+            if column not in chunk.columns:
+                continue
+            self._pad_lists(column, self.n_rows)
+            self._lists.setdefault(column, []).append(
+                ListColumn.from_values(chunk[column].to_numpy(dtype=object))
+            )
+            self._list_rows[column] = self.n_rows + len(chunk)
+            chunk = chunk.drop(columns=column)
+
+        self._chunks.append(chunk)
+        self.n_rows += len(chunk)
+        return len(chunk)
+
+    def build(self) -> DinerStore:
+        """
+        누적한 페이지로 DinerStore 생성
+
+        Returns:
+            DinerStore 인스턴스
+        """
+        if not self._chunks:
+            return DinerStore(pd.DataFrame())
+
+        frame = pd.concat(self._chunks, ignore_index=True)
+        self._chunks = []
+
+        category_table = self.category_table
+        if category_table is None and any(c in frame for c in CATEGORY_COLUMNS):
+            category_table = load_category_table(CATEGORY_TABLE_PATH)
+        DinerStore._compact_categories(frame, category_table)
+
+        list_columns = {}
+        for column in list(self._lists):
+            self._pad_lists(column, self.n_rows)
+            packed = ListColumn.concat(self._lists.pop(column))
+            list_columns[column] = packed
+            frame[column] = pd.Series(packed.to_lists(), index=frame.index)
+        DinerStore._add_regions(frame)
+
+        store = DinerStore.from_compact(frame, list_columns, self.source_bytes)
+        logger.info(f"음식점 저장소 생성 완료 (페이지 누적): {len(frame)}개 음식점")
+        return store
+
+
+def load_diner_frame(pattern: str = DATA_PATH) -> pd.DataFrame:
+    """
+    로컬 음식점 CSV 로드 (카테고리 테이블 제외, 파일이 없으면 빈 DataFrame)
+
+    Args:
+        pattern: CSV 파일 glob 패턴
+
+    Returns:
+        음식점 DataFrame
+    """
+    paths = [
+        path
+        for path in sorted(glob.glob(pattern))
+        if os.path.abspath(path) != os.path.abspath(CATEGORY_TABLE_PATH)
+    ]
+    frames = []
+    for path in paths:
+        try:
+            frames.append(pd.read_csv(path, encoding="utf-8-sig"))
+        except Exception as e:
+            logger.warning(f"음식점 데이터 로드 실패 ({path}): {e}")
+    if not frames:
+        return pd.DataFrame()
+
+    df = pd.concat(frames, ignore_index=True)
+    if "diner_idx" in df.columns:
+        df = df.drop_duplicates(subset="diner_idx", keep="last", ignore_index=True)
+    return df
+
+
+@st.cache_resource(show_spinner=False)
+def get_diner_store() -> DinerStore:
+    """
+    모든 세션이 공유하는 음식점 저장소 싱글톤 반환 (프로세스당 한 번 로드)
+
+    현재 스냅샷이 있으면 메모리 매핑으로 열고, 없으면 로컬 CSV에서 생성합니다.
+    """
+    # 순환 import 방지 (diner_snapshot이 DinerStore를 사용)
+    from utils.diner_snapshot import load_snapshot_store
+
+    store = load_snapshot_store()
+    if store is not None:
+        return store
+    return DinerStore(load_diner_frame())
@@ -0,0 +1,107 @@
+# src/utils/distance.py
+"""NumPy 기반 거리 계산 유틸리티"""
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+# 지구 반지름 (km) - data_processing.haversine 과 동일한 값
+EARTH_RADIUS_KM = 6371.0
+
+
+def _result_dtype(*values) -> np.dtype:
+    """입력값이 모두 float32 배열이면 float32, 그 외에는 float64를 반환"""
+    dtypes = [np.asarray(v).dtype for v in values if np.ndim(v) > 0]
+    if dtypes and all(dtype == np.float32 for dtype in dtypes):
+        return np.dtype(np.float32)
+    return np.dtype(np.float64)
+
+
+def haversine_np(lat1: ArrayLike, lon1: ArrayLike, lat2: ArrayLike, lon2: ArrayLike):
+    """
+    두 지점(또는 지점 배열) 사이의 대원 거리를 km 단위로 계산합니다.
+
+    스칼라와 배열을 자유롭게 섞어 쓸 수 있으며 NumPy 브로드캐스팅 규칙을 따릅니다.
+    내부 계산은 float64로 수행하므로 스칼라 haversine과 같은 결과를 돌려주고,
+    입력 배열이 모두 float32이면 결과도 float32로 반환합니다.
+
+    Args:
+        lat1: 기준 위도 (스칼라 또는 배열)
+        lon1: 기준 경도 (스칼라 또는 배열)
+        lat2: 대상 위도 (스칼라 또는 배열)
+        lon2: 대상 경도 (스칼라 또는 배열)
+
+    Returns:
+        거리 (km). 입력이 모두 스칼라면 float, 아니면 np.ndarray
+    """
+    out_dtype = _result_dtype(lat1, lon1, lat2, lon2)
+
+    lat1, lon1, lat2, lon2 = (
+        np.radians(np.asarray(v, dtype=np.float64)) for v in (lat1, lon1, lat2, lon2)
+    )
+
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    # 부동소수점 오차로 a가 [0, 1]을 벗어나는 경우 방지
+    a = np.clip(a, 0.0, 1.0)
+    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+    distance = EARTH_RADIUS_KM * c
+
+    if np.ndim(distance) == 0:
+        return float(distance)
+    return distance.astype(out_dtype, copy=False)
+
+
+def haversine_matrix(
+    origin_lats: ArrayLike,
+    origin_lons: ArrayLike,
+    lats: ArrayLike,
+    lons: ArrayLike,
+) -> np.ndarray:
+    """
+    여러 기준점과 여러 대상점 사이의 거리 행렬을 계산합니다.
+
+    Args:
+        origin_lats: 기준 위도 배열 (길이 M)
+        origin_lons: 기준 경도 배열 (길이 M)
+        lats: 대상 위도 배열 (길이 N)
+        lons: 대상 경도 배열 (길이 N)
+
+    Returns:
+        (M, N) 거리 행렬 (km)
+    """
+    origin_lats = np.atleast_1d(np.asarray(origin_lats))
+    origin_lons = np.atleast_1d(np.asarray(origin_lons))
+    lats = np.atleast_1d(np.asarray(lats))
+    lons = np.atleast_1d(np.asarray(lons))
+
+    return np.asarray(
+        haversine_np(
+            origin_lats[:, np.newaxis],
+            origin_lons[:, np.newaxis],
+            lats[np.newaxis, :],
+            lons[np.newaxis, :],
+        )
+    )
+
+
+def distances_from(df, user_lat: float, user_lon: float) -> np.ndarray:
+    """
+    DataFrame의 diner_lat/diner_lon 컬럼 전체에 대해 사용자 위치로부터의 거리를 계산합니다.
+
+    Args:
+        df: diner_lat, diner_lon 컬럼이 있는 DataFrame
+        user_lat: 사용자 위도
+        user_lon: 사용자 경도
+
+    Returns:
+        각 행의 거리 (km) 배열
+    """
+    return np.atleast_1d(
+        haversine_np(
+            user_lat,
+            user_lon,
+            df["diner_lat"].to_numpy(dtype=np.float64),
+            df["diner_lon"].to_numpy(dtype=np.float64),
+        )
+    )
@@ -1,17 +1,49 @@
 import json
-from typing import Any
+import logging
+import threading
+from datetime import datetime, timezone
+from typing import Any, Optional
 
 import firebase_admin
 import streamlit as st
 from firebase_admin import firestore
 
+from config.constants import (
+    FIREBASE_LOG_BATCH_SIZE,
+    FIREBASE_LOG_BLOCK_TIMEOUT,
+    FIREBASE_LOG_DROP_POLICY,
+    FIREBASE_LOG_FLUSH_INTERVAL_MS,
+    FIREBASE_LOG_MAX_RETRIES,
+    FIREBASE_LOG_QUEUE_MAX,
+    FIREBASE_LOG_READ_FLUSH_TIMEOUT,
+    FIREBASE_LOG_SHUTDOWN_TIMEOUT,
+)
+from utils.batch_writer import BatchWriter
+from utils.log_dedup import get_activity_deduplicator
+
+logger = logging.getLogger(__name__)
+
 
 class FirebaseLogger:
     """Firebase Firestore를 사용한 사용자 활동 로깅 시스템 (컬렉션별 분리)"""
 
     def __init__(self):
         self.db = None
+        self.writer = None
         self._initialize_firestore()
+        if self.db is not None:
+            # 활동 로그는 렌더링 경로에서 기다리지 않도록 백그라운드에서 배치로 기록
+            self.writer = BatchWriter(
+                self._commit_logs,
+                batch_size=FIREBASE_LOG_BATCH_SIZE,
+                flush_interval_ms=FIREBASE_LOG_FLUSH_INTERVAL_MS,
+                max_queue=FIREBASE_LOG_QUEUE_MAX,
+                drop_policy=FIREBASE_LOG_DROP_POLICY,
+                block_timeout=FIREBASE_LOG_BLOCK_TIMEOUT,
+                max_retries=FIREBASE_LOG_MAX_RETRIES,
+                shutdown_timeout=FIREBASE_LOG_SHUTDOWN_TIMEOUT,
+                name="what2eat-firebase-logger",
+            )
 
     def _initialize_firestore(self):
         """Firestore 클라이언트 초기화"""
@@ -54,33 +86,57 @@ class FirebaseLogger:
     def _log_to_collection(
         self, uid: str, collection_name: str, activity_type: str, detail: dict[str, Any]
     ) -> bool:
-        """특정 컬렉션에 로그 저장"""
+        """
+        특정 컬렉션에 저장할 로그를 기록 대기열에 추가 (Firestore 기록을 기다리지 않음)
+
+        세션 정보는 호출 스레드에서 읽고, 배치 기록 지연과 관계없이 이벤트 발생 시각이
+        남도록 client_timestamp를 함께 저장합니다.
+
+        Returns:
+            대기열 추가 여부
+        """
         if not self.is_available():
             return False
 
         try:
-            log_ref = (
-                self.db.collection("users")
-                .document(uid)
-                .collection(collection_name)
-                .document()
-            )
-
             log_data = {
                 "type": activity_type,
                 "detail": detail,
                 "timestamp": firestore.SERVER_TIMESTAMP,
+                "client_timestamp": datetime.now(timezone.utc),
                 "session_id": st.session_state.get("session_id", "unknown"),
                 "user_agent": st.session_state.get("user_agent", "unknown"),
             }
-
-            log_ref.set(log_data)
-            return True
+            return self.writer.put((uid, collection_name, log_data))
 
         except Exception as e:
-            st.error(f"❌ {collection_name} 로그 저장 중 오류가 발생했습니다: {str(e)}")
+            # 로그 실패는 사용자 화면에 노출하지 않음
+            logger.warning(f"{collection_name} 로그 대기열 추가 실패: {e}")
             return False
 
+    def _commit_logs(self, logs: list[tuple[str, str, dict[str, Any]]]):
+        """
+        (uid, 컬렉션 이름, 로그) 리스트를 Firestore 배치 쓰기 한 번으로 저장
+
+        BatchWriter의 기록 스레드에서 호출되며, 실패하면 예외를 그대로 전달해 재시도합니다.
+        """
+        batch = self.db.batch()
+        for uid, collection_name, log_data in logs:
+            log_ref = (
+                self.db.collection("users")
+                .document(uid)
+                .collection(collection_name)
+                .document()
+            )
+            batch.set(log_ref, log_data)
+        batch.commit()
+
+    def flush_logs(self, timeout: Optional[float] = None) -> bool:
+        """대기 중인 로그를 즉시 기록하고 완료를 기다림 (timeout 초)"""
+        if self.writer is None:
+            return True
+        return self.writer.flush(timeout)
+
     # ========== 인증 관련 로그 (auth_logs) ==========
     def log_login(self, uid: str, login_method: str = "email"):
         """로그인 로그"""
@@ -101,7 +157,7 @@ class FirebaseLogger:
     def log_page_visit(self, uid: str, page_name: str):
         """페이지 방문 로그"""
         detail = {"page_name": page_name}
-        return self._log_to_collection(uid, "navigation_logs", "page_visit", detail)
+        return self.log_user_activity(uid, "page_visit", detail)
 
     def log_chat_step_progress(self, uid: str, step: str):
         """채팅 단계 진행 로그"""
@@ -270,14 +326,43 @@ class FirebaseLogger:
     def log_user_activity(
         self, uid: str, activity_type: str, detail: dict[str, Any]
     ) -> bool:
-        """기존 호환성을 위한 통합 로그 메서드 (컬렉션 자동 분류)"""
-        # 활동 타입에 따라 적절한 컬렉션으로 자동 분류
+        """
+        기존 호환성을 위한 통합 로그 메서드 (컬렉션 자동 분류)
+
+        rerun마다 반복되는 page_visit은 방문 하나와 page_dwell(머문 시간)로 묶고,
+        같은 로그가 짧은 시간 안에 반복되면 한 번만 저장합니다 (ActivityDeduplicator).
+        중복으로 생략된 로그는 이미 저장된 것으로 보고 True를 반환합니다.
+        """
+        if not self.is_available():
+            return False
+
+        results = [
+            self._log_to_collection(
+                event_uid,
+                self._collection_for(event_type),
+                event_type,
+                event_detail,
+            )
+            for event_uid, event_type, event_detail in get_activity_deduplicator().process(
+                uid, activity_type, detail
+            )
+        ]
+        return all(results)
+
+    @staticmethod
+    def _collection_for(activity_type: str) -> str:
+        """활동 유형에 맞는 로그 컬렉션 이름"""
         if activity_type in ["login", "signup", "logout"]:
-            collection_name = "auth_logs"
-        elif activity_type in ["page_visit", "chat_step_progress", "location_change"]:
-            collection_name = "navigation_logs"
+            return "auth_logs"
+        elif activity_type in [
+            "page_visit",
+            "page_dwell",
+            "chat_step_progress",
+            "location_change",
+        ]:
+            return "navigation_logs"
         elif activity_type in ["location_search", "menu_search", "chat_interaction"]:
-            collection_name = "search_logs"
+            return "search_logs"
         elif activity_type in [
             "category_filter",
             "ranking_view",
@@ -285,14 +370,14 @@ class FirebaseLogger:
             "search_method_selection",
             "sort_option_change",
         ]:
-            collection_name = "interaction_logs"
+            return "interaction_logs"
         elif activity_type in [
             "restaurant_click",
             "restaurant_detail_view",
             "map_view",
             "restaurant_favorite",
         ]:
-            collection_name = "restaurant_logs"
+            return "restaurant_logs"
         elif activity_type in [
             "profile_created",
             "profile_updated",
@@ -301,12 +386,10 @@ class FirebaseLogger:
             "onboarding_completed",
             "taste_rating_submitted",
         ]:
-            collection_name = "onboarding_logs"
+            return "onboarding_logs"
         else:
             # 분류되지 않은 활동은 기존 activity_logs에 저장
-            collection_name = "activity_logs"
-
-        return self._log_to_collection(uid, collection_name, activity_type, detail)
+            return "activity_logs"
 
     # ========== 사용자 위치 관리 ==========
     def save_user_location(
@@ -377,6 +460,9 @@ class FirebaseLogger:
         if not self.is_available():
             return []
 
+        # 방금 남긴 로그(로그인, 온보딩 완료 등)가 조회되도록 대기 중인 로그를 먼저 기록
+        self.flush_logs(FIREBASE_LOG_READ_FLUSH_TIMEOUT)
+
         try:
             all_logs = []
 
@@ -443,6 +529,8 @@ class FirebaseLogger:
         if not self.is_available():
             return {}
 
+        self.flush_logs(FIREBASE_LOG_READ_FLUSH_TIMEOUT)
+
         try:
             collections = [
                 "auth_logs",
@@ -502,13 +590,17 @@ class FirebaseLogger:
 
 # 전역 Firebase Logger 인스턴스
 _firebase_logger = None
+# 첫 rerun에서 여러 세션이 동시에 호출해도 기록 스레드(BatchWriter)는 하나만 생성
+_firebase_logger_lock = threading.Lock()
 
 
 def get_firebase_logger() -> FirebaseLogger:
     """Firebase Logger 싱글톤 인스턴스 반환"""
     global _firebase_logger
     if _firebase_logger is None:
-        _firebase_logger = FirebaseLogger()
+        with _firebase_logger_lock:
+            if _firebase_logger is None:
+                _firebase_logger = FirebaseLogger()
     return _firebase_logger
 
 
@@ -5,6 +5,8 @@ import folium
 import pandas as pd
 from streamlit_folium import st_folium
 
+from utils.profiler import profiled
+
 
 class FoliumMapRenderer:
     """Folium 지도 렌더링 클래스"""
@@ -97,6 +99,7 @@ class FoliumMapRenderer:
 
         return m
 
+    @profiled("FoliumMapRenderer.render_map")
     def render_map(
         self,
         df_restaurants: pd.DataFrame,
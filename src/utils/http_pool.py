@@ -0,0 +1,169 @@
+# src/utils/http_pool.py
+"""프로세스 전역에서 공유하는 비동기 HTTP 연결 풀"""
+
+import asyncio
+import atexit
+import importlib.util
+import logging
+import threading
+from typing import Any, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from config.constants import (
+    HTTP_POOL_HTTP2,
+    HTTP_POOL_KEEPALIVE_EXPIRY,
+    HTTP_POOL_MAX_CONNECTIONS,
+    HTTP_POOL_MAX_KEEPALIVE,
+    HTTP_POOL_MAX_PER_HOST,
+)
+from utils.profiler import http_span_name, profile_span
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncHTTPPool:
+    """
+    keep-alive 연결을 재사용하는 httpx.AsyncClient 관리 클래스
+
+    httpx.AsyncClient의 연결은 생성된 이벤트 루프에 묶이므로 루프별로 클라이언트를
+    하나씩 유지하고, 같은 루프에서의 모든 요청이 연결 풀을 공유합니다.
+    호스트별 동시 연결 수는 세마포어로 제한합니다.
+    """
+
+    def __init__(
+        self,
+        timeout: float = 10.0,
+        max_connections: int = HTTP_POOL_MAX_CONNECTIONS,
+        max_keepalive_connections: int = HTTP_POOL_MAX_KEEPALIVE,
+        keepalive_expiry: float = HTTP_POOL_KEEPALIVE_EXPIRY,
+        max_connections_per_host: int = HTTP_POOL_MAX_PER_HOST,
+        http2: bool = HTTP_POOL_HTTP2,
+    ):
+        """
+        Args:
+            timeout: 기본 요청 타임아웃 (초)
+            max_connections: 전체 최대 연결 수
+            max_keepalive_connections: 유지할 최대 keep-alive 연결 수
+            keepalive_expiry: 유휴 keep-alive 연결 유지 시간 (초)
+            max_connections_per_host: 호스트별 최대 동시 요청 수
+            http2: HTTP/2 사용 여부 (h2 패키지가 없으면 HTTP/1.1로 폴백)
+        """
+        self.timeout = timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.max_connections_per_host = max_connections_per_host
+        self.http2 = http2 and self._http2_available()
+
+        # 이벤트 루프별 (클라이언트, 호스트별 세마포어)
+        self._clients: dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+        self._host_slots: dict[
+            asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]
+        ] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _http2_available() -> bool:
+        """HTTP/2 사용에 필요한 h2 패키지 설치 여부 확인"""
+        if importlib.util.find_spec("h2") is None:
+            logger.warning("h2 패키지가 없어 HTTP/1.1로 연결합니다.")
+            return False
+        return True
+
+    def _prune_closed_loops(self):
+        """닫힌 이벤트 루프에 묶인 클라이언트 정리 (lock 보유 상태에서 호출)"""
+        for loop in [loop for loop in self._clients if loop.is_closed()]:
+            self._clients.pop(loop, None)
+            self._host_slots.pop(loop, None)
+
+    def get_client(self) -> httpx.AsyncClient:
+        """현재 실행 중인 이벤트 루프의 공유 클라이언트 반환"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._clients.get(loop)
+            if client is None or client.is_closed:
+                self._prune_closed_loops()
+                client = httpx.AsyncClient(
+                    timeout=self.timeout, limits=self.limits, http2=self.http2
+                )
+                self._clients[loop] = client
+                self._host_slots[loop] = {}
+            return client
+
+    def _host_slot(self, url: str) -> asyncio.Semaphore:
+        """현재 루프에서 해당 호스트의 동시 요청 제한 세마포어 반환"""
+        loop = asyncio.get_running_loop()
+        host = urlsplit(url).netloc
+        with self._lock:
+            slots = self._host_slots.setdefault(loop, {})
+            slot = slots.get(host)
+            if slot is None:
+                slot = asyncio.Semaphore(self.max_connections_per_host)
+                slots[host] = slot
+            return slot
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """
+        공유 클라이언트로 HTTP 요청 실행
+
+        Args:
+            method: HTTP 메서드
+            url: 요청 URL
+            **kwargs: httpx.AsyncClient.request에 전달할 인자
+
+        Returns:
+            httpx.Response
+        """
+        client = self.get_client()
+        # 호스트별 슬롯 대기 시간까지 포함해 기록 (동시 요청 제한에 걸린 지연도 보이도록)
+        with profile_span(http_span_name(method, url), "http"):
+            async with self._host_slot(url):
+                return await client.request(method, url, **kwargs)
+
+    async def aclose(self):
+        """현재 이벤트 루프의 클라이언트 종료"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._clients.pop(loop, None)
+            self._host_slots.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+
+    def close(self, timeout: float = 5.0):
+        """모든 루프의 클라이언트 종료 (프로세스 종료 시 호출)"""
+        with self._lock:
+            clients = list(self._clients.items())
+            self._clients.clear()
+            self._host_slots.clear()
+
+        for loop, client in clients:
+            if loop.is_closed() or client.is_closed:
+                continue
+            try:
+                if loop.is_running():
+                    asyncio.run_coroutine_threadsafe(client.aclose(), loop).result(
+                        timeout
+                    )
+                else:
+                    loop.run_until_complete(client.aclose())
+            except Exception as e:
+                logger.warning(f"HTTP 클라이언트 종료 실패: {e}")
+
+
+_http_pool: Optional[AsyncHTTPPool] = None
+_http_pool_lock = threading.Lock()
+
+
+def get_http_pool() -> AsyncHTTPPool:
+    """모든 세션이 공유하는 HTTP 연결 풀 싱글톤 반환"""
+    global _http_pool
+    if _http_pool is None:
+        with _http_pool_lock:
+            if _http_pool is None:
+                _http_pool = AsyncHTTPPool()
+                atexit.register(_http_pool.close)
+    return _http_pool
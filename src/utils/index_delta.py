@@ -0,0 +1,149 @@
+# src/utils/index_delta.py
+"""행 위치 역색인의 증분 갱신과 데이터셋 버전별 인덱스 등록 유틸리티"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable
+from typing import TYPE_CHECKING, Any, Optional
+
+import numpy as np
+
+if TYPE_CHECKING:
+    # diner_store가 category_index를 import하므로 타입 검사 시에만 import
+    from utils.diner_store import DinerDelta
+
+# (인덱스 종류, 데이터셋 버전) → 증분 갱신으로 미리 만들어 둔 인덱스
+_prepared: dict[tuple[str, str], Any] = {}
+# 인덱스 종류 → {데이터셋 버전: 생성된 인덱스} (최근 생성 순, 종류별 최대 BUILT_INDEX_KEEP개)
+_built: dict[str, OrderedDict] = {}
+BUILT_INDEX_KEEP = 4
+_registry_lock = threading.Lock()
+
+
+def group_positions(
+    keys: Iterable[Hashable], positions: np.ndarray, dtype=np.int32
+) -> dict:
+    """
+    (키, 행 위치) 쌍을 {키: 행 위치 배열(오름차순)}으로 묶음
+
+    Args:
+        keys: 행마다 하나씩 대응하는 키
+        positions: 행 위치 배열 (오름차순)
+        dtype: 행 위치 배열 dtype (기존 역색인과 동일하게 지정)
+
+    Returns:
+        {키: 행 위치 배열} 딕셔너리
+    """
+    groups: dict[Hashable, list[int]] = {}
+    for key, position in zip(keys, np.asarray(positions).tolist()):
+        groups.setdefault(key, []).append(position)
+    return {key: np.asarray(rows, dtype=dtype) for key, rows in groups.items()}
+
+
+def remap_positions(positions: np.ndarray, delta: "DinerDelta") -> np.ndarray:
+    """
+    변경되지 않은 행들의 이전 위치를 새 위치로 변환
+
+    삭제된 행이 없으면 기존 행 위치가 그대로 유지되므로 배열을 재사용합니다.
+    """
+    if len(delta.removed) == 0:
+        return positions
+    return delta.old_to_new[positions].astype(positions.dtype, copy=False)
+
+
+def merge_positions(
+    positions: Optional[np.ndarray],
+    delta: "DinerDelta",
+    added: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    영향 받은 키의 행 위치 재계산: 삭제/수정된 이전 행을 빼고 새 행을 합침
+
+    Args:
+        positions: 키의 이전 행 위치 배열 (없으면 None)
+        delta: 행 위치 변경 정보
+        added: 키에 새로 속하는 새 행 위치 배열
+
+    Returns:
+        새 행 위치 배열 (오름차순)
+    """
+    reference = positions if positions is not None else added
+    dtype = reference.dtype if reference is not None else np.int32
+    parts = []
+    if positions is not None and len(positions):
+        kept = positions[~np.isin(positions, delta.stale_old, assume_unique=True)]
+        parts.append(delta.old_to_new[kept])
+    if added is not None and len(added):
+        parts.append(np.asarray(added))
+    if not parts:
+        return np.empty(0, dtype=dtype)
+    return np.unique(np.concatenate(parts)).astype(dtype, copy=False)
+
+
+def apply_posting_delta(
+    postings: dict,
+    delta: "DinerDelta",
+    stale_keys: Iterable[Hashable],
+    added: dict,
+) -> dict:
+    """
+    {키: 행 위치 배열} 역색인에 행 변경을 반영한 새 역색인 생성
+
+    삭제/수정된 행이 속했던 키(stale_keys)와 새 행이 속하는 키(added)만 다시 계산하고
+    나머지 키의 배열은 재사용(삭제가 있으면 위치만 변환)합니다.
+
+    Args:
+        postings: 이전 역색인
+        delta: 행 위치 변경 정보
+        stale_keys: 삭제/수정된 이전 행이 속했던 키
+        added: {키: 새로 속하는 새 행 위치 배열}
+
+    Returns:
+        새 역색인 (행이 남지 않은 키는 제외)
+    """
+    affected = set(stale_keys) | set(added)
+    result = {}
+    for key, positions in postings.items():
+        if key not in affected:
+            result[key] = remap_positions(positions, delta)
+    for key in affected:
+        positions = merge_positions(postings.get(key), delta, added.get(key))
+        if len(positions):
+            result[key] = positions
+    return result
+
+
+def prepare_index(kind: str, dataset_version: str, index: Any):
+    """
+    증분 갱신으로 만든 인덱스를 새 데이터셋 버전으로 등록
+
+    해당 버전의 인덱스를 처음 요청할 때 전체 재생성 대신 등록된 인덱스를 사용합니다.
+    """
+    with _registry_lock:
+        _prepared[(kind, dataset_version)] = index
+
+
+def take_prepared_index(kind: str, dataset_version: str) -> Optional[Any]:
+    """미리 등록된 인덱스를 꺼냄 (없으면 None)"""
+    with _registry_lock:
+        return _prepared.pop((kind, dataset_version), None)
+
+
+def remember_index(kind: str, dataset_version: str, index: Any):
+    """
+    증분 갱신의 기준이 되도록 생성된 인덱스 기록
+
+    st.cache_resource(max_entries=4)와 같이 종류별로 최근 BUILT_INDEX_KEEP개만 보관합니다.
+    """
+    with _registry_lock:
+        built = _built.setdefault(kind, OrderedDict())
+        built[dataset_version] = index
+        built.move_to_end(dataset_version)
+        while len(built) > BUILT_INDEX_KEEP:
+            built.popitem(last=False)
+
+
+def built_index(kind: str, dataset_version: str) -> Optional[Any]:
+    """dataset_version에 대해 생성된 인덱스 (없으면 None)"""
+    with _registry_lock:
+        return _built.get(kind, {}).get(dataset_version)
@@ -0,0 +1,159 @@
+# src/utils/log_dedup.py
+"""rerun으로 반복되는 사용자 활동 로그의 세션 단위 중복 제거"""
+
+import json
+import time
+from typing import Any, Optional
+
+import streamlit as st
+
+from config.constants import (
+    LOG_DEDUP_EXEMPT_TYPES,
+    LOG_DEDUP_WINDOW_SECONDS,
+    PAGE_VISIT_IDLE_TIMEOUT_SECONDS,
+)
+
+# (uid, 활동 유형, 상세 정보)
+ActivityEvent = tuple[Optional[str], str, dict[str, Any]]
+
+
+class ActivityDeduplicator:
+    """
+    세션별 활동 로그 중복 제거기
+
+    Streamlit은 위젯을 조작할 때마다 스크립트를 다시 실행하므로 페이지 상단의 page_visit 로그가
+    rerun마다 반복됩니다. 같은 페이지의 연속된 page_visit은 방문 하나로 묶고, 다른 페이지로
+    이동하거나 로그아웃할 때 머문 시간과 rerun 수를 page_dwell 로그로 남깁니다.
+    그 밖의 로그는 같은 내용이 window_seconds 안에 반복되면 첫 로그만 남깁니다.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float = LOG_DEDUP_WINDOW_SECONDS,
+        idle_timeout: float = PAGE_VISIT_IDLE_TIMEOUT_SECONDS,
+    ):
+        """
+        Args:
+            window_seconds: 같은 로그를 하나로 묶는 시간 범위 (초)
+            idle_timeout: 같은 페이지라도 이 시간(초) 이상 rerun이 없으면 새 방문으로 처리
+        """
+        self.window_seconds = window_seconds
+        self.idle_timeout = idle_timeout
+        # 현재 방문: {"uid", "page_name", "detail", "started_at", "last_seen", "reruns"}
+        self._visit: Optional[dict[str, Any]] = None
+        # {로그 키: 마지막으로 남긴 시각}
+        self._recent: dict[str, float] = {}
+        self._stats = {"received": 0, "logged": 0, "suppressed": 0}
+
+    def process(
+        self, uid: Optional[str], activity_type: str, detail: dict[str, Any]
+    ) -> list[ActivityEvent]:
+        """
+        로그 요청을 받아 실제로 저장할 로그 목록 반환
+
+        Args:
+            uid: 사용자 UID
+            activity_type: 활동 유형
+            detail: 상세 정보
+
+        Returns:
+            저장할 (uid, 활동 유형, 상세 정보) 리스트 (중복이면 빈 리스트)
+        """
+        now = time.monotonic()
+        self._stats["received"] += 1
+
+        if activity_type == "page_visit":
+            events = self._process_page_visit(uid, detail, now)
+        elif activity_type == "logout":
+            events = [*self.end_visit(now), (uid, activity_type, detail)]
+        elif activity_type in LOG_DEDUP_EXEMPT_TYPES or not self._is_repeated(
+            uid, activity_type, detail, now
+        ):
+            events = [(uid, activity_type, detail)]
+        else:
+            events = []
+
+        self._stats["logged"] += len(events)
+        if not events:
+            self._stats["suppressed"] += 1
+        return events
+
+    def end_visit(self, now: Optional[float] = None) -> list[ActivityEvent]:
+        """
+        현재 방문을 끝내고 page_dwell 로그 반환 (방문 중이 아니면 빈 리스트)
+
+        마지막 rerun 이후 idle_timeout이 지났으면 자리를 비운 것으로 보고
+        마지막 rerun 시각까지만 머문 시간으로 계산합니다.
+        """
+        visit, self._visit = self._visit, None
+        if visit is None:
+            return []
+
+        now = time.monotonic() if now is None else now
+        ended_at = (
+            now if now - visit["last_seen"] < self.idle_timeout else visit["last_seen"]
+        )
+        detail = {
+            **visit["detail"],
+            "dwell_seconds": round(ended_at - visit["started_at"], 1),
+            "reruns": visit["reruns"],
+        }
+        return [(visit["uid"], "page_dwell", detail)]
+
+    def stats(self) -> dict[str, int]:
+        """누적 통계 (received: 요청, logged: 저장, suppressed: 중복으로 생략)"""
+        return dict(self._stats)
+
+    def _process_page_visit(
+        self, uid: Optional[str], detail: dict[str, Any], now: float
+    ) -> list[ActivityEvent]:
+        visit = self._visit
+        if (
+            visit is not None
+            and visit["uid"] == uid
+            and visit["page_name"] == detail.get("page_name")
+            and now - visit["last_seen"] < self.idle_timeout
+        ):
+            visit["reruns"] += 1
+            visit["last_seen"] = now
+            return []
+
+        events = self.end_visit(now)
+        self._visit = {
+            "uid": uid,
+            "page_name": detail.get("page_name"),
+            "detail": detail,
+            "started_at": now,
+            "last_seen": now,
+            "reruns": 0,
+        }
+        events.append((uid, "page_visit", detail))
+        return events
+
+    def _is_repeated(
+        self, uid: Optional[str], activity_type: str, detail: dict[str, Any], now: float
+    ) -> bool:
+        """같은 로그가 window_seconds 안에 이미 남았는지 확인하고 기록"""
+        # 오래된 키 정리 (세션당 수십 개 수준이라 매번 순회해도 부담이 없음)
+        self._recent = {
+            key: logged_at
+            for key, logged_at in self._recent.items()
+            if now - logged_at < self.window_seconds
+        }
+        key = json.dumps(
+            [uid, activity_type, detail],
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str,
+        )
+        if key in self._recent:
+            return True
+        self._recent[key] = now
+        return False
+
+
+def get_activity_deduplicator() -> ActivityDeduplicator:
+    """현재 세션의 ActivityDeduplicator 가져오기"""
+    if "activity_deduplicator" not in st.session_state:
+        st.session_state.activity_deduplicator = ActivityDeduplicator()
+    return st.session_state.activity_deduplicator
@@ -0,0 +1,246 @@
+# src/utils/menu_index.py
+"""메뉴/태그/카테고리 필드 역색인 기반 메뉴 검색"""
+
+import logging
+import re
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.dataset_version import get_dataset_version
+from utils.index_delta import (
+    apply_posting_delta,
+    group_positions,
+    remember_index,
+    take_prepared_index,
+)
+from utils.text_index import SubstringIndex
+
+logger = logging.getLogger(__name__)
+
+# 메뉴 검색 대상 필드 (리스트 또는 문자열)
+MENU_SEARCH_FIELDS = [
+    "diner_menu_name",
+    "diner_tag",
+    "diner_category_middle",
+    "diner_category_small",
+    "diner_category_detail",
+]
+
+# 토큰 검색용 구분자 (공백/구두점)
+_TOKEN_SPLIT = re.compile(r"[\s,./()\[\]·&+-]+")
+
+
+def _row_items(
+    df: pd.DataFrame, fields: list[str], positions: Optional[np.ndarray] = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    (행 위치, 항목) 쌍 수집: 리스트는 항목별로 펼치고 문자열 항목만 사용
+
+    Args:
+        df: 음식점 DataFrame
+        fields: 검색 대상 필드
+        positions: 수집할 행 위치 배열 (None이면 전체 행)
+
+    Returns:
+        (행 위치 배열, 항목 배열)
+    """
+    if positions is None:
+        positions = np.arange(len(df))
+    row_parts, item_parts = [], []
+    for field in fields:
+        values = df[field].iloc[positions].to_numpy(dtype=object)
+        exploded = pd.Series(values, index=positions).explode()
+        is_str = exploded.map(lambda value: isinstance(value, str)).to_numpy(dtype=bool)
+        row_parts.append(exploded.index.to_numpy()[is_str])
+        item_parts.append(exploded.to_numpy(dtype=object)[is_str])
+
+    rows = np.concatenate(row_parts) if row_parts else np.empty(0, np.int64)
+    items = np.concatenate(item_parts) if item_parts else np.empty(0, object)
+    return rows, items
+
+
+class MenuIndex:
+    """
+    메뉴/태그/카테고리 항목 역색인
+
+    모든 필드의 항목(메뉴명, 태그 등)을 고유 항목 사전으로 모으고,
+    항목 → 행 위치 역색인과 항목 문자 n-gram 역색인을 만듭니다.
+    검색어를 포함하는 항목을 먼저 찾은 뒤 해당 항목들의 행을 합치므로
+    검색 비용이 행 수 × 필드 수 × 항목 수에 비례하지 않습니다.
+    """
+
+    def __init__(self, df: pd.DataFrame, fields: Optional[list[str]] = None):
+        """
+        Args:
+            df: 음식점 DataFrame
+            fields: 검색 대상 필드 (None이면 MENU_SEARCH_FIELDS 중 존재하는 필드)
+        """
+        fields = [f for f in (fields or MENU_SEARCH_FIELDS) if f in df.columns]
+        self.labels = df.index.to_numpy()
+        self.n_rows = len(df)
+
+        self.fields = fields
+        rows, items = _row_items(df, fields)
+
+        # 고유 항목 사전과 항목 → 행 위치(중복 제거, 오름차순) 역색인
+        codes, vocab = pd.factorize(items)
+        self.vocab = np.asarray(vocab, dtype=object)
+        order = np.lexsort((rows, codes))
+        codes, rows = codes[order], rows[order].astype(np.int32)
+        keep = np.ones(len(codes), dtype=bool)
+        keep[1:] = (codes[1:] != codes[:-1]) | (rows[1:] != rows[:-1])
+        codes, rows = codes[keep], rows[keep]
+        starts = np.flatnonzero(np.diff(codes)) + 1
+        self._item_rows = np.split(rows, starts) if len(rows) else []
+        self._rows_with_items = np.unique(rows)
+
+        self._substring_index = SubstringIndex(self.vocab)
+        self._token_index = self._build_token_index()
+
+        logger.info(
+            f"메뉴 역색인 생성 완료: {self.n_rows}개 음식점, {len(self.vocab)}개 항목"
+        )
+
+    def _build_token_index(self, start: int = 0) -> dict[str, np.ndarray]:
+        """토큰(소문자) → 항목 ID 배열 역색인 생성 (start 이후 항목만)"""
+        token_items: dict[str, list[int]] = {}
+        for item_id in range(start, len(self.vocab)):
+            for token in set(_TOKEN_SPLIT.split(self.vocab[item_id].lower())):
+                if token:
+                    token_items.setdefault(token, []).append(item_id)
+        return {
+            token: np.asarray(ids, dtype=np.int32) for token, ids in token_items.items()
+        }
+
+    def apply_delta(
+        self, old_df: pd.DataFrame, new_df: pd.DataFrame, delta
+    ) -> "MenuIndex":
+        """
+        행 변경을 반영한 새 역색인 생성
+
+        변경 행이 가졌던/가지는 항목의 행 목록만 다시 계산하고, 문자 n-gram과 토큰 역색인은
+        새로 등장한 항목만 추가합니다. 더 이상 행이 없는 항목은 사전에 남지만 검색 결과는 비어 있습니다.
+
+        Args:
+            old_df: 이 역색인을 만든 DataFrame
+            new_df: 변경 후 DataFrame
+            delta: DinerStore.apply_delta가 반환한 행 위치 변경 정보
+
+        Returns:
+            MenuIndex 인스턴스
+        """
+        index = MenuIndex.__new__(MenuIndex)
+        index.fields = self.fields
+        index.labels = new_df.index.to_numpy()
+        index.n_rows = len(new_df)
+
+        item_ids = {item: item_id for item_id, item in enumerate(self.vocab)}
+        _, stale_items = _row_items(old_df, self.fields, delta.stale_old)
+        rows, items = _row_items(new_df, self.fields, delta.changed)
+
+        new_items = [item for item in pd.unique(items) if item not in item_ids]
+        for item in new_items:
+            item_ids[item] = len(item_ids)
+        index.vocab = np.concatenate([self.vocab, np.asarray(new_items, dtype=object)])
+
+        stale_ids = {item_ids[item] for item in stale_items}
+        added = group_positions([item_ids[item] for item in items], rows)
+        added = {item_id: np.unique(positions) for item_id, positions in added.items()}
+        postings = apply_posting_delta(
+            dict(enumerate(self._item_rows)), delta, stale_ids, added
+        )
+        empty = np.empty(0, dtype=np.int32)
+        index._item_rows = [postings.get(i, empty) for i in range(len(index.vocab))]
+
+        # 항목이 있는 행: 변경되지 않은 행은 그대로, 변경 행은 새로 확인
+        kept = self._rows_with_items[
+            ~np.isin(self._rows_with_items, delta.stale_old, assume_unique=True)
+        ]
+        index._rows_with_items = np.union1d(
+            delta.old_to_new[kept], np.unique(rows)
+        ).astype(np.int32)
+
+        index._substring_index = self._substring_index.extend(new_items)
+        index._token_index = dict(self._token_index)
+        for token, ids in index._build_token_index(start=len(self.vocab)).items():
+            previous = index._token_index.get(token)
+            index._token_index[token] = (
+                ids if previous is None else np.concatenate([previous, ids])
+            )
+
+        logger.info(
+            f"메뉴 역색인 증분 갱신: {len(stale_ids | set(added))}개 항목 재계산, "
+            f"{len(new_items)}개 항목 추가"
+        )
+        return index
+
+    def lookup(self, search_term: str, match: str = "substring") -> np.ndarray:
+        """
+        검색어에 해당하는 행 위치 조회
+
+        Args:
+            search_term: 검색어
+            match: "substring"(항목에 검색어 포함, 기존 search_menu와 동일) 또는
+                "token"(항목을 공백/구두점으로 나눈 토큰과 대소문자 무시 일치)
+
+        Returns:
+            행 위치 배열 (오름차순)
+        """
+        if match == "token":
+            item_ids = self._token_index.get(search_term.lower().strip(), [])
+        elif not search_term:
+            return self._rows_with_items
+        else:
+            item_ids = self._substring_index.find(search_term)
+
+        if len(item_ids) == 0:
+            return np.empty(0, dtype=np.int32)
+        return np.unique(np.concatenate([self._item_rows[i] for i in item_ids]))
+
+    def mask(
+        self, df: pd.DataFrame, search_term: str, match: str = "substring"
+    ) -> np.ndarray:
+        """
+        df의 각 행이 검색어와 매칭되는지 나타내는 불리언 마스크
+
+        Args:
+            df: 인덱스를 만든 DataFrame 또는 그 부분집합 (행 인덱스 라벨 유지)
+            search_term: 검색어
+            match: 검색 방식 ("substring" 또는 "token")
+
+        Returns:
+            df 행 순서의 불리언 배열
+        """
+        labels = self.labels[self.lookup(search_term, match)]
+        return df.index.isin(labels)
+
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def _load_menu_index(dataset_version: str, _df: pd.DataFrame) -> MenuIndex:
+    """데이터셋 버전별로 한 번만 역색인을 생성하여 모든 세션이 공유"""
+    index = take_prepared_index("menu", dataset_version)
+    if index is None:
+        index = MenuIndex(_df)
+    remember_index("menu", dataset_version, index)
+    return index
+
+
+def get_menu_index(
+    df: pd.DataFrame, dataset_version: Optional[str] = None
+) -> MenuIndex:
+    """
+    음식점 DataFrame에 대한 공유 메뉴 역색인 반환
+
+    Args:
+        df: 음식점 DataFrame
+        dataset_version: 데이터셋 버전 (None이면 계산)
+
+    Returns:
+        MenuIndex 인스턴스
+    """
+    if dataset_version is None:
+        dataset_version = get_dataset_version(df)
+    return _load_menu_index(dataset_version, df)
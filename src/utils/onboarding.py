@@ -1,6 +1,5 @@
 # utils/onboarding.py
 
-import asyncio
 from datetime import datetime
 from typing import Any, Optional
 
@@ -10,6 +9,7 @@ from firebase_admin import firestore
 
 from utils.api import APIRequester
 from utils.api_client import get_yamyam_ops_client
+from utils.async_runner import get_async_runner
 from utils.auth import get_current_user
 from utils.firebase_logger import get_firebase_logger
 from utils.similar_restaurants import SimilarRestaurantFetcher
@@ -92,9 +92,7 @@ class OnboardingManager:
                 return []
 
             # 비동기 API 호출을 동기적으로 실행
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            restaurants = loop.run_until_complete(
+            restaurants = get_async_runner().run(
                 client.get_restaurants(
                     user_lat=user_lat,
                     user_lon=user_lon,
@@ -103,7 +101,6 @@ class OnboardingManager:
                     limit=limit,
                 )
             )
-            loop.close()
 
             if not restaurants:
                 return []
@@ -137,9 +134,7 @@ class OnboardingManager:
                 return []
 
             # 비동기 API 호출을 동기적으로 실행
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            restaurants = loop.run_until_complete(
+            restaurants = get_async_runner().run(
                 client.get_restaurants(
                     user_lat=user_lat,
                     user_lon=user_lon,
@@ -150,7 +145,6 @@ class OnboardingManager:
                     offset=offset,
                 )
             )
-            loop.close()
 
             if not restaurants:
                 return []
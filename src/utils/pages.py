@@ -5,9 +5,10 @@ import streamlit as st
 from config.constants import GRADE_MAP, PRIORITY_ORDER
 from utils.data_processing import (
     category_filters,
+    category_mask,
     get_filtered_data,
     grade_to_stars,
-    search_menu,
+    search_menu_mask,
     select_radius,
 )
 from utils.dialogs import change_location, show_restaurant_map
@@ -62,19 +63,22 @@ class PageManager:
         )
         selected_grade_values = [GRADE_MAP[grade] for grade in selected_grades]
 
-        # 지역 선택
-        self.app.df_diner[["city", "region"]] = (
-            self.app.df_diner["diner_num_address"]
-            .str.split(" ", n=2, expand=True)
-            .iloc[:, :2]
-        )
+        # 지역 선택 (공유 DataFrame은 읽기 전용이므로 city/region이 없을 때만 복사본에 추가)
+        df_diner = self.app.df_diner
+        if "city" not in df_diner.columns:
+            df_diner = df_diner.copy()
+            df_diner[["city", "region"]] = (
+                df_diner["diner_num_address"]
+                .str.split(" ", n=2, expand=True)
+                .iloc[:, :2]
+            )
 
-        ZONE_LIST = list(self.app.df_diner["city"].unique())
+        ZONE_LIST = list(df_diner["city"].unique())
         zone = st.selectbox("지역을 선택하세요", ZONE_LIST, index=0)
         selected_zone_all = f"{zone} 전체"
 
         # 선택한 지역의 데이터 필터링
-        filtered_zone_df = self.app.df_diner[self.app.df_diner["city"] == zone]
+        filtered_zone_df = df_diner[df_diner["city"] == zone].copy()
 
         # 상세 지역 선택
         city_options = list(filtered_zone_df["region"].dropna().unique())
@@ -115,7 +119,10 @@ class PageManager:
 
             # 세부 카테고리 선택 및 필터링
             available_small_categories = (
-                filtered_city_df["diner_category_middle"].fillna("기타").unique()
+                filtered_city_df["diner_category_middle"]
+                .astype(object)
+                .fillna("기타")
+                .unique()
             )
             selected_small_category = st.selectbox(
                 "세부 카테고리를 선택하세요",
@@ -380,8 +387,10 @@ class PageManager:
                 menu_search = st.text_input("찾고 싶은 메뉴를 입력하세요")
                 if menu_search:
                     df_menu_filtered = st.session_state.df_filtered[
-                        st.session_state.df_filtered.apply(
-                            lambda row: search_menu(row, menu_search), axis=1
+                        search_menu_mask(
+                            st.session_state.df_filtered,
+                            menu_search,
+                            source_df=self.app.df_diner,
                         )
                     ]
                     # 메뉴 검색 로그
@@ -458,7 +467,8 @@ class PageManager:
                         )
 
                         df_geo_mid_category_filtered = category_filters(
-                            diner_category, st.session_state.df_filtered
+                            diner_category,
+                            st.session_state.df_filtered,
                         )
                         if len(df_geo_mid_category_filtered):
                             my_chat_message(
@@ -477,9 +487,10 @@ class PageManager:
                             if selected_category:
                                 df_geo_small_category_filtered = (
                                     df_geo_mid_category_filtered[
-                                        df_geo_mid_category_filtered[
-                                            "diner_category_middle"
-                                        ].isin(selected_category)
+                                        category_mask(
+                                            df_geo_mid_category_filtered,
+                                            middle=selected_category,
+                                        )
                                     ].sort_values(by="bayesian_score", ascending=False)
                                 )
                                 # 최종 검색 결과 로그
@@ -0,0 +1,422 @@
+# src/utils/profiler.py
+"""
+Streamlit rerun 단위 구간 프로파일러 (opt-in)
+
+main() 한 번의 실행(rerun)을 하나의 트레이스로 묶고, 그 안에서 profile_span/@profiled로
+감싼 구간, HTTP 요청, 캐시 적중 여부를 기록합니다. 완료된 트레이스는 페이지별 지연 히스토그램으로
+집계되어 숨김 디버그 페이지(pages/profiler_page.py)에 표시되며 Chrome trace JSON으로 내보낼 수 있습니다.
+
+secrets의 PROFILER_ENABLED가 false이면 profile_rerun이 트레이스를 만들지 않으므로
+구간 기록은 ContextVar 조회 한 번으로 끝납니다.
+"""
+
+import asyncio
+import functools
+import os
+import re
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Optional, TypeVar
+from urllib.parse import urlsplit
+
+import numpy as np
+
+from config.constants import (
+    PROFILER_ENABLED,
+    PROFILER_HISTOGRAM_BUCKETS_MS,
+    PROFILER_KEEP_TRACES,
+    PROFILER_MAX_SAMPLES,
+)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class RerunTrace:
+    """rerun 한 번 동안 기록된 구간과 캐시 이벤트"""
+
+    def __init__(self, page: str = "main", session_id: Optional[str] = None):
+        self.page = page
+        self.session_id = session_id
+        self.started_at = time.time()
+        self.started = time.perf_counter()
+        self.thread_id = threading.get_ident()
+        self.duration: Optional[float] = None
+        # (이름, 분류, 시작 오프셋 초, 소요 초, 스레드 ID, 추가 정보)
+        self.spans: list[tuple[str, str, float, float, int, dict]] = []
+        # (이름, 시작 오프셋 초, 스레드 ID, 적중 여부, 건수)
+        self.cache_events: list[tuple[str, float, int, bool, int]] = []
+        # 비동기 실행기 스레드에서도 기록하므로 lock으로 보호
+        self._lock = threading.Lock()
+
+    def add_span(self, name: str, category: str, started: float, args: dict):
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self.spans.append(
+                (
+                    name,
+                    category,
+                    started - self.started,
+                    elapsed,
+                    threading.get_ident(),
+                    args,
+                )
+            )
+
+    def add_cache_event(self, name: str, hit: bool, count: int = 1):
+        offset = time.perf_counter() - self.started
+        with self._lock:
+            self.cache_events.append((name, offset, threading.get_ident(), hit, count))
+
+    def finish(self):
+        self.duration = time.perf_counter() - self.started
+
+    def cache_summary(self) -> dict[str, dict[str, int]]:
+        """{캐시 이름: {"hits", "misses"}}"""
+        summary: dict[str, dict[str, int]] = {}
+        for name, _, _, hit, count in self.cache_events:
+            counts = summary.setdefault(name, {"hits": 0, "misses": 0})
+            counts["hits" if hit else "misses"] += count
+        return summary
+
+
+_current_trace: ContextVar[Optional[RerunTrace]] = ContextVar(
+    "what2eat_rerun_trace", default=None
+)
+
+
+class LatencyHistogram:
+    """고정 구간 히스토그램 + 백분위수 계산용 최근 표본"""
+
+    def __init__(
+        self,
+        buckets_ms: tuple[float, ...] = PROFILER_HISTOGRAM_BUCKETS_MS,
+        max_samples: int = PROFILER_MAX_SAMPLES,
+    ):
+        self.buckets_ms = buckets_ms
+        # 마지막 칸은 가장 큰 경계를 넘는 값
+        self.counts = [0] * (len(buckets_ms) + 1)
+        self.samples: deque[float] = deque(maxlen=max_samples)
+        self.total_ms = 0.0
+
+    def add(self, ms: float):
+        position = int(np.searchsorted(self.buckets_ms, ms, side="left"))
+        self.counts[position] += 1
+        self.samples.append(ms)
+        self.total_ms += ms
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    def summary(self) -> dict[str, float]:
+        """{"count", "total_ms", "p50_ms", "p90_ms", "p99_ms", "max_ms"}"""
+        if not self.samples:
+            return {"count": 0, "total_ms": 0.0}
+        p50, p90, p99 = np.percentile(list(self.samples), [50, 90, 99])
+        return {
+            "count": self.count,
+            "total_ms": round(self.total_ms, 3),
+            "p50_ms": round(float(p50), 3),
+            "p90_ms": round(float(p90), 3),
+            "p99_ms": round(float(p99), 3),
+            "max_ms": round(max(self.samples), 3),
+        }
+
+    def bucket_labels(self) -> list[str]:
+        """히스토그램 칸 이름 ("≤10ms", ..., ">5000ms")"""
+        labels = [f"≤{bound:g}ms" for bound in self.buckets_ms]
+        labels.append(f">{self.buckets_ms[-1]:g}ms")
+        return labels
+
+
+class Profiler:
+    """
+    완료된 rerun 트레이스 보관과 페이지별 지연 집계 (프로세스 전역)
+
+    최근 PROFILER_KEEP_TRACES개의 트레이스를 보관하고, 페이지별 rerun 전체 지연과
+    (페이지, 구간 이름)별 지연을 히스토그램으로 누적합니다.
+    """
+
+    def __init__(self, keep_traces: int = PROFILER_KEEP_TRACES):
+        self.traces: deque[RerunTrace] = deque(maxlen=keep_traces)
+        self.page_latency: dict[str, LatencyHistogram] = {}
+        self.span_latency: dict[tuple[str, str], LatencyHistogram] = {}
+        self.cache_counts: dict[tuple[str, str], dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, trace: RerunTrace):
+        """완료된 트레이스를 집계에 반영"""
+        with self._lock:
+            self.traces.append(trace)
+            self.page_latency.setdefault(trace.page, LatencyHistogram()).add(
+                trace.duration * 1000
+            )
+            for name, _, _, elapsed, _, _ in trace.spans:
+                key = (trace.page, name)
+                self.span_latency.setdefault(key, LatencyHistogram()).add(
+                    elapsed * 1000
+                )
+            for name, counts in trace.cache_summary().items():
+                total = self.cache_counts.setdefault(
+                    (trace.page, name), {"hits": 0, "misses": 0}
+                )
+                total["hits"] += counts["hits"]
+                total["misses"] += counts["misses"]
+
+    def page_summary(self) -> dict[str, dict[str, Any]]:
+        """{페이지: rerun 지연 요약 + 히스토그램 칸별 개수}"""
+        with self._lock:
+            return {
+                page: {
+                    **histogram.summary(),
+                    "histogram": dict(zip(histogram.bucket_labels(), histogram.counts)),
+                }
+                for page, histogram in self.page_latency.items()
+            }
+
+    def span_summary(self, page: Optional[str] = None) -> list[dict[str, Any]]:
+        """구간별 지연 요약 리스트 (전체 소요 시간 내림차순)"""
+        with self._lock:
+            rows = [
+                {"page": span_page, "span": name, **histogram.summary()}
+                for (span_page, name), histogram in self.span_latency.items()
+                if page is None or span_page == page
+            ]
+        return sorted(rows, key=lambda row: row["total_ms"], reverse=True)
+
+    def cache_summary(self, page: Optional[str] = None) -> list[dict[str, Any]]:
+        """캐시별 적중 통계 리스트"""
+        with self._lock:
+            rows = []
+            for (cache_page, name), counts in self.cache_counts.items():
+                if page is not None and cache_page != page:
+                    continue
+                lookups = counts["hits"] + counts["misses"]
+                rows.append(
+                    {
+                        "page": cache_page,
+                        "cache": name,
+                        **counts,
+                        "hit_rate": counts["hits"] / lookups if lookups else 0.0,
+                    }
+                )
+        return rows
+
+    def recent_traces(self) -> list[RerunTrace]:
+        with self._lock:
+            return list(self.traces)
+
+    def clear(self):
+        with self._lock:
+            self.traces.clear()
+            self.page_latency.clear()
+            self.span_latency.clear()
+            self.cache_counts.clear()
+
+    def chrome_trace(self, traces: Optional[list[RerunTrace]] = None) -> dict:
+        """
+        트레이스를 Chrome trace 형식(chrome://tracing, Perfetto)으로 변환
+
+        rerun 전체는 "rerun:{페이지}" 구간, 캐시 조회는 instant 이벤트로 표시합니다.
+
+        Args:
+            traces: 변환할 트레이스 (None이면 보관 중인 전체)
+
+        Returns:
+            {"traceEvents": [...], "displayTimeUnit": "ms"}
+        """
+        if traces is None:
+            traces = self.recent_traces()
+        pid = os.getpid()
+        events = []
+        for trace in traces:
+            base_us = trace.started_at * 1e6
+            events.append(
+                {
+                    "name": f"rerun:{trace.page}",
+                    "cat": "rerun",
+                    "ph": "X",
+                    "ts": base_us,
+                    "dur": (trace.duration or 0) * 1e6,
+                    "pid": pid,
+                    "tid": trace.thread_id,
+                    "args": {"session_id": trace.session_id},
+                }
+            )
+            for name, category, offset, elapsed, tid, args in trace.spans:
+                events.append(
+                    {
+                        "name": name,
+                        "cat": category,
+                        "ph": "X",
+                        "ts": base_us + offset * 1e6,
+                        "dur": elapsed * 1e6,
+                        "pid": pid,
+                        "tid": tid,
+                        "args": args,
+                    }
+                )
+            for name, offset, tid, hit, count in trace.cache_events:
+                events.append(
+                    {
+                        "name": f"{name} {'hit' if hit else 'miss'}",
+                        "cat": "cache",
+                        "ph": "i",
+                        "s": "t",
+                        "ts": base_us + offset * 1e6,
+                        "pid": pid,
+                        "tid": tid,
+                        "args": {"count": count},
+                    }
+                )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+_profiler: Optional[Profiler] = None
+_profiler_lock = threading.Lock()
+
+
+def get_profiler() -> Profiler:
+    """프로세스 전역 Profiler 싱글톤 반환"""
+    global _profiler
+    if _profiler is None:
+        with _profiler_lock:
+            if _profiler is None:
+                _profiler = Profiler()
+    return _profiler
+
+
+def is_profiling() -> bool:
+    """현재 실행 흐름이 트레이스에 기록되고 있는지 확인"""
+    return _current_trace.get() is not None
+
+
+def _script_session_id() -> Optional[str]:
+    """현재 Streamlit 스크립트 실행의 세션 ID (bare mode면 None)"""
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+        ctx = get_script_run_ctx(suppress_warning=True)
+    except ImportError:
+        return None
+    return ctx.session_id if ctx is not None else None
+
+
+@contextmanager
+def profile_rerun(
+    page: str = "main",
+    session_id: Optional[str] = None,
+    enabled: bool = PROFILER_ENABLED,
+):
+    """
+    rerun 한 번을 트레이스로 기록 (main() 전체를 감쌈)
+
+    st.stop()/st.rerun()의 예외로 중단되어도 트레이스를 집계에 반영합니다.
+
+    Args:
+        page: 페이지 이름 (실행 중 set_rerun_page로 변경 가능)
+        session_id: 세션 식별자 (Chrome trace의 args에 기록)
+        enabled: 기록 여부 (기본: secrets의 PROFILER_ENABLED)
+    """
+    if not enabled:
+        yield None
+        return
+
+    if session_id is None:
+        session_id = _script_session_id()
+    trace = RerunTrace(page, session_id)
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _current_trace.reset(token)
+        trace.finish()
+        get_profiler().record(trace)
+
+
+def set_rerun_page(page: str):
+    """현재 트레이스의 페이지 이름 설정 (st.navigation으로 페이지가 정해진 뒤 호출)"""
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.page = page
+
+
+@contextmanager
+def profile_span(name: str, category: str = "span", **args: Any):
+    """
+    이름 붙인 구간의 소요 시간 기록
+
+    Args:
+        name: 구간 이름 (예: "search_filter.get_filtered_restaurants")
+        category: 분류 (span, http 등, Chrome trace의 cat)
+        **args: Chrome trace에 함께 기록할 정보
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace.add_span(name, category, started, args)
+
+
+def profiled(name: Optional[str] = None, category: str = "span") -> Callable[[F], F]:
+    """
+    함수 호출을 구간으로 기록하는 데코레이터 (동기/비동기 함수 모두 지원)
+
+    Args:
+        name: 구간 이름 (None이면 "모듈 마지막 이름.함수 qualname")
+        category: 분류
+    """
+
+    def decorator(func: F) -> F:
+        span_name = name or f"{func.__module__.rsplit('.', 1)[-1]}.{func.__qualname__}"
+
+        if asyncio.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if _current_trace.get() is None:
+                    return await func(*args, **kwargs)
+                with profile_span(span_name, category):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _current_trace.get() is None:
+                return func(*args, **kwargs)
+            with profile_span(span_name, category):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def http_span_name(method: str, url: str) -> str:
+    """HTTP 요청 구간 이름 (경로의 숫자 ID는 {id}로 묶어 엔드포인트별로 집계)"""
+    path = re.sub(r"/\d+(?=/|$)", "/{id}", urlsplit(url).path)
+    return f"http {method.upper()} {path}"
+
+
+def record_cache(name: str, hit: bool, count: int = 1):
+    """
+    캐시 조회 결과 기록
+
+    Args:
+        name: 캐시 이름
+        hit: 적중 여부
+        count: 조회 건수 (일괄 조회 시)
+    """
+    if count <= 0:
+        return
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.add_cache_event(name, hit, count)
@@ -0,0 +1,147 @@
+# src/utils/result_cache.py
+"""위치 격자 기반 반경 조회 결과 캐시"""
+
+import math
+import threading
+from collections import OrderedDict
+from typing import Any, Callable
+
+import numpy as np
+import streamlit as st
+
+from config.constants import (
+    LOCATION_CACHE_GRID_METERS,
+    LOCATION_CACHE_MAX_BYTES,
+    LOCATION_CACHE_MAX_ENTRIES,
+)
+from utils.profiler import record_cache
+from utils.spatial_index import KM_PER_DEG_LAT
+
+
+class LocationResultCache:
+    """
+    사용자 좌표를 격자(기본 50m)로 스냅하여 반경 조회 결과를 공유하는 LRU 캐시
+
+    격자 중심에서 (반경 + 격자 반대각선) 만큼 넓게 조회한 후보 행 위치를 저장하므로,
+    같은 격자 안의 모든 좌표에 대해 후보 집합이 결과의 상위집합이 됩니다.
+    정확한 거리 계산과 반경 필터링은 호출자가 실제 좌표로 후보에 대해서만 수행합니다.
+    항목 수와 후보 배열 메모리 합계 중 하나라도 상한을 넘으면 오래된 항목부터 제거하며,
+    상한보다 큰 후보 배열(넓은 반경 등)은 캐시하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        grid_meters: float = LOCATION_CACHE_GRID_METERS,
+        max_entries: int = LOCATION_CACHE_MAX_ENTRIES,
+        max_bytes: int = LOCATION_CACHE_MAX_BYTES,
+    ):
+        """
+        Args:
+            grid_meters: 좌표 스냅 격자 크기 (m)
+            max_entries: 최대 캐시 항목 수 (초과 시 가장 오래 사용하지 않은 항목 제거)
+            max_bytes: 후보 배열 메모리 합계 상한 (bytes)
+        """
+        self.grid_meters = grid_meters
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._grid_deg = grid_meters / 1000 / KM_PER_DEG_LAT
+        self._entries: OrderedDict[tuple, np.ndarray] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.skipped = 0
+
+    def _snap(self, lat: float, lon: float) -> tuple[tuple[int, int], float, float]:
+        """좌표를 격자 셀로 스냅하고 (셀, 중심 위도, 중심 경도) 반환"""
+        lat_cell = math.floor(lat / self._grid_deg)
+        center_lat = (lat_cell + 0.5) * self._grid_deg
+        # 경도 격자는 셀 중심 위도에서 같은 거리(m)가 되도록 조정
+        lon_deg = self._grid_deg / max(math.cos(math.radians(center_lat)), 1e-6)
+        lon_cell = math.floor(lon / lon_deg)
+        center_lon = (lon_cell + 0.5) * lon_deg
+        return (lat_cell, lon_cell), center_lat, center_lon
+
+    def get_candidates(
+        self,
+        dataset_version: str,
+        lat: float,
+        lon: float,
+        radius_km: float,
+        compute: Callable[[float, float, float], np.ndarray],
+    ) -> np.ndarray:
+        """
+        반경 조회 후보 행 위치 반환 (캐시 미스 시 compute 호출)
+
+        Args:
+            dataset_version: 데이터셋 버전 (다른 데이터셋 간 결과 공유 방지)
+            lat: 사용자 위도
+            lon: 사용자 경도
+            radius_km: 검색 반경 (km)
+            compute: (중심 위도, 중심 경도, 확장 반경) → 행 위치 배열 함수
+
+        Returns:
+            반경 내 결과를 모두 포함하는 후보 행 위치 배열
+        """
+        cell, center_lat, center_lon = self._snap(lat, lon)
+        key = (dataset_version, cell, round(float(radius_km), 6))
+
+        with self._lock:
+            candidates = self._entries.get(key)
+            if candidates is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                record_cache("location_result", True)
+                return candidates
+            self.misses += 1
+        record_cache("location_result", False)
+
+        # 격자 셀 반대각선 길이만큼 반경을 넓혀 셀 내부 모든 좌표를 커버
+        padding_km = self.grid_meters / 1000 * math.sqrt(2) / 2
+        candidates = compute(center_lat, center_lon, radius_km + padding_km)
+
+        with self._lock:
+            if candidates.nbytes > self.max_bytes:
+                self.skipped += 1
+                return candidates
+            self._remove(key)
+            self._entries[key] = candidates
+            self._bytes += candidates.nbytes
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+        return candidates
+
+    def _remove(self, key: tuple):
+        """항목 제거 (lock 보유 상태에서 호출)"""
+        candidates = self._entries.pop(key, None)
+        if candidates is not None:
+            self._bytes -= candidates.nbytes
+
+    def clear(self):
+        """캐시 비우기"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        """캐시 적중 통계 반환"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "skipped": self.skipped,
+                "size": len(self._entries),
+                "bytes": self._bytes,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+
+@st.cache_resource(show_spinner=False)
+def get_location_result_cache() -> LocationResultCache:
+    """모든 세션이 공유하는 위치 결과 캐시 인스턴스 반환"""
+    return LocationResultCache()
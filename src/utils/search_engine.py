@@ -2,42 +2,223 @@
 음식점 검색 엔진
 """
 
+import atexit
+import heapq
 import logging
+import os
 import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
 
+import numpy as np
 import pandas as pd
 from fuzzywuzzy import fuzz
 from jamo import hangul_to_jamo
 
+from utils.text_index import SubstringIndex, build_ngram_postings, ngram_keys
+
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# 자모 n-gram 인덱스의 n
+JAMO_NGRAM = 3
+
+# 자모 유사도를 계산할 최대 후보 수 (n-gram 공유 개수 상위)
+JAMO_SHORTLIST_SIZE = 500
+
+# 자모 유사도 계산을 프로세스 풀로 나누어 실행하는 최소 후보 수
+JAMO_PARALLEL_MIN_CANDIDATES = 50000
+
+# search_many를 프로세스 풀로 나누어 실행하는 최소 고유 쿼리 수
+SEARCH_MANY_PARALLEL_MIN_QUERIES = 1000
+
+# 한글 음절 → 자모 문자열 변환표 (hangul_to_jamo를 음절마다 호출하지 않도록 한 번만 생성)
+_JAMO_TABLE = {
+    code: "".join(hangul_to_jamo(chr(code))) for code in range(0xAC00, 0xD7A4)
+}
+
+
+def _score_jamo_candidates(
+    query_jamo: str,
+    jamo_names: list[str],
+    positions: list[int],
+    top_k: int,
+    jamo_threshold: float,
+    candidate_threshold: float,
+) -> tuple[Optional[tuple[float, int]], list[tuple[float, int]]]:
+    """
+    후보 자모 문자열의 유사도를 계산하여 최고 자모 매칭과 상위 후보 반환
+
+    fuzz.ratio(2·일치 수 / 길이 합)와 위치 일치 비율은 두 문자열 길이만으로 상한을
+    구할 수 있으므로, 상한이 임계값이나 현재 top-k 최저 점수를 넘지 못하는 이름은
+    점수를 계산하지 않습니다. 프로세스 풀에서도 실행할 수 있도록 모듈 함수로 둡니다.
+
+    Args:
+        query_jamo: 쿼리 자모 문자열
+        jamo_names: 후보 자모 문자열 리스트
+        positions: 후보 행 위치 리스트 (jamo_names와 같은 순서)
+        top_k: 유지할 상위 후보 수
+        jamo_threshold: 자모 매칭 임계값 (fuzz.ratio 기준)
+        candidate_threshold: 후보 자모 매칭 임계값 (위치 일치 비율 기준)
+
+    Returns:
+        (최고 자모 매칭 (점수, 행 위치) 또는 None, 상위 후보 [(점수, 행 위치)] 점수 내림차순)
+    """
+    query_spaced = " ".join(query_jamo)
+    query_len = len(query_spaced)
+    best = None
+    # (점수, -행 위치) 최소 힙: 동점이면 뒤쪽 행을 먼저 제거해 앞쪽 행 우선
+    heap: list[tuple[float, int]] = []
+
+    for pos, name in zip(positions, jamo_names):
+        name_len = max(2 * len(name) - 1, 0)
+        shortest, longest = min(query_len, name_len), max(query_len, name_len)
+        if longest == 0:
+            continue
+
+        name_spaced = None
+        # fuzz.ratio는 정수(%)로 반올림되므로 상한에 반올림 오차를 더함
+        ratio_bound = 2 * shortest / (query_len + name_len) + 0.005
+        if ratio_bound > jamo_threshold and (best is None or ratio_bound > best[0]):
+            name_spaced = " ".join(name)
+            score = fuzz.ratio(query_spaced, name_spaced) / 100.0
+            if score > jamo_threshold:
+                if best is None or score > best[0]:
+                    best = (score, pos)
+                continue
+
+        # 자모 매칭을 찾았으면 후보 목록은 사용하지 않음
+        if best is not None or top_k <= 0:
+            continue
+
+        position_bound = shortest / longest
+        if position_bound <= candidate_threshold:
+            continue
+        if len(heap) >= top_k and position_bound <= heap[0][0]:
+            continue
+
+        if name_spaced is None:
+            name_spaced = " ".join(name)
+        matches = sum(x == y for x, y in zip(query_spaced, name_spaced, strict=False))
+        score = matches / longest
+        if score <= candidate_threshold:
+            continue
+        if len(heap) < top_k:
+            heapq.heappush(heap, (score, -pos))
+        elif (score, -pos) > heap[0]:
+            heapq.heapreplace(heap, (score, -pos))
+
+    if best is not None:
+        return best, []
+    candidates = [(score, -neg_pos) for score, neg_pos in heap]
+    candidates.sort(key=lambda x: (-x[0], x[1]))
+    return best, candidates
+
+
+def _normalize_series(texts: pd.Series) -> pd.Series:
+    """문자열 Series를 한 번에 정규화 (DinerSearchEngine._normalize와 동일한 규칙)"""
+    return (
+        texts.astype(str)
+        .str.lower()
+        .str.strip()
+        .str.replace(r"[^가-힣a-zA-Z0-9]", "", regex=True)
+    )
+
+
+# search_many 병렬 처리 워커 프로세스의 검색 엔진 (워커 초기화 시 한 번만 전달)
+_worker_engine = None
+
+
+def _init_search_worker(engine: "DinerSearchEngine"):
+    """search_many 워커 프로세스 초기화"""
+    global _worker_engine
+    _worker_engine = engine
+
+
+def _match_in_worker(
+    norm_queries: list[str],
+    top_k: int,
+    jamo_threshold: float,
+    jamo_candidate_threshold: float,
+) -> list[tuple[str, np.ndarray, np.ndarray]]:
+    """워커 프로세스에서 정규화된 쿼리들의 매칭 결과 계산"""
+    return [
+        _worker_engine._match(query, top_k, jamo_threshold, jamo_candidate_threshold)
+        for query in norm_queries
+    ]
+
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_lock = threading.Lock()
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """자모 유사도 병렬 계산용 프로세스 풀 싱글톤 반환"""
+    global _process_pool
+    if _process_pool is None:
+        with _process_pool_lock:
+            if _process_pool is None:
+                _process_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+                atexit.register(_process_pool.shutdown, cancel_futures=True)
+    return _process_pool
+
 
 class DinerSearchEngine:
     """음식점 검색 엔진"""
 
     def __init__(self):
-        self.diner_infos = []
+        # 행 위치 기준 컬럼 배열
+        self._ids: np.ndarray = np.empty(0, dtype=object)
+        self._names: np.ndarray = np.empty(0, dtype=object)
+        self._distances: np.ndarray = np.empty(0, dtype=np.float64)
+        self._norm_names: np.ndarray = np.empty(0, dtype=object)
+        self._jamo_names: np.ndarray = np.empty(0, dtype=object)
+        self._exact_index: dict[str, np.ndarray] = {}
+        self._name_index = SubstringIndex([])
+        self._jamo_postings: dict[int, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
 
     def load_basic_data(self, df_basic):
         """
         기본 정보와 거리 정보를 로드하여 검색 엔진을 초기화합니다.
 
+        행마다 딕셔너리를 만들지 않고 ID/이름/거리/정규화 이름/자모 문자열을 컬럼 배열로
+        저장합니다. 정확한 매칭용 해시 맵, 부분 매칭용 문자/바이그램 역색인,
+        자모 매칭 후보 생성용 자모 n-gram 역색인도 함께 만듭니다.
+
         Args:
             df_basic: diner_idx, diner_name, distance가 포함된 DataFrame
         """
-        self.diner_infos = []
+        names = df_basic["diner_name"].astype(str)
+        self._ids = df_basic["diner_idx"].astype(str).to_numpy(dtype=object)
+        self._names = df_basic["diner_name"].to_numpy(dtype=object)
+        if "distance" in df_basic.columns:
+            self._distances = pd.to_numeric(
+                df_basic["distance"], errors="coerce"
+            ).to_numpy(dtype=np.float64)
+        else:
+            self._distances = np.full(len(df_basic), np.nan)
+
+        norm_names = _normalize_series(names)
+        self._norm_names = norm_names.to_numpy(dtype=object)
+        self._jamo_names = norm_names.str.translate(_JAMO_TABLE).to_numpy(dtype=object)
 
-        for _, row in df_basic.iterrows():
-            diner_info = {"idx": str(row["diner_idx"]), "name": row["diner_name"]}
+        self._build_indexes()
 
-            # 거리 정보가 있으면 추가
-            if "distance" in row and pd.notna(row["distance"]):
-                diner_info["distance"] = float(row["distance"])
+        logger.info(f"검색 엔진 초기화 완료: {len(self)}개 음식점")
 
-            self.diner_infos.append(diner_info)
+    def _build_indexes(self):
+        """정규화 이름/자모 문자열로 검색용 인덱스 생성"""
+        codes, unique_names = pd.factorize(self._norm_names)
+        order = np.argsort(codes, kind="stable").astype(np.int32)
+        starts = np.flatnonzero(np.diff(codes[order])) + 1
+        self._exact_index = dict(zip(unique_names.tolist(), np.split(order, starts)))
 
-        logger.info(f"검색 엔진 초기화 완료: {len(self.diner_infos)}개 음식점")
+        self._name_index = SubstringIndex(self._norm_names)
+        self._jamo_postings = build_ngram_postings(self._jamo_names, JAMO_NGRAM)
 
     def search(
         self,
@@ -45,6 +226,7 @@ class DinerSearchEngine:
         top_k: int = 5,
         jamo_threshold: float = 0.9,
         jamo_candidate_threshold: float = 0.7,
+        n_jobs: int = 1,
     ) -> pd.DataFrame:
         """
         음식점을 검색합니다.
@@ -52,85 +234,266 @@ class DinerSearchEngine:
         Args:
             query: 검색 쿼리
             top_k: 반환할 상위 결과 수
+            jamo_threshold: 자모 매칭 임계값
+            jamo_candidate_threshold: 후보 자모 매칭 임계값
+            n_jobs: 자모 유사도 계산 프로세스 수 (후보가 많을 때만 사용, -1이면 CPU 수)
 
         Returns:
             검색 결과 DataFrame
         """
         norm_query = self._normalize(query)
+        match_type, positions, scores = self._match(
+            norm_query, top_k, jamo_threshold, jamo_candidate_threshold, n_jobs
+        )
 
-        # 1. 정확한 매칭
-        exact_matches = [
-            d for d in self.diner_infos if self._normalize(d["name"]) == norm_query
-        ]
-        if exact_matches:
-            results = pd.DataFrame(exact_matches).assign(
-                match_type="정확한 매칭",
-                jamo_score=1.0,  # 정확한 매칭은 최고 점수
+        if match_type == "자모 매칭":
+            results = self._jamo_frame(list(zip(scores.tolist(), positions.tolist())))
+            return self._add_kakao_map_links(results)
+
+        if len(positions) > 0:
+            results = self._rows_frame(positions).assign(
+                match_type=match_type, jamo_score=scores[0]
             )
             # 거리 정보가 있으면 거리 순으로 정렬
             if "distance" in results.columns:
                 results = results.sort_values(by="distance", ascending=True)
             return self._add_kakao_map_links(results)
 
+        # 검색 결과 없음
+        return pd.DataFrame().assign(match_type="검색 결과 없음", jamo_score=0.0)
+
+    def search_many(
+        self,
+        queries: list[str],
+        top_k: int = 5,
+        jamo_threshold: float = 0.9,
+        jamo_candidate_threshold: float = 0.7,
+        n_jobs: int = 1,
+    ) -> pd.DataFrame:
+        """
+        여러 쿼리를 한 번에 검색하여 하나의 DataFrame으로 반환합니다.
+
+        쿼리 정규화는 한 번에 처리하고, 정규화 결과가 같은 쿼리는 한 번만 검색합니다.
+        n_jobs가 1보다 크고 고유 쿼리가 SEARCH_MANY_PARALLEL_MIN_QUERIES개 이상이면
+        쿼리를 나누어 프로세스 풀에서 검색합니다.
+
+        Args:
+            queries: 검색 쿼리 리스트
+            top_k: 쿼리별 반환할 상위 결과 수
+            jamo_threshold: 자모 매칭 임계값
+            jamo_candidate_threshold: 후보 자모 매칭 임계값
+            n_jobs: 검색 프로세스 수 (-1이면 CPU 수)
+
+        Returns:
+            query_id(입력 순서), query, rank, idx, name, distance, match_type,
+            jamo_score, name_link 컬럼의 DataFrame (결과가 없는 쿼리는 행 없음)
+        """
+        queries = list(queries)
+        norm_queries = _normalize_series(pd.Series(queries, dtype=object)).tolist()
+        unique_queries = list(dict.fromkeys(norm_queries))
+        if n_jobs < 0:
+            n_jobs = os.cpu_count() or 1
+        args = (top_k, jamo_threshold, jamo_candidate_threshold)
+
+        if n_jobs > 1 and len(unique_queries) >= SEARCH_MANY_PARALLEL_MIN_QUERIES:
+            chunks = np.array_split(
+                np.asarray(unique_queries, dtype=object), n_jobs * 4
+            )
+            with ProcessPoolExecutor(
+                max_workers=n_jobs,
+                initializer=_init_search_worker,
+                initargs=(self,),
+            ) as pool:
+                futures = [
+                    pool.submit(_match_in_worker, chunk.tolist(), *args)
+                    for chunk in chunks
+                    if len(chunk) > 0
+                ]
+                matches = [match for future in futures for match in future.result()]
+        else:
+            matches = [self._match(query, *args) for query in unique_queries]
+
+        # 정확한/부분 매칭은 거리순(거리 정보가 없으면 행 순서)으로 정렬 후 top_k개만 사용
+        by_query = {}
+        for query, (match_type, positions, scores) in zip(unique_queries, matches):
+            if match_type != "자모 매칭" and len(positions) > 1:
+                order = np.argsort(self._distances[positions], kind="stable")
+                positions, scores = positions[order], scores[order]
+            by_query[query] = (match_type, positions[:top_k], scores[:top_k])
+
+        per_query = [by_query[query] for query in norm_queries]
+        counts = np.asarray([len(positions) for _, positions, _ in per_query])
+        query_ids = np.repeat(np.arange(len(queries)), counts)
+        positions = np.concatenate(
+            [positions for _, positions, _ in per_query] + [np.empty(0, np.int64)]
+        ).astype(np.int64)
+
+        results = pd.DataFrame(
+            {
+                "query_id": query_ids,
+                "query": np.asarray(queries, dtype=object)[query_ids],
+                "rank": np.concatenate(
+                    [np.arange(count) for count in counts] + [np.empty(0, np.int64)]
+                ),
+                "idx": self._ids[positions],
+                "name": self._names[positions],
+                "distance": self._distances[positions],
+                "match_type": np.repeat(
+                    [match_type for match_type, _, _ in per_query], counts
+                ),
+                "jamo_score": np.concatenate(
+                    [scores for _, _, scores in per_query] + [np.empty(0)]
+                ),
+            }
+        )
+        return self._add_kakao_map_links(results)
+
+    def _match(
+        self,
+        norm_query: str,
+        top_k: int,
+        jamo_threshold: float,
+        jamo_candidate_threshold: float,
+        n_jobs: int = 1,
+    ) -> tuple[str, np.ndarray, np.ndarray]:
+        """
+        정규화된 쿼리의 매칭 유형, 행 위치, 점수를 계산합니다.
+
+        Returns:
+            (매칭 유형, 행 위치 배열, 점수 배열)
+            정확한/부분 매칭은 행 순서, 자모 매칭은 점수 내림차순
+        """
+        # 1. 정확한 매칭
+        exact_positions = self._exact_index.get(norm_query)
+        if exact_positions is not None and len(exact_positions) > 0:
+            # 정확한 매칭은 최고 점수
+            return "정확한 매칭", exact_positions, np.full(len(exact_positions), 1.0)
+
         # 2. 부분 매칭
-        partial_matches = [
-            d for d in self.diner_infos if norm_query in self._normalize(d["name"])
-        ]
-        if partial_matches:
-            results = pd.DataFrame(partial_matches).assign(
-                match_type="부분 매칭",
-                jamo_score=0.8,  # 부분 매칭은 높은 점수
+        partial_positions = self._partial_match_positions(norm_query)
+        if len(partial_positions) > 0:
+            # 부분 매칭은 높은 점수
+            return "부분 매칭", partial_positions, np.full(len(partial_positions), 0.8)
+
+        # 3. 자모 기반 매칭 (n-gram 역색인으로 추린 후보에 대해서만 유사도 계산)
+        query_jamo = self._to_jamo(norm_query)
+        best, candidates = self._rank_jamo_candidates(
+            query_jamo,
+            self._jamo_shortlist(query_jamo),
+            top_k,
+            jamo_threshold,
+            jamo_candidate_threshold,
+            n_jobs,
+        )
+
+        # 자모 매칭이 있으면 가장 유사한 식당 하나만, 없으면 후보 자모 매칭 사용
+        matches = [best] if best else candidates
+        if matches:
+            return (
+                "자모 매칭",
+                np.asarray([pos for _, pos in matches], dtype=np.int64),
+                np.asarray([score for score, _ in matches], dtype=np.float64),
             )
-            # 거리 정보가 있으면 거리 순으로 정렬
-            if "distance" in results.columns:
-                results = results.sort_values(by="distance", ascending=True)
-            return self._add_kakao_map_links(results)
 
-        # 3. 자모 기반 매칭
-        jamo_candidates = []
-        exact_jamo_match = None
+        return "검색 결과 없음", np.empty(0, dtype=np.int64), np.empty(0)
+
+    def _rows_frame(self, positions: np.ndarray) -> pd.DataFrame:
+        """행 위치 배열로 컬럼 배열을 잘라 결과 DataFrame 생성 (거리 정보가 있으면 포함)"""
+        results = pd.DataFrame(
+            {"idx": self._ids[positions], "name": self._names[positions]}
+        )
+        distances = self._distances[positions]
+        if not np.isnan(distances).all():
+            results["distance"] = distances
+        return results
+
+    def _jamo_frame(self, matches: list[tuple[float, int]]) -> pd.DataFrame:
+        """(자모 점수, 행 위치) 리스트로 자모 매칭 결과 DataFrame 생성"""
+        positions = np.asarray([pos for _, pos in matches], dtype=np.int64)
+        return pd.DataFrame(
+            {
+                "name": self._names[positions],
+                "idx": self._ids[positions],
+                "jamo_score": [score for score, _ in matches],
+                "match_type": "자모 매칭",
+            }
+        )
+
+    def _rank_jamo_candidates(
+        self,
+        query_jamo: str,
+        positions: np.ndarray,
+        top_k: int,
+        jamo_threshold: float,
+        candidate_threshold: float,
+        n_jobs: int = 1,
+    ) -> tuple[Optional[tuple[float, int]], list[tuple[float, int]]]:
+        """
+        후보 행들의 자모 유사도로 최고 자모 매칭과 상위 top_k 후보 계산
+
+        후보가 JAMO_PARALLEL_MIN_CANDIDATES개 이상이고 n_jobs가 1보다 크면
+        후보를 나누어 프로세스 풀에서 계산한 뒤 병합합니다.
+
+        Returns:
+            (최고 자모 매칭 (점수, 행 위치) 또는 None, 상위 후보 [(점수, 행 위치)])
+        """
+        args = (top_k, jamo_threshold, candidate_threshold)
+        if n_jobs < 0:
+            n_jobs = os.cpu_count() or 1
+
+        if n_jobs <= 1 or len(positions) < JAMO_PARALLEL_MIN_CANDIDATES:
+            return _score_jamo_candidates(
+                query_jamo,
+                self._jamo_names[positions].tolist(),
+                positions.tolist(),
+                *args,
+            )
 
-        for d in self.diner_infos:
-            is_jamo, score = self._jamo_similarity(
-                norm_query, self._normalize(d["name"]), threshold=jamo_threshold
+        pool = _get_process_pool()
+        futures = [
+            pool.submit(
+                _score_jamo_candidates,
+                query_jamo,
+                self._jamo_names[chunk].tolist(),
+                chunk.tolist(),
+                *args,
             )
+            for chunk in np.array_split(positions, n_jobs)
+        ]
+        results = [future.result() for future in futures]
 
-            if is_jamo:
-                # 정확한 자모 매칭 발견
-                exact_jamo_match = {
-                    "name": d["name"],
-                    "idx": d["idx"],
-                    "jamo_score": score,
-                    "match_type": "자모 매칭",
-                }
-                break
-            elif score > jamo_candidate_threshold:
-                # 후보 자모 매칭 추가 (top_k개만 유지)
-                jamo_candidates.append(
-                    {
-                        "name": d["name"],
-                        "idx": d["idx"],
-                        "jamo_score": score,
-                        "match_type": "자모 매칭",
-                    }
-                )
-                # 점수 순으로 정렬하고 top_k개만 유지
-                jamo_candidates.sort(key=lambda x: x["jamo_score"], reverse=True)
-                if len(jamo_candidates) > top_k:
-                    jamo_candidates = jamo_candidates[:top_k]
-
-        # 정확한 자모 매칭이 있으면 즉시 반환
-        if exact_jamo_match:
-            results = pd.DataFrame([exact_jamo_match])
-            return self._add_kakao_map_links(results)
+        # 동점이면 앞쪽 행 우선
+        bests = [best for best, _ in results if best is not None]
+        if bests:
+            return max(bests, key=lambda x: (x[0], -x[1])), []
+        candidates = [candidate for _, chunk in results for candidate in chunk]
+        candidates.sort(key=lambda x: (-x[0], x[1]))
+        return None, candidates[:top_k]
 
-        # 후보 자모 매칭이 있으면 반환
-        if jamo_candidates:
-            results = pd.DataFrame(jamo_candidates)
-            return self._add_kakao_map_links(results)
+    def _partial_match_positions(self, norm_query: str) -> np.ndarray:
+        """정규화된 이름에 쿼리가 포함된 행 위치 (오름차순)"""
+        return self._name_index.find(norm_query)
 
-        # 검색 결과 없음
-        return pd.DataFrame().assign(match_type="검색 결과 없음", jamo_score=0.0)
+    def _jamo_shortlist(self, query_jamo: str) -> np.ndarray:
+        """
+        자모 n-gram을 많이 공유하는 순으로 최대 JAMO_SHORTLIST_SIZE개 후보 행 위치 반환
+
+        반환 순서는 원래 행 순서(오름차순)이며, 쿼리가 n-gram보다 짧으면 전체 행을 반환합니다.
+        """
+        grams = ngram_keys(query_jamo, JAMO_NGRAM)
+        if not grams:
+            return np.arange(len(self._jamo_names))
+
+        postings = [self._jamo_postings[g] for g in grams if g in self._jamo_postings]
+        if not postings:
+            return np.empty(0, dtype=np.int32)
+
+        shared = np.bincount(np.concatenate(postings), minlength=len(self._jamo_names))
+        candidates = np.flatnonzero(shared)
+        if len(candidates) > JAMO_SHORTLIST_SIZE:
+            top = np.argpartition(-shared[candidates], JAMO_SHORTLIST_SIZE)
+            candidates = np.sort(candidates[top[:JAMO_SHORTLIST_SIZE]])
+        return candidates
 
     def _normalize(self, text: str) -> str:
         """
@@ -144,6 +507,18 @@ class DinerSearchEngine:
         """
         return re.sub(r"[^가-힣a-zA-Z0-9]", "", text.lower().strip())
 
+    def _to_jamo(self, text: str) -> str:
+        """
+        텍스트를 자모 문자열로 변환합니다.
+
+        Args:
+            text: 변환할 텍스트
+
+        Returns:
+            자모 문자열
+        """
+        return text.translate(_JAMO_TABLE)
+
     def _jamo_similarity(
         self, a: str, b: str, threshold: float = 0.9
     ) -> tuple[bool, float]:
@@ -158,8 +533,24 @@ class DinerSearchEngine:
         Returns:
             (자모 매칭 여부, 유사도 점수)
         """
-        a_jamo = " ".join(hangul_to_jamo(a))
-        b_jamo = " ".join(hangul_to_jamo(b))
+        return self._jamo_score(self._to_jamo(a), self._to_jamo(b), threshold)
+
+    def _jamo_score(
+        self, a_jamo: str, b_jamo: str, threshold: float = 0.9
+    ) -> tuple[bool, float]:
+        """
+        미리 변환된 두 자모 문자열의 유사도를 계산합니다.
+
+        Args:
+            a_jamo: 첫 번째 자모 문자열
+            b_jamo: 두 번째 자모 문자열
+            threshold: 자모 유사도 임계값 (0.0 ~ 1.0)
+
+        Returns:
+            (자모 매칭 여부, 유사도 점수)
+        """
+        a_jamo = " ".join(a_jamo)
+        b_jamo = " ".join(b_jamo)
         score = fuzz.ratio(a_jamo, b_jamo) / 100.0  # 0-100을 0-1로 변환
 
         if score > threshold:
@@ -175,10 +566,13 @@ class DinerSearchEngine:
 
         # 카카오맵 링크 컬럼 추가
         df = df.copy()
-        # name 컬럼을 카카오맵 링크로 변환
-        df["name_link"] = df.apply(
-            lambda row: f"[{row['name']}](https://place.map.kakao.com/{row['idx']})",
-            axis=1,
+        # name 컬럼을 카카오맵 링크로 변환 (문자열 컬럼 연산으로 한 번에 생성)
+        df["name_link"] = (
+            "["
+            + df["name"].astype(str)
+            + "](https://place.map.kakao.com/"
+            + df["idx"].astype(str)
+            + ")"
         )
 
         return df
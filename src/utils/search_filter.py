@@ -1,24 +1,124 @@
 # src/utils/search_filter.py
 """검색 필터링 로직 (API 기반)"""
 
-import asyncio
-from typing import Optional
+from typing import Any, Optional
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
-from utils.api_client import get_yamyam_ops_client
+from utils.api import APIRequester
+from utils.api_client import YamYamOpsClient, get_yamyam_ops_client
+from utils.async_runner import get_async_runner
+from utils.profiler import profiled
+
+
+def filter_by_radius(
+    diner_ids: list[str],
+    diner_idxs: list[int],
+    distance_by_id: dict[str, float],
+    radius_km: float,
+) -> tuple[list[str], list[int], dict[str, float], dict[int, float]]:
+    """
+    넓은 반경으로 받아 둔 필터 결과를 사용자가 선택한 반경으로 다시 거르기 (클라이언트 측)
+
+    Args:
+        diner_ids: 음식점 ID 리스트 (ULID, 거리순)
+        diner_idxs: diner_ids와 같은 순서의 diner_idx 리스트
+        distance_by_id: {음식점 ID: 거리(km)}
+        radius_km: 사용자가 선택한 반경 (km)
+
+    Returns:
+        (음식점 ID 리스트, diner_idx 리스트, {ID: 거리}, {diner_idx: 거리})
+    """
+    ids, idxs, distance_id, distance_idx = [], [], {}, {}
+    for diner_id, diner_idx in zip(diner_ids, diner_idxs):
+        distance = distance_by_id.get(diner_id, float("inf"))
+        if distance <= radius_km:
+            ids.append(diner_id)
+            idxs.append(diner_idx)
+            distance_id[diner_id] = distance
+            distance_idx[diner_idx] = distance
+    return ids, idxs, distance_id, distance_idx
+
+
+@profiled("search_filter.request_personal_ranking")
+def request_personal_ranking(
+    api_url: str, diner_idxs: list[int], firebase_uid: str
+) -> dict[str, Any]:
+    """
+    개인화 추천 API(/rec/personal) 호출
+
+    Returns:
+        {"diner_ids": 개인화 순서의 diner_idx 리스트, "scores": 점수 리스트}
+    """
+    api = APIRequester(endpoint=api_url)
+    return api.post(
+        "/rec/personal",
+        data={"diner_ids": diner_idxs, "firebase_uid": firebase_uid},
+    ).json()
+
+
+def apply_personal_ranking(
+    df_results: pd.DataFrame,
+    ranking: dict[str, Any],
+    distance_by_id: Optional[dict[str, float]] = None,
+) -> pd.DataFrame:
+    """
+    개인화 추천 순서로 음식점 DataFrame 재정렬
+
+    응답에 없는 음식점(학습 데이터에 없는 cold-start 음식점)은 원래 순서대로 뒤에 붙이고
+    점수는 결측값(NaN)으로 채웁니다.
+
+    Args:
+        df_results: diner_idx 컬럼이 있는 음식점 DataFrame
+        ranking: request_personal_ranking 응답
+        distance_by_id: {음식점 ID: 거리} (지정 시 distance 컬럼 추가)
+
+    Returns:
+        재정렬된 DataFrame (personalized_score 컬럼 포함)
+    """
+    diner_idx_list = df_results["diner_idx"].tolist()
+    personalized_ids = ranking["diner_ids"]
+    personalized_scores = ranking["scores"]
+
+    if len(personalized_ids) < len(diner_idx_list):
+        # 응답에 없는 음식점은 cold-start 음식점으로 원래 순서대로 뒤에 추가
+        personalized = set(personalized_ids)
+        remaining_ids = [idx for idx in diner_idx_list if idx not in personalized]
+        final_ids = personalized_ids + remaining_ids
+        scores = personalized_scores + [np.nan] * len(remaining_ids)
+    else:
+        final_ids = list(personalized_ids)
+        scores = list(personalized_scores)
+
+    df_results = df_results.set_index("diner_idx").reindex(final_ids).reset_index()
+    df_results["personalized_score"] = scores
+    if distance_by_id is not None:
+        df_results["distance"] = df_results["id"].map(distance_by_id)
+    return df_results
 
 
 class SearchFilter:
     """검색 필터링을 담당하는 클래스 (API 기반)"""
 
-    def __init__(self, df_diner: pd.DataFrame = None):
+    def __init__(
+        self,
+        df_diner: pd.DataFrame = None,
+        client: Optional[YamYamOpsClient] = None,
+    ):
         """
         Args:
             df_diner: 레거시 호환성을 위한 파라미터 (사용하지 않음)
+            client: 사용할 API 클라이언트 (None이면 호출마다 세션 토큰으로 생성,
+                벤치마크처럼 세션 밖에서 실행할 때 지정)
         """
         self.df_diner = df_diner  # 레거시 호환성
+        self.client = client
+
+    def _get_client(self) -> Optional[YamYamOpsClient]:
+        """API 클라이언트 반환 (지정된 클라이언트 우선)"""
+        return self.client or get_yamyam_ops_client()
 
     def _map_sort_by(self, sort_by: str) -> str:
         """What2Eat 정렬 기준을 yamyam-ops API 형식으로 변환"""
@@ -48,6 +148,7 @@ class SearchFilter:
         ]
         return hash(tuple(key_parts))
 
+    @profiled("search_filter.get_filtered_restaurants")
     def get_filtered_restaurants(
         self,
         user_lat: float,
@@ -56,7 +157,12 @@ class SearchFilter:
         large_categories: Optional[list[str]] = None,
         middle_categories: Optional[list[str]] = None,
         limit: Optional[int] = None,
-    ) -> tuple[Optional[list[str]], Optional[list[int]], Optional[dict[str, float]]]:
+    ) -> tuple[
+        Optional[list[str]],
+        Optional[list[int]],
+        Optional[dict[str, float]],
+        Optional[dict[int, float]],
+    ]:
         """
         음식점 필터링 (지역/카테고리)
 
@@ -69,21 +175,20 @@ class SearchFilter:
             limit: 최대 결과 수
 
         Returns:
-            (음식점 ID 리스트, diner_idx 리스트, 거리 딕셔너리) 또는 (None, None, None)
+            (음식점 ID 리스트, diner_idx 리스트, 거리 딕셔너리, diner_idx별 거리 딕셔너리)
+            또는 (None, None, None, None)
             거리 딕셔너리: {id: distance} 형식
         """
         try:
             # API 클라이언트 가져오기
-            client = get_yamyam_ops_client()
+            client = self._get_client()
             if not client:
                 st.error("❌ API 클라이언트를 초기화할 수 없습니다.")
-                return None, None, None
+                return None, None, None, None
 
             # 비동기 API 호출을 동기적으로 실행
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
             diner_ids, diner_idx, distance_dict, distance_dict_idx = (
-                loop.run_until_complete(
+                get_async_runner().run(
                     client.get_filtered_restaurants(
                         user_lat=user_lat,
                         user_lon=user_lon,
@@ -94,14 +199,14 @@ class SearchFilter:
                     )
                 )
             )
-            loop.close()
 
             return diner_ids, diner_idx, distance_dict, distance_dict_idx
 
         except Exception as e:
             st.error(f"❌ 음식점 필터링 중 오류가 발생했습니다: {str(e)}")
-            return None, None, None
+            return None, None, None, None
 
+    @profiled("search_filter.sort_restaurants")
     def sort_restaurants(
         self,
         diner_ids: list[str],
@@ -129,7 +234,7 @@ class SearchFilter:
         """
         try:
             # API 클라이언트 가져오기
-            client = get_yamyam_ops_client()
+            client = self._get_client()
             if not client:
                 st.error("❌ API 클라이언트를 초기화할 수 없습니다.")
                 return None
@@ -138,9 +243,7 @@ class SearchFilter:
             api_sort_by = self._map_sort_by(sort_by)
 
             # 비동기 API 호출을 동기적으로 실행
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            restaurants = loop.run_until_complete(
+            restaurants = get_async_runner().run(
                 client.sort_restaurants(
                     diner_ids=diner_ids,
                     sort_by=api_sort_by,
@@ -149,7 +252,6 @@ class SearchFilter:
                     offset=offset,
                 )
             )
-            loop.close()
 
             if not restaurants:
                 return pd.DataFrame()
@@ -172,6 +274,7 @@ class SearchFilter:
             st.error(f"❌ 음식점 정렬 중 오류가 발생했습니다: {str(e)}")
             return None
 
+    @profiled("search_filter.apply_filters")
     def apply_filters(
         self,
         user_lat: float,
@@ -202,7 +305,7 @@ class SearchFilter:
         """
         try:
             # API 클라이언트 가져오기
-            client = get_yamyam_ops_client()
+            client = self._get_client()
             if not client:
                 st.error("❌ API 클라이언트를 초기화할 수 없습니다.")
                 return pd.DataFrame()
@@ -211,9 +314,7 @@ class SearchFilter:
             api_sort_by = self._map_sort_by(sort_by)
 
             # 비동기 API 호출을 동기적으로 실행
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            restaurants = loop.run_until_complete(
+            restaurants = get_async_runner().run(
                 client.get_restaurants(
                     user_lat=user_lat,
                     user_lon=user_lon,
@@ -224,7 +325,6 @@ class SearchFilter:
                     limit=limit,
                 )
             )
-            loop.close()
 
             if not restaurants:
                 return pd.DataFrame()
@@ -2,7 +2,7 @@
 
 import streamlit as st
 
-from utils.data_processing import pick_random_diners, search_menu
+from utils.data_processing import pick_random_diners, search_menu_mask
 
 
 class SearchManager:
@@ -13,7 +13,7 @@ class SearchManager:
 
     def search_by_menu(self, menu_search, filtered_df):
         return filtered_df[
-            filtered_df.apply(lambda row: search_menu(row, menu_search), axis=1)
+            search_menu_mask(filtered_df, menu_search, source_df=self.df)
         ]
 
     def get_random_recommendations(self, filtered_df, num_to_select=5):
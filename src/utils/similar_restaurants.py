@@ -1,19 +1,30 @@
 # utils/similar_restaurants.py
 
+import asyncio
 from typing import Any, Optional
 
 import pandas as pd
-import requests
 import streamlit as st
 
-from utils.data_processing import haversine
+from config.constants import SIMILAR_FETCH_CONCURRENCY, SIMILAR_FETCH_DEADLINE
+from utils.api_client import YamYamOpsClient
+from utils.async_runner import get_async_runner
+from utils.distance import haversine_np
+from utils.http_pool import get_http_pool
 
 
 class SimilarRestaurantFetcher:
     """유사 식당 조회를 위한 공유 클래스"""
 
-    def __init__(self, api_url: Optional[str] = None):
+    def __init__(
+        self,
+        api_url: Optional[str] = None,
+        max_concurrency: int = SIMILAR_FETCH_CONCURRENCY,
+        deadline: float = SIMILAR_FETCH_DEADLINE,
+    ):
         self.api_url = api_url or st.secrets.get("API_URL", "")
+        self.max_concurrency = max_concurrency
+        self.deadline = deadline
 
     def get_similar_restaurants(
         self,
@@ -53,44 +64,76 @@ class SimilarRestaurantFetcher:
             return []
 
         try:
-            # Redis에서 유사 식당 ID 리스트 가져오기
-            key = f"diner:{diner_idx}:similar_diner_ids"
-            response = requests.post(
-                self.api_url + "/redis/read", json={"keys": [key]}, timeout=3
+            return get_async_runner().run(
+                self._get_from_api_async(diner_idx, user_lat, user_lon, limit),
+                timeout=self.deadline + 1,
             )
-            if response.status_code != 200:
-                return []
-
-            similar_ids = response.json().get("data", {}).get(key, [])
-            if not similar_ids or not isinstance(similar_ids, list):
-                return []
-            # 각 ID에 대해 상세 정보 가져오기
-            restaurants = []
-            for kakao_place_id in similar_ids[:limit]:
-                restaurant_info = self._fetch_restaurant_from_api(
-                    kakao_place_id, user_lat, user_lon
-                )
-                if restaurant_info:
-                    restaurants.append(restaurant_info)
-            return restaurants
-
         except Exception as e:
             print(f"API 조회 실패: {e}")
             return []
 
+    async def _get_from_api_async(
+        self,
+        diner_idx: int,
+        user_lat: Optional[float],
+        user_lon: Optional[float],
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        """
+        유사 식당 ID 조회 후 상세 정보를 동시에 가져오기
+
+        전체 마감 시간(self.deadline) 안에 도착한 결과만 similar_ids 순서대로 반환하고,
+        마감 시간을 넘긴 요청은 취소합니다. (YamYamOpsClient.get_restaurants_by_idx 사용)
+        """
+        loop = asyncio.get_running_loop()
+        deadline_at = loop.time() + self.deadline
+        pool = get_http_pool()
+
+        # Redis에서 유사 식당 ID 리스트 가져오기
+        key = f"diner:{diner_idx}:similar_diner_ids"
+        response = await pool.request(
+            "POST",
+            self.api_url + "/redis/read",
+            json={"keys": [key]},
+            timeout=self.deadline,
+        )
+        if response.status_code != 200:
+            return []
+
+        similar_ids = response.json().get("data", {}).get(key, [])
+        if not similar_ids or not isinstance(similar_ids, list):
+            return []
+
+        remaining = deadline_at - loop.time()
+        if remaining <= 0:
+            return []
+
+        # 각 ID의 상세 정보를 동시 요청 수를 제한하여 병렬로 가져오기
+        client = YamYamOpsClient(self.api_url, timeout=self.deadline)
+        diners = await client.get_restaurants_by_idx(
+            similar_ids[:limit],
+            max_concurrency=self.max_concurrency,
+            timeout=remaining,
+        )
+        return [
+            self._convert_api_response_to_dict(diner, user_lat, user_lon)
+            for diner in diners
+        ]
+
     def _fetch_restaurant_from_api(
         self,
         kakao_place_id: str,
         user_lat: Optional[float] = None,
         user_lon: Optional[float] = None,
     ) -> Optional[dict[str, Any]]:
-        """API로부터 개별 식당 정보 가져오기"""
+        """API로부터 개별 식당 정보 가져오기 (공유 캐시 사용)"""
         try:
-            url = f"{self.api_url}/kakao/diners/{kakao_place_id}"
-            response = requests.get(url, timeout=3)
-            if response.status_code == 200:
-                api_data = response.json()
-                return self._convert_api_response_to_dict(api_data, user_lat, user_lon)
+            client = YamYamOpsClient(self.api_url, timeout=self.deadline)
+            diners = get_async_runner().run(
+                client.get_restaurants_by_idx([kakao_place_id])
+            )
+            if diners:
+                return self._convert_api_response_to_dict(diners[0], user_lat, user_lon)
 
             return None
 
@@ -125,7 +168,7 @@ class SimilarRestaurantFetcher:
             if diner_lat and diner_lon:
                 try:
                     distance = round(
-                        haversine(user_lat, user_lon, diner_lat, diner_lon), 1
+                        haversine_np(user_lat, user_lon, diner_lat, diner_lon), 1
                     )
                 except Exception:
                     distance = 0.0
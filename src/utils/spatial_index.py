@@ -0,0 +1,236 @@
+# src/utils/spatial_index.py
+"""음식점 좌표 기반 공간 인덱스 (격자 방식)"""
+
+import logging
+import math
+from typing import Optional, Union
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.dataset_version import get_dataset_version
+from utils.distance import haversine_np
+from utils.index_delta import (
+    apply_posting_delta,
+    group_positions,
+    remember_index,
+    take_prepared_index,
+)
+
+logger = logging.getLogger(__name__)
+
+# 위도 1도당 거리 (km)
+KM_PER_DEG_LAT = 111.195
+
+# 정렬용 셀 키 계산 보폭 (경도 셀 인덱스의 범위보다 충분히 커야 함)
+_KEY_STRIDE = 1 << 24
+
+
+def _cell_keys(lat_cells: np.ndarray, lon_cells: np.ndarray) -> np.ndarray:
+    """위도/경도 셀 인덱스를 정렬 가능한 하나의 정수 키로 변환"""
+    return lat_cells * _KEY_STRIDE + lon_cells
+
+
+class GridSpatialIndex:
+    """
+    위도/경도를 일정 크기의 격자로 나누어 셀별 행 위치를 저장하는 공간 인덱스
+
+    반경 질의 시 반경을 덮는 셀들의 후보만 거리 계산하므로
+    전체 행 수가 아니라 결과(주변 셀) 크기에 비례하는 시간이 걸립니다.
+    """
+
+    def __init__(self, lats, lons, cell_km: float = 1.0):
+        """
+        Args:
+            lats: 위도 배열 (DataFrame 행 순서와 동일)
+            lons: 경도 배열 (DataFrame 행 순서와 동일)
+            cell_km: 격자 셀 크기 (km)
+        """
+        self.lats = np.asarray(lats, dtype=np.float64)
+        self.lons = np.asarray(lons, dtype=np.float64)
+        self.cell_km = cell_km
+        self.cell_deg = cell_km / KM_PER_DEG_LAT
+        self.cells: dict[tuple[int, int], np.ndarray] = {}
+        self._build()
+
+    def __len__(self) -> int:
+        return len(self.lats)
+
+    def _build(self):
+        """셀 키 → 행 위치 배열 딕셔너리 생성"""
+        valid = np.isfinite(self.lats) & np.isfinite(self.lons)
+        positions = np.flatnonzero(valid)
+        if len(positions) == 0:
+            self.cells = {}
+            return
+
+        lat_cells = np.floor(self.lats[positions] / self.cell_deg).astype(np.int64)
+        lon_cells = np.floor(self.lons[positions] / self.cell_deg).astype(np.int64)
+        order = np.argsort(_cell_keys(lat_cells, lon_cells), kind="stable")
+        sorted_keys = _cell_keys(lat_cells[order], lon_cells[order])
+        _, starts = np.unique(sorted_keys, return_index=True)
+        groups = np.split(positions[order], starts[1:])
+        cell_ids = zip(
+            lat_cells[order][starts].tolist(), lon_cells[order][starts].tolist()
+        )
+        self.cells = dict(zip(cell_ids, groups))
+
+        logger.info(
+            f"공간 인덱스 생성 완료: {len(positions)}개 좌표, {len(self.cells)}개 셀"
+        )
+
+    def _cell_ids(self, lats: np.ndarray, lons: np.ndarray, positions: np.ndarray):
+        """행 위치들의 (위도 셀, 경도 셀) 목록 (좌표가 없는 행 제외)"""
+        valid = np.isfinite(lats[positions]) & np.isfinite(lons[positions])
+        positions = positions[valid]
+        lat_cells = np.floor(lats[positions] / self.cell_deg).astype(np.int64)
+        lon_cells = np.floor(lons[positions] / self.cell_deg).astype(np.int64)
+        return list(zip(lat_cells.tolist(), lon_cells.tolist())), positions
+
+    def apply_delta(self, lats, lons, delta) -> "GridSpatialIndex":
+        """
+        행 변경을 반영한 새 공간 인덱스 생성 (영향 받은 셀만 다시 계산)
+
+        Args:
+            lats: 변경 후 위도 배열 (새 DataFrame 행 순서)
+            lons: 변경 후 경도 배열 (새 DataFrame 행 순서)
+            delta: DinerStore.apply_delta가 반환한 행 위치 변경 정보
+
+        Returns:
+            GridSpatialIndex 인스턴스
+        """
+        index = GridSpatialIndex.__new__(GridSpatialIndex)
+        index.lats = np.asarray(lats, dtype=np.float64)
+        index.lons = np.asarray(lons, dtype=np.float64)
+        index.cell_km = self.cell_km
+        index.cell_deg = self.cell_deg
+
+        stale_cells, _ = self._cell_ids(self.lats, self.lons, delta.stale_old)
+        added_cells, added_positions = self._cell_ids(
+            index.lats, index.lons, delta.changed
+        )
+        added = group_positions(added_cells, added_positions, dtype=np.int64)
+        index.cells = apply_posting_delta(self.cells, delta, stale_cells, added)
+
+        logger.info(
+            f"공간 인덱스 증분 갱신: {len(set(stale_cells) | set(added))}개 셀 재계산"
+        )
+        return index
+
+    def _candidate_positions(self, lat: float, lon: float, radius_km: float):
+        """반경을 덮는 셀들에 속한 행 위치 후보"""
+        dlat = radius_km / KM_PER_DEG_LAT
+        cos_lat = max(math.cos(math.radians(lat)), 1e-6)
+        dlon = min(radius_km / (KM_PER_DEG_LAT * cos_lat), 180.0)
+
+        lat_lo = math.floor((lat - dlat) / self.cell_deg)
+        lat_hi = math.floor((lat + dlat) / self.cell_deg)
+        lon_lo = math.floor((lon - dlon) / self.cell_deg)
+        lon_hi = math.floor((lon + dlon) / self.cell_deg)
+
+        n_cells = (lat_hi - lat_lo + 1) * (lon_hi - lon_lo + 1)
+        if n_cells > len(self.cells):
+            # 질의 범위가 실제 셀 수보다 크면 존재하는 셀만 순회
+            groups = [
+                positions
+                for (lat_cell, lon_cell), positions in self.cells.items()
+                if lat_lo <= lat_cell <= lat_hi and lon_lo <= lon_cell <= lon_hi
+            ]
+        else:
+            groups = []
+            for lat_cell in range(lat_lo, lat_hi + 1):
+                for lon_cell in range(lon_lo, lon_hi + 1):
+                    positions = self.cells.get((lat_cell, lon_cell))
+                    if positions is not None:
+                        groups.append(positions)
+
+        if not groups:
+            return np.empty(0, dtype=np.int64)
+        return np.concatenate(groups)
+
+    def query_radius(
+        self,
+        lat: float,
+        lon: float,
+        radius_km: float,
+        return_distance: bool = False,
+        sort_by_distance: bool = False,
+    ) -> Union[np.ndarray, tuple[np.ndarray, np.ndarray]]:
+        """
+        반경 내 행 위치 조회
+
+        Args:
+            lat: 기준 위도
+            lon: 기준 경도
+            radius_km: 검색 반경 (km)
+            return_distance: True면 (행 위치, 거리) 튜플 반환
+            sort_by_distance: True면 거리순, False면 원본 행 순서로 정렬
+
+        Returns:
+            행 위치 배열 또는 (행 위치 배열, 거리 배열)
+        """
+        candidates = self._candidate_positions(lat, lon, radius_km)
+        if len(candidates) == 0:
+            empty = np.empty(0, dtype=np.int64)
+            return (empty, np.empty(0, dtype=np.float64)) if return_distance else empty
+
+        distances = np.atleast_1d(
+            haversine_np(lat, lon, self.lats[candidates], self.lons[candidates])
+        )
+        mask = distances <= radius_km
+        positions = candidates[mask]
+        distances = distances[mask]
+
+        order = np.argsort(distances if sort_by_distance else positions, kind="stable")
+        positions = positions[order]
+        distances = distances[order]
+
+        if return_distance:
+            return positions, distances
+        return positions
+
+
+def spatial_index_kind(cell_km: float = 1.0) -> str:
+    """인덱스 등록용 종류 이름 (셀 크기별로 구분)"""
+    return f"spatial:{cell_km}"
+
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def _load_spatial_index(
+    dataset_version: str, cell_km: float, _lats: np.ndarray, _lons: np.ndarray
+) -> GridSpatialIndex:
+    """데이터셋 버전별로 한 번만 인덱스를 생성하여 모든 세션이 공유"""
+    kind = spatial_index_kind(cell_km)
+    index = take_prepared_index(kind, dataset_version)
+    if index is None:
+        index = GridSpatialIndex(_lats, _lons, cell_km=cell_km)
+    remember_index(kind, dataset_version, index)
+    return index
+
+
+def get_spatial_index(
+    df: pd.DataFrame,
+    dataset_version: Optional[str] = None,
+    cell_km: float = 1.0,
+) -> GridSpatialIndex:
+    """
+    음식점 DataFrame에 대한 공유 공간 인덱스 반환
+
+    Args:
+        df: diner_lat, diner_lon 컬럼이 있는 DataFrame
+        dataset_version: 데이터셋 버전 (None이면 계산)
+        cell_km: 격자 셀 크기 (km)
+
+    Returns:
+        GridSpatialIndex 인스턴스
+    """
+    if dataset_version is None:
+        dataset_version = get_dataset_version(df)
+
+    return _load_spatial_index(
+        dataset_version,
+        cell_km,
+        df["diner_lat"].to_numpy(dtype=np.float64),
+        df["diner_lon"].to_numpy(dtype=np.float64),
+    )
@@ -0,0 +1,152 @@
+# src/utils/text_index.py
+"""문자 n-gram 역색인 유틸리티 (음식점 이름/메뉴 검색 공용)"""
+
+import numpy as np
+
+# 유니코드 코드 포인트 비트 수 (n-gram을 하나의 정수 키로 합칠 때 사용, n ≤ 3)
+CODE_BITS = 21
+
+
+def ngram_key(gram: str) -> int:
+    """문자 n-gram을 정수 키로 변환"""
+    key = 0
+    for ch in gram:
+        key = (key << CODE_BITS) | ord(ch)
+    return key
+
+
+def ngram_keys(text: str, n: int) -> set[int]:
+    """문자열의 n-gram 정수 키 집합 (text가 n보다 짧으면 빈 집합)"""
+    return {ngram_key(text[i : i + n]) for i in range(len(text) - n + 1)}
+
+
+def build_ngram_postings(texts, n: int) -> dict[int, np.ndarray]:
+    """
+    문자열 배열로 n-gram 키 → 행 위치 배열(오름차순) 역색인 생성
+
+    전체 문자열을 코드 포인트 배열 하나로 이어 붙여 n-gram 키와 행 번호를 한 번에 계산합니다.
+
+    Args:
+        texts: 문자열 배열
+        n: n-gram 길이 (1~3)
+
+    Returns:
+        {n-gram 키: 행 위치 배열} 딕셔너리
+    """
+    lengths = np.fromiter((len(t) for t in texts), dtype=np.int64, count=len(texts))
+    codes = np.frombuffer("".join(texts).encode("utf-32-le"), dtype=np.uint32)
+    n_grams = len(codes) - n + 1
+    if n_grams <= 0:
+        return {}
+
+    rows = np.repeat(np.arange(len(texts), dtype=np.int64), lengths)
+    keys = np.zeros(n_grams, dtype=np.int64)
+    for offset in range(n):
+        keys = (keys << CODE_BITS) | codes[offset : offset + n_grams]
+
+    # 행 경계를 넘는 n-gram 제외
+    valid = rows[:n_grams] == rows[n - 1 :]
+    keys, rows = keys[valid], rows[:n_grams][valid]
+
+    # (키, 행) 중복 제거 후 키별로 분할
+    order = np.lexsort((rows, keys))
+    keys, rows = keys[order], rows[order]
+    keep = np.ones(len(keys), dtype=bool)
+    keep[1:] = (keys[1:] != keys[:-1]) | (rows[1:] != rows[:-1])
+    keys, rows = keys[keep], rows[keep].astype(np.int32)
+
+    starts = np.flatnonzero(np.diff(keys)) + 1
+    unique_keys = keys[np.concatenate(([0], starts))]
+    return dict(zip(unique_keys.tolist(), np.split(rows, starts)))
+
+
+def _extend_postings(
+    postings: dict[int, np.ndarray], added: dict[int, np.ndarray], offset: int
+) -> dict[int, np.ndarray]:
+    """기존 역색인 뒤에 offset부터 시작하는 행들의 역색인을 이어 붙임"""
+    if not added:
+        return postings
+    result = dict(postings)
+    for key, rows in added.items():
+        rows = rows + np.int32(offset)
+        previous = result.get(key)
+        result[key] = rows if previous is None else np.concatenate([previous, rows])
+    return result
+
+
+class SubstringIndex:
+    """
+    문자/바이그램 역색인 기반 부분 문자열 검색
+
+    검색어의 바이그램(1글자 검색어는 문자) 역색인을 교집합하여 후보를 만들고
+    실제 포함 여부는 후보에 대해서만 확인합니다.
+    """
+
+    def __init__(self, texts):
+        """
+        Args:
+            texts: 검색 대상 문자열 배열
+        """
+        self.texts = np.asarray(texts, dtype=object)
+        self._char_postings = build_ngram_postings(self.texts, 1)
+        self._bigram_postings = build_ngram_postings(self.texts, 2)
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def extend(self, texts) -> "SubstringIndex":
+        """
+        문자열을 뒤에 추가한 새 인덱스 생성 (추가된 문자열의 n-gram만 계산)
+
+        Args:
+            texts: 추가할 문자열 배열
+
+        Returns:
+            SubstringIndex 인스턴스
+        """
+        texts = np.asarray(texts, dtype=object)
+        index = SubstringIndex.__new__(SubstringIndex)
+        index.texts = np.concatenate([self.texts, texts])
+        index._char_postings = _extend_postings(
+            self._char_postings, build_ngram_postings(texts, 1), len(self.texts)
+        )
+        index._bigram_postings = _extend_postings(
+            self._bigram_postings, build_ngram_postings(texts, 2), len(self.texts)
+        )
+        return index
+
+    def find(self, term: str) -> np.ndarray:
+        """
+        term을 포함하는 문자열의 위치 (오름차순)
+
+        Args:
+            term: 검색어
+
+        Returns:
+            행 위치 배열
+        """
+        if not term:
+            return np.arange(len(self.texts), dtype=np.int32)
+
+        if len(term) == 1:
+            return self._char_postings.get(ngram_key(term), np.empty(0, dtype=np.int32))
+
+        postings = []
+        for bigram in ngram_keys(term, 2):
+            rows = self._bigram_postings.get(bigram)
+            if rows is None:
+                return np.empty(0, dtype=np.int32)
+            postings.append(rows)
+
+        postings.sort(key=len)
+        candidates = postings[0]
+        for rows in postings[1:]:
+            candidates = np.intersect1d(candidates, rows, assume_unique=True)
+            if len(candidates) == 0:
+                return candidates
+
+        if len(term) == 2:
+            return candidates
+        return np.asarray(
+            [pos for pos in candidates if term in self.texts[pos]], dtype=np.int32
+        )
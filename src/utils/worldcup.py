@@ -9,6 +9,9 @@ import google.generativeai as genai
 import requests
 import streamlit as st
 
+from utils.api_client import YamYamOpsClient
+from utils.async_runner import get_async_runner
+
 
 def analyze_user_preference(selected_diners: list[dict[str, Any]]) -> str:
     """LLM(Gemini)로 유저 맛집 취향 분석"""
@@ -98,18 +101,18 @@ class WorldCupManager:
         return []
 
     def get_diner_by_idx(self, diner_idx: int) -> Optional[dict[str, Any]]:
-        """diner_idx로 특정 식당 정보 가져오기"""
-        try:
-            response = requests.get(
-                f"{self.api_url}/kakao/diners/{diner_idx}", timeout=5
-            )
+        """diner_idx로 특정 식당 정보 가져오기 (공유 캐시 사용)"""
+        diners = self.get_diners_by_idx([diner_idx])
+        return diners[0] if diners else None
 
-            if response.status_code == 200:
-                return response.json()
+    def get_diners_by_idx(self, diner_idxs: list[int]) -> list[dict[str, Any]]:
+        """여러 식당 정보를 한 번에 가져오기 (입력 순서 유지)"""
+        try:
+            client = YamYamOpsClient(self.api_url)
+            return get_async_runner().run(client.get_restaurants_by_idx(diner_idxs))
         except Exception as e:
-            print(f"식당 정보 조회 실패 (diner_idx: {diner_idx}): {e}")
-
-        return None
+            print(f"식당 정보 일괄 조회 실패: {e}")
+            return []
 
     def get_similar_restaurants(self, diner_idx: int) -> list[int]:
         """Redis에서 유사 식당 ID 리스트 가져오기"""
@@ -150,15 +153,21 @@ class WorldCupManager:
         needed = size - 1  # 선택한 식당 제외 필요 개수
 
         if similar_ids:
-            existing_ids = {selected_diner["diner_idx"]}
-            for sim_id in similar_ids:
-                if len(similar_restaurants) >= needed:
+            candidate_ids = [
+                sim_id
+                for sim_id in dict.fromkeys(similar_ids)
+                if sim_id != selected_diner["diner_idx"]
+            ]
+            # 필요한 수만큼 일괄 조회하고, 일부 조회에 실패하면 부족한 만큼만 다음 ID로 조회
+            # (한 건도 조회되지 않으면 API 장애로 보고 랜덤 식당으로 채움)
+            start = 0
+            while len(similar_restaurants) < needed and start < len(candidate_ids):
+                batch = candidate_ids[start : start + needed - len(similar_restaurants)]
+                start += len(batch)
+                fetched = self.get_diners_by_idx(batch)
+                if not fetched:
                     break
-                if sim_id not in existing_ids:
-                    diner = self.get_diner_by_idx(sim_id)
-                    if diner:
-                        similar_restaurants.append(diner)
-                        existing_ids.add(sim_id)
+                similar_restaurants.extend(fetched)
 
         # 4단계: 부족하면 추가 랜덤 식당으로 채우기
         if len(similar_restaurants) < needed: